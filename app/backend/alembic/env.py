@@ -4,13 +4,14 @@ from os.path import abspath, dirname, join
 
 import alembic_postgresql_enum  # noqa: F401
 from alembic import context
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import engine_from_config, pool, text
 
 # Get the path to the root directory (where src lives)
 # and append the 'src' folder to sys.path
 sys.path.insert(0, abspath(join(dirname(__file__), "../src")))
 
 from project.core.config import settings
+from project.core.tenancy import tenant_schema
 from project.models.base.base_model import Base
 
 # this is the Alembic Config object, which provides
@@ -36,6 +37,11 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+# `alembic -x tenant=<slug> upgrade head` migrates one school's schema,
+# see migrate_tenants.py; without it the public schema is migrated
+tenant = context.get_x_argument(as_dictionary=True).get("tenant")
+schema = tenant_schema(tenant) if tenant else None
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -60,9 +66,12 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        version_table_schema=schema,
     )
 
     with context.begin_transaction():
+        if schema:
+            context.execute(f'SET search_path TO "{schema}", public')
         context.run_migrations()
 
 
@@ -80,7 +89,18 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        if schema:
+            # Tables and enum types land in the first schema on the path;
+            # extensions stay shared in public
+            connection.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{schema}"'))
+            connection.execute(text(f'SET search_path TO "{schema}", public'))
+            connection.commit()
+
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            version_table_schema=schema,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,38 @@
+"""add_grade_ordinal
+
+Revision ID: 3b8e41c7d2a9
+Revises: 06299fedaf34
+Create Date: 2026-10-19 09:12:40.118305
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b8e41c7d2a9"
+down_revision: Union[str, Sequence[str], None] = "06299fedaf34"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("grades", sa.Column("ordinal", sa.SmallInteger(), nullable=True))
+    # GradeEnum values are the grade numbers themselves ("1".."12")
+    op.execute("UPDATE grades SET ordinal = CAST(CAST(grade AS TEXT) AS SMALLINT)")
+    op.alter_column("grades", "ordinal", nullable=False)
+    op.create_index(
+        "ix_grades_year_id_ordinal",
+        "grades",
+        ["year_id", "ordinal"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_grades_year_id_ordinal", table_name="grades")
+    op.drop_column("grades", "ordinal")
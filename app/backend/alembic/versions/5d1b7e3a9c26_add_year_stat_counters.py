@@ -0,0 +1,75 @@
+"""add_year_stat_counters
+
+Revision ID: 5d1b7e3a9c26
+Revises: c4e9a2d7f513
+Create Date: 2026-10-19 16:08:12.904417
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d1b7e3a9c26"
+down_revision: Union[str, Sequence[str], None] = "c4e9a2d7f513"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Counts every existing year, see rebuild_year_stats for the same in the ORM
+BACKFILL = """
+INSERT INTO year_stat_counters (year_id, dimension, key, count)
+SELECT year_id, dimension, key, count(*)
+FROM (
+    SELECT g.year_id, 'grade' AS dimension, CAST(g.id AS VARCHAR) AS key
+    FROM students s JOIN grades g ON g.id = s.registered_for_grade_id
+    UNION ALL
+    SELECT g.year_id, 'gender', CAST(s.gender AS VARCHAR)
+    FROM students s JOIN grades g ON g.id = s.registered_for_grade_id
+    UNION ALL
+    SELECT g.year_id, 'status', CAST(s.status AS VARCHAR)
+    FROM students s JOIN grades g ON g.id = s.registered_for_grade_id
+    UNION ALL
+    SELECT g.year_id, 'section', CAST(l.section_id AS VARCHAR)
+    FROM student_section_links l
+    JOIN sections x ON x.id = l.section_id
+    JOIN grades g ON g.id = x.grade_id
+    UNION ALL
+    SELECT g.year_id, 'stream', CAST(l.stream_id AS VARCHAR)
+    FROM student_stream_links l
+    JOIN streams x ON x.id = l.stream_id
+    JOIN grades g ON g.id = x.grade_id
+    UNION ALL
+    SELECT l.year_id, 'teacher_status', CAST(e.status AS VARCHAR)
+    FROM employee_year_links l JOIN employees e ON e.id = l.employee_id
+    WHERE e.position = 'teaching staff'
+) AS buckets
+GROUP BY year_id, dimension, key
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "year_stat_counters",
+        sa.Column("year_id", sa.UUID(), nullable=False),
+        sa.Column("dimension", sa.String(length=20), nullable=False),
+        sa.Column("key", sa.String(length=64), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["year_id"],
+            ["years.id"],
+            name=op.f("fk_year_stat_counters_year_id_years"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "year_id", "dimension", "key", name=op.f("pk_year_stat_counters")
+        ),
+    )
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("year_stat_counters")
@@ -0,0 +1,133 @@
+"""add_results_table_indexes
+
+Revision ID: 8f2c6a1e4b70
+Revises: 3b8e41c7d2a9
+Create Date: 2026-10-19 10:03:11.492017
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8f2c6a1e4b70"
+down_revision: Union[str, Sequence[str], None] = "3b8e41c7d2a9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns)
+INDEXES: list[tuple[str, str, list[str]]] = [
+    (
+        "ix_mark_lists_student_term_record_id_subject_id",
+        "mark_lists",
+        ["student_term_record_id", "subject_id"],
+    ),
+    ("ix_mark_lists_student_id", "mark_lists", ["student_id"]),
+    ("ix_mark_lists_subject_id", "mark_lists", ["subject_id"]),
+    (
+        "ix_student_term_records_academic_term_id_section_id",
+        "student_term_records",
+        ["academic_term_id", "section_id"],
+    ),
+    (
+        "ix_student_term_records_student_id_academic_term_id",
+        "student_term_records",
+        ["student_id", "academic_term_id"],
+    ),
+    ("ix_student_term_records_grade_id", "student_term_records", ["grade_id"]),
+    (
+        "ix_assessments_student_term_record_id",
+        "assessments",
+        ["student_term_record_id"],
+    ),
+    ("ix_assessments_student_id", "assessments", ["student_id"]),
+    ("ix_assessments_yearly_subject_id", "assessments", ["yearly_subject_id"]),
+    (
+        "ix_subject_yearly_averages_student_year_record_id",
+        "subject_yearly_averages",
+        ["student_year_record_id"],
+    ),
+    (
+        "ix_subject_yearly_averages_student_id",
+        "subject_yearly_averages",
+        ["student_id"],
+    ),
+    (
+        "ix_subject_yearly_averages_yearly_subject_id",
+        "subject_yearly_averages",
+        ["yearly_subject_id"],
+    ),
+    (
+        "ix_student_year_records_year_id_grade_id",
+        "student_year_records",
+        ["year_id", "grade_id"],
+    ),
+    ("ix_student_year_records_student_id", "student_year_records", ["student_id"]),
+    (
+        "ix_teacher_records_academic_term_id",
+        "teacher_records",
+        ["academic_term_id"],
+    ),
+    (
+        "ix_teacher_records_grade_stream_subject_id",
+        "teacher_records",
+        ["grade_stream_subject_id"],
+    ),
+    # Link tables are keyed (student_id, other_id); these cover the reverse side
+    (
+        "ix_student_section_links_section_id",
+        "student_section_links",
+        ["section_id"],
+    ),
+    ("ix_student_grade_links_grade_id", "student_grade_links", ["grade_id"]),
+    ("ix_student_stream_links_stream_id", "student_stream_links", ["stream_id"]),
+    (
+        "ix_student_subject_links_subject_id",
+        "student_subject_links",
+        ["subject_id"],
+    ),
+    ("ix_student_year_links_year_id", "student_year_links", ["year_id"]),
+    (
+        "ix_student_academic_term_links_academic_term_id",
+        "student_academic_term_links",
+        ["academic_term_id"],
+    ),
+    (
+        "ix_parent_student_links_student_id",
+        "parent_student_links",
+        ["student_id"],
+    ),
+    (
+        "ix_students_registered_for_grade_id",
+        "students",
+        ["registered_for_grade_id"],
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,47 @@
+"""add_event_date_range_index
+
+Revision ID: a7e3c91f0d48
+Revises: 5d1b7e3a9c26
+Create Date: 2026-10-19 17:41:05.127733
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7e3c91f0d48"
+down_revision: Union[str, Sequence[str], None] = "5d1b7e3a9c26"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Lets the GiST index hold year_id next to the date range
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_events_year_id_dates",
+            "events",
+            ["year_id", sa.text("daterange(start_date, end_date, '[]')")],
+            unique=False,
+            postgresql_using="gist",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_events_year_id_dates",
+            table_name="events",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,94 @@
+"""add_list_filter_indexes
+
+Revision ID: c4e9a2d7f513
+Revises: 8f2c6a1e4b70
+Create Date: 2026-10-19 14:22:47.318204
+
+"""
+
+from typing import Any, Dict, Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e9a2d7f513"
+down_revision: Union[str, Sequence[str], None] = "8f2c6a1e4b70"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns)
+INDEXES: list[tuple[str, str, list[str]]] = [
+    ("ix_students_first_name", "students", ["first_name"]),
+    ("ix_students_father_name", "students", ["father_name"]),
+    ("ix_students_date_of_birth", "students", ["date_of_birth"]),
+    ("ix_students_gender", "students", ["gender"]),
+    ("ix_students_status", "students", ["status"]),
+    ("ix_students_created_at", "students", ["created_at"]),
+    ("ix_employees_first_name", "employees", ["first_name"]),
+    ("ix_employees_father_name", "employees", ["father_name"]),
+    ("ix_employees_gender", "employees", ["gender"]),
+    ("ix_employees_position", "employees", ["position"]),
+    ("ix_employees_status", "employees", ["status"]),
+    ("ix_employees_subject_id", "employees", ["subject_id"]),
+    ("ix_employees_created_at", "employees", ["created_at"]),
+]
+
+# (table, column) pairs searched with `contains`
+TRIGRAM_INDEXES: list[tuple[str, str]] = [
+    ("students", "first_name"),
+    ("students", "father_name"),
+    ("employees", "first_name"),
+    ("employees", "father_name"),
+]
+
+
+def _trigram(table: str, column: str) -> Dict[str, Any]:
+    return {
+        "index_name": f"ix_{table}_{column}_trgm",
+        "table_name": table,
+        "columns": [column],
+        "postgresql_using": "gin",
+        "postgresql_ops": {column: "gin_trgm_ops"},
+    }
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for table, column in TRIGRAM_INDEXES:
+            op.create_index(
+                **_trigram(table, column),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table, column in reversed(TRIGRAM_INDEXES):
+            op.drop_index(
+                f"ix_{table}_{column}_trgm",
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
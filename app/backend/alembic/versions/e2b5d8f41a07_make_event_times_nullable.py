@@ -0,0 +1,37 @@
+"""make_event_times_nullable
+
+Revision ID: e2b5d8f41a07
+Revises: a7e3c91f0d48
+Create Date: 2026-10-19 21:12:48.503617
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b5d8f41a07"
+down_revision: Union[str, Sequence[str], None] = "a7e3c91f0d48"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # All-day events have no times
+    op.alter_column("events", "start_time", existing_type=sa.DateTime(), nullable=True)
+    op.alter_column("events", "end_time", existing_type=sa.DateTime(), nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # All-day events span their days from midnight to midnight
+    op.execute(
+        "UPDATE events SET start_time = start_date,"
+        " end_time = end_date + interval '1 day'"
+        " WHERE start_time IS NULL OR end_time IS NULL"
+    )
+    op.alter_column("events", "end_time", existing_type=sa.DateTime(), nullable=False)
+    op.alter_column("events", "start_time", existing_type=sa.DateTime(), nullable=False)
@@ -0,0 +1,127 @@
+"""
+Migrate every school's schema to the latest revision, several at a time.
+
+    python migrate_tenants.py                  # all school_* schemas
+    python migrate_tenants.py --jobs 8 acme    # just these schools
+
+Each school runs as its own ``alembic -x tenant=<slug> upgrade head``, so
+one failing school does not stop the others; the exit code is non-zero if
+any of them failed. A school that migrated gets the first superuser, as
+the API only seeds ``public``.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from os.path import abspath, dirname, join
+from typing import List, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+sys.path.insert(0, abspath(join(dirname(__file__), "src")))
+
+from project.core.config import settings  # noqa: E402
+from project.core.db import init_db  # noqa: E402
+from project.core.tenancy import list_tenants, tenant_schema  # noqa: E402
+from project.models.base.base_model import POSTGRES_EXTENSIONS  # noqa: E402
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def prepare(tenants: Sequence[str]) -> List[str]:
+    """
+    Create the shared extensions in public, before any school's migration
+    would create them in its own schema, and list the schools to migrate.
+    """
+    engine = create_async_engine(str(settings.SQLALCHEMY_POSTGRES_DATABASE_URI))
+    try:
+        async with engine.begin() as conn:
+            for extension in POSTGRES_EXTENSIONS:
+                await conn.execute(
+                    text(f"CREATE EXTENSION IF NOT EXISTS {extension} SCHEMA public")
+                )
+            known = await conn.run_sync(list_tenants)
+    finally:
+        await engine.dispose()
+
+    for tenant in tenants:
+        # Fail early on a bad slug rather than in a subprocess
+        tenant_schema(tenant)
+    return sorted(tenants or known)
+
+
+async def migrate(tenant: str, limit: asyncio.Semaphore) -> bool:
+    async with limit:
+        logger.info("Migrating %s", tenant)
+        process = await asyncio.create_subprocess_exec(
+            "alembic",
+            "-x",
+            f"tenant={tenant}",
+            "upgrade",
+            "head",
+            cwd=dirname(abspath(__file__)),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        output, _ = await process.communicate()
+
+    if process.returncode != 0:
+        logger.error("Migrating %s failed:\n%s", tenant, output.decode())
+        return False
+    logger.info("Migrated %s", tenant)
+    return True
+
+
+async def seed(tenant: str, engine: AsyncEngine) -> bool:
+    """Create the school's first superuser, unless it has one already."""
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(
+                text(f'SET search_path TO "{tenant_schema(tenant)}", public')
+            )
+            async with AsyncSession(bind=conn, expire_on_commit=False) as session:
+                await init_db(session)
+            await conn.commit()
+    except Exception:
+        logger.exception("Seeding %s failed", tenant)
+        return False
+    return True
+
+
+async def upgrade(tenant: str, limit: asyncio.Semaphore, engine: AsyncEngine) -> bool:
+    return await migrate(tenant, limit) and await seed(tenant, engine)
+
+
+async def main(tenants: Sequence[str], jobs: int) -> int:
+    selected = await prepare(tenants)
+    limit = asyncio.Semaphore(jobs)
+    engine = create_async_engine(
+        str(settings.SQLALCHEMY_POSTGRES_DATABASE_URI),
+        # Connections switch schemas, so nothing is kept prepared
+        connect_args={"prepared_statement_cache_size": 0, "statement_cache_size": 0},
+    )
+    try:
+        results = await asyncio.gather(
+            *(upgrade(tenant, limit, engine) for tenant in selected)
+        )
+    finally:
+        await engine.dispose()
+
+    failed = [tenant for tenant, ok in zip(selected, results) if not ok]
+    logger.info("Migrated %d of %d schools", len(selected) - len(failed), len(selected))
+    if failed:
+        logger.error("Failed: %s", ", ".join(failed))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("tenants", nargs="*", help="schools to migrate")
+    parser.add_argument(
+        "--jobs", type=int, default=4, help="migrations run at the same time"
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.tenants, args.jobs)))
@@ -3,11 +3,19 @@ from fastapi import APIRouter
 from project.api.v1.routers.academic_term import route as academic_term_router
 from project.api.v1.routers.auth import route as auth_router
 from project.api.v1.routers.employee import route as employee_router
+from project.api.v1.routers.events import route as event_router
 from project.api.v1.routers.grades import route as grade_router
 from project.api.v1.routers.health import route as health_router
+from project.api.v1.routers.jobs import route as job_router
+from project.api.v1.routers.media import route as media_router
+from project.api.v1.routers.metrics import route as metrics_router
 from project.api.v1.routers.private import route as private_router
+from project.api.v1.routers.promotions import route as promotion_router
 from project.api.v1.routers.registrations import route as registration_router
+from project.api.v1.routers.report_cards import route as report_card_router
+from project.api.v1.routers.saved_views import route as saved_view_router
 from project.api.v1.routers.sections import route as section_router
+from project.api.v1.routers.statistics import route as statistics_router
 from project.api.v1.routers.streams import route as stream_router
 from project.api.v1.routers.students import route as student_router
 from project.api.v1.routers.subjects import route as subject_router
@@ -19,6 +27,7 @@ api_router = APIRouter()
 
 # Include each sub-router
 api_router.include_router(health_router.router)
+api_router.include_router(metrics_router.router)
 api_router.include_router(auth_router.router)
 api_router.include_router(registration_router.router)
 api_router.include_router(year_router.router)
@@ -31,3 +40,10 @@ api_router.include_router(student_router.router)
 api_router.include_router(employee_router.router)
 api_router.include_router(teachers_router.router)
 api_router.include_router(academic_term_router.router)
+api_router.include_router(report_card_router.router)
+api_router.include_router(media_router.router)
+api_router.include_router(saved_view_router.router)
+api_router.include_router(statistics_router.router)
+api_router.include_router(event_router.router)
+api_router.include_router(promotion_router.router)
+api_router.include_router(job_router.router)
@@ -28,10 +28,11 @@ from project.api.v1.routers.schema import HTTPError
 from project.core.config import settings
 from project.core.security import (
     ALGORITHM,
-    check_password,
+    check_password_async,
     create_access_token,
-    get_password_hash,
+    get_password_hash_async,
 )
+from project.core.tenancy import current_tenant
 from project.models import AuthIdentity
 from project.models.blacklist_token import BlacklistToken
 from project.models.user import User
@@ -79,7 +80,7 @@ async def login(
     if (
         not identity
         or not identity.password
-        or not check_password(form_data.password, identity.password)
+        or not await check_password_async(form_data.password, identity.password)
     ):
         logger.warning(f"Failed password attempt for user: {user.id}")
         raise HTTPException(
@@ -88,7 +89,9 @@ async def login(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    access_token = create_access_token(subject=str(user.id), role=user.role)
+    access_token = create_access_token(
+        subject=str(user.id), role=user.role, tenant=current_tenant()
+    )
     return LoginTokenResponse(access_token=access_token, token_type="bearer")
 
 
@@ -107,6 +110,7 @@ async def login_provider(
     provider: AuthProviderEnum,
     data: ProviderResponse,
     session: SessionDep,
+    redis: RedisDep,
 ) -> LoginTokenResponse:
     if data.credential is None:
         raise HTTPException(
@@ -117,7 +121,7 @@ async def login_provider(
     p = {
         provider.GOOGLE: get_google_user,
     }
-    user = await p[provider](session, data.credential)
+    user = await p[provider](session, data.credential, redis)
 
     if not user:
         raise HTTPException(
@@ -125,7 +129,9 @@ async def login_provider(
             detail="User not found",
         )
 
-    access_token = create_access_token(subject=str(user.id), role=user.role)
+    access_token = create_access_token(
+        subject=str(user.id), role=user.role, tenant=current_tenant()
+    )
 
     return LoginTokenResponse(access_token=access_token, token_type="bearer")
 
@@ -341,7 +347,7 @@ async def password_reset(
         )
 
     # Update the user's password
-    identity.password = get_password_hash(request.new_password)
+    identity.password = await get_password_hash_async(request.new_password)
     await session.commit()
 
     return MessageResponse(message="Password successfully reset")
@@ -1,20 +1,22 @@
+import hashlib
+import secrets
 from datetime import datetime, timedelta, timezone
 from typing import List
 
-import pyotp
+import jwt
 from fastapi import HTTPException, status
-from fastapi_mail import FastMail, MessageSchema, MessageType
-from google.auth.transport import requests
-from google.oauth2 import id_token
 from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
 from pydantic import BaseModel, EmailStr, NameEmail
 from redis.asyncio import Redis
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from project.core.config import EmailConf, settings
+from project.core.config import settings
+from project.core.redis import get_redis_client
+from project.core.tenancy import tenant_key
 from project.models import AuthIdentity, User
 from project.utils.enum import AuthProviderEnum
+from project.workers.mail import enqueue_mail
 
 serializer = URLSafeTimedSerializer(settings.SECRET_KEY.get_secret_value())
 
@@ -43,45 +45,53 @@ def verify_email_verification_token(token: str, max_age: int = 60 * 60 * 24):
         return None
 
 
-async def send_verification_email(email_to: NameEmail) -> None:
-    """Send an email verification link to the user's email address."""
+async def send_verification_email(email_to: NameEmail, redis_client: Redis) -> None:
+    """Queue an email verification link for the user's email address."""
     token = generate_email_verification_token(email_to.email)
     verification_link = f"{settings.FRONTEND_HOST}/verify-email?token={token}"
 
-    message = MessageSchema(
+    await enqueue_mail(
+        redis_client,
+        template="email/verification.html",
         subject="Verify your email",
         recipients=[email_to],
-        template_body={
+        context={
             "verification_link": verification_link,
             "app_name": "ClassEase",
             "user_name": email_to.name,
             "expires_in": 24,
             "year": 2026,
         },
-        subtype=MessageType.html,
     )
 
-    fm = FastMail(EmailConf)
-    await fm.send_message(message, template_name="email/verification.html")
 
-
-def verify_google_token(token: str) -> dict:
+async def verify_google_token(token: str, redis_client: Redis) -> dict:
     """Verify the Google token and return the user info if valid."""
+    # Loaded on the first Google sign-in rather than at startup, since it
+    # brings in an HTTP client most workers never use
+    import httpx
+
+    from project.core.google import google_verifier
+
     try:
-        idinfo = id_token.verify_oauth2_token(
-            token, requests.Request(), settings.GOOGLE_CLIENT_ID
-        )
-        return idinfo
-    except Exception:
+        return await google_verifier.verify(token, redis_client)
+    except jwt.PyJWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid Google token"
         )
+    except httpx.HTTPError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Could not fetch Google signing keys",
+        )
 
 
-async def get_google_user(session: AsyncSession, token: str) -> User:
+async def get_google_user(
+    session: AsyncSession, token: str, redis_client: Redis
+) -> User:
     """Retrieve or link a user based on Google token data."""
 
-    google_data = verify_google_token(token)
+    google_data = await verify_google_token(token, redis_client)
 
     if not google_data.get("email_verified", False):
         raise HTTPException(
@@ -138,33 +148,68 @@ async def get_google_user(session: AsyncSession, token: str) -> User:
     return user
 
 
-async def generate_and_store_otp_secret(email: EmailStr, redis_client: Redis) -> str:
+# Checks the submitted code, counts the attempt and, on success, swaps the
+# OTP for a reset token, all in one atomic round trip.
+# KEYS: otp hash, reset token key
+# ARGV: submitted code digest, max attempts, reset token digest, token ttl
+VERIFY_OTP_SCRIPT = get_redis_client().register_script(
     """
-    Generates a secret, saves it to Redis, and returns the 6-digit OTP.
+    local code = redis.call('HGET', KEYS[1], 'code')
+    if not code then
+        return 0
+    end
+
+    local attempts = redis.call('HINCRBY', KEYS[1], 'attempts', 1)
+    if code ~= ARGV[1] then
+        if attempts >= tonumber(ARGV[2]) then
+            redis.call('DEL', KEYS[1])
+        end
+        return 0
+    end
+
+    redis.call('DEL', KEYS[1])
+    redis.call('SET', KEYS[2], ARGV[3], 'EX', ARGV[4])
+    return 1
     """
-    secret = pyotp.random_base32()
+)
 
-    # Store the secret in Redis with an expiration 10 minutes
-    redis_key = f"otp:{email}"
-    await redis_client.setex(redis_key, timedelta(minutes=10), secret)
+# Compare-and-delete so a reset token can only ever be redeemed once.
+# KEYS: reset token key
+# ARGV: submitted token digest
+CONSUME_RESET_TOKEN_SCRIPT = get_redis_client().register_script(
+    """
+    if redis.call('GET', KEYS[1]) == ARGV[1] then
+        redis.call('DEL', KEYS[1])
+        return 1
+    end
+    return 0
+    """
+)
 
-    # Using a 5-minute interval so the code doesn't change every 30 seconds
-    totp = pyotp.TOTP(secret, interval=600)
-    return totp.now()
+OTP_TTL = timedelta(minutes=10)
+PASSWORD_RESET_TOKEN_TTL = timedelta(minutes=10)
 
 
-async def generate_and_store_password_reset_token(
-    email: EmailStr,
-    redis_client: Redis,
-) -> str:
-    """Generates a password reset token, saves it to Redis, and returns the token."""
-    reset_token = pyotp.random_base32()
+def _digest(value: str) -> str:
+    """Codes and tokens are stored hashed so a Redis dump does not leak them."""
+    return hashlib.sha256(value.encode()).hexdigest()
 
-    # Store the reset_token in Redis with an expiration 10 minutes
-    redis_key = f"password_reset:{email}"
-    await redis_client.setex(redis_key, timedelta(minutes=10), reset_token)
 
-    return reset_token
+async def generate_and_store_otp_secret(email: EmailStr, redis_client: Redis) -> str:
+    """
+    Generates a 6-digit OTP, saves its digest to Redis, and returns the OTP.
+    """
+    otp = f"{secrets.randbelow(10**6):06d}"
+
+    # A fresh code also resets the attempt counter
+    redis_key = tenant_key(f"otp:{email}")
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.delete(redis_key)
+        pipe.hset(redis_key, mapping={"code": _digest(otp), "attempts": 0})
+        pipe.expire(redis_key, OTP_TTL)
+        await pipe.execute()
+
+    return otp
 
 
 async def verify_otp_and_generate_token(
@@ -174,28 +219,23 @@ async def verify_otp_and_generate_token(
     redis_client: Redis,
 ) -> str | None:
     """
-    Retrieves secret from Redis, verifies the OTP, and deletes if valid.
-    generates a token if the OTP is valid.
+    Verifies the OTP and, if valid, consumes it and returns a password reset
+    token. After OTP_MAX_ATTEMPTS wrong guesses the OTP is discarded.
     """
-    redis_key = f"otp:{email}"
-    secret = await redis_client.get(redis_key)
-
-    if not secret:
-        return None  # OTP expired or never requested
-
-    totp = pyotp.TOTP(secret, interval=600)
-
-    # Check if the code is correct
-    if not totp.verify(user_submitted_code):
-        return None
-
-    # Valid! Delete the secret so it's a "One-Time" password
-    await redis_client.delete(redis_key)
-
-    # generate a token
-    token = await generate_and_store_password_reset_token(email, redis_client)
+    token = secrets.token_urlsafe(32)
+
+    verified = await VERIFY_OTP_SCRIPT(
+        keys=[tenant_key(f"otp:{email}"), tenant_key(f"password_reset:{email}")],
+        args=[
+            _digest(user_submitted_code),
+            settings.OTP_MAX_ATTEMPTS,
+            _digest(token),
+            int(PASSWORD_RESET_TOKEN_TTL.total_seconds()),
+        ],
+        client=redis_client,
+    )
 
-    return token
+    return token if verified else None
 
 
 async def verify_password_reset_token(
@@ -203,38 +243,31 @@ async def verify_password_reset_token(
     token: str,
     redis_client: Redis,
 ) -> bool:
-    """Verify the password reset token from Redis."""
-    redis_key = f"password_reset:{email}"
-    stored_token = await redis_client.get(redis_key)
-
-    if not stored_token:
-        return False  # Token expired or never generated
-
-    if stored_token != token:
-        return False  # Invalid token
-
-    # Valid token, delete it to prevent reuse
-    await redis_client.delete(redis_key)
-    return True
+    """Verify the password reset token from Redis, consuming it if valid."""
+    consumed = await CONSUME_RESET_TOKEN_SCRIPT(
+        keys=[tenant_key(f"password_reset:{email}")],
+        args=[_digest(token)],
+        client=redis_client,
+    )
+    return bool(consumed)
 
 
 async def send_reset_password_email(email_to: NameEmail, redis_client: Redis) -> None:
-    """Send a password reset email with a tokenized link."""
+    """Queue a password reset email carrying a one-time code."""
 
     otp = await generate_and_store_otp_secret(email_to.email, redis_client)
 
     project_name = settings.PROJECT_NAME
-    message = MessageSchema(
+    await enqueue_mail(
+        redis_client,
+        template="email/reset_password.html",
         subject=f"{project_name} - Password recovery for user {email_to.name}",
         recipients=[email_to],
-        template_body={
+        context={
             "app_name": settings.PROJECT_NAME,
             "username": email_to.name,
             "expires_in": settings.EMAIL_RESET_TOKEN_EXPIRE_HOURS,
             "otp_code": otp,
             "current_year": datetime.now(timezone.utc).year,
         },
-        subtype=MessageType.html,
     )
-    fm = FastMail(EmailConf)
-    await fm.send_message(message, template_name="email/reset_password.html")
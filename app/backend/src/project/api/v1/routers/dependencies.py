@@ -1,9 +1,10 @@
+import hashlib
 from collections.abc import AsyncGenerator
 from datetime import datetime, timezone
 from typing import Annotated, Any, Dict, List, Type
 
 import jwt
-from fastapi import Depends, HTTPException, Query, status
+from fastapi import Depends, HTTPException, Query, Request, status
 from fastapi.security import (
     HTTPBearer,
     OAuth2PasswordBearer,
@@ -12,11 +13,20 @@ from jwt.exceptions import InvalidTokenError
 from pydantic import BaseModel, ValidationError
 from redis.asyncio import Redis
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from project.core import security
 from project.core.config import settings
-from project.core.db import engine, init_db
+from project.core.db import (
+    READ_REPLICA,
+    WROTE,
+    AsyncSessionLocal,
+    engine,
+    replica_engine,
+    replica_usable,
+)
+from project.core.redis import get_redis_client
+from project.core.tenancy import current_tenant, tenant_exists, tenant_key
 from project.models.blacklist_token import BlacklistToken
 from project.models.user import User
 from project.schema.schema import TokenPayload
@@ -27,25 +37,50 @@ from project.utils.utils import classify_model_fields, extract_inner_model
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 security_bearer = HTTPBearer(auto_error=True)
 
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
 
+def _pin_key(request: Request) -> str:
+    caller = request.headers.get("Authorization") or (
+        request.client.host if request.client else ""
+    )
+    return tenant_key(f"replica:pin:{hashlib.sha256(caller.encode()).hexdigest()[:32]}")
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    The session of a request. It checks out a connection on its first
+    query only, and hands it back when closed, which `SessionDep` does as
+    soon as the handler returns instead of after the response is sent.
+
+    GET requests read from the replica, if one is configured and current,
+    unless the same client wrote something in the last
+    REPLICA_STICKY_SECONDS, so clients always see their own writes.
+    """
+    if settings.MULTI_TENANT:
+        tenant = current_tenant()
+        if tenant is None or not await tenant_exists(tenant, engine):
+            raise HTTPException(status_code=404, detail="School not found.")
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    redis = get_redis_client()
     async with AsyncSessionLocal() as session:
-        await init_db(session)
+        if (
+            replica_engine is not None
+            and request.method in ("GET", "HEAD")
+            and await replica_usable()
+            and not await redis.exists(_pin_key(request))
+        ):
+            session.info[READ_REPLICA] = replica_engine.sync_engine
+
         yield session
 
+        if session.info.get(WROTE) and replica_engine is not None:
+            await redis.set(_pin_key(request), 1, ex=settings.REPLICA_STICKY_SECONDS)
+
 
 async def get_redis() -> AsyncGenerator[Redis, None]:
-    redis_client = Redis.from_url(str(settings.REDIS_URL), decode_responses=True)
-    yield redis_client
+    yield get_redis_client()
 
 
-SessionDep = Annotated[AsyncSession, Depends(get_db)]
+SessionDep = Annotated[AsyncSession, Depends(get_db, scope="function")]
 TokenDep = Annotated[str, Depends(oauth2_scheme)]
 RedisDep = Annotated[Redis, Depends(get_redis)]
 
@@ -70,6 +105,8 @@ async def get_current_user(
 
         if token_data.exp < datetime.now(timezone.utc):
             raise credentials_exception
+        if token_data.tenant != current_tenant():
+            raise credentials_exception
 
         # Check if the token is blacklisted
         blacklisted = (
@@ -115,6 +152,14 @@ student_route = Annotated[
 teacher_route = Annotated[
     User, Depends(ProtectedRoute([RoleEnum.ADMIN, RoleEnum.TEACHER]))
 ]
+member_route = Annotated[
+    User,
+    Depends(
+        ProtectedRoute(
+            [RoleEnum.ADMIN, RoleEnum.TEACHER, RoleEnum.STUDENT, RoleEnum.PARENT]
+        )
+    ),
+]
 
 
 async def parse_nested_params(
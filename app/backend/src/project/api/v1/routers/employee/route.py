@@ -9,6 +9,11 @@ from project.api.v1.routers.employee.schema import (
     EmployeeBasicInfo,
     UpdateEmployeeStatusSchema,
 )
+from project.api.v1.routers.filtering import EmployeeFilters
+from project.api.v1.routers.statistics.service import (
+    apply_stat_changes,
+    employee_stat_keys,
+)
 from project.core.security import get_password_hash
 from project.models.employee import Employee
 from project.models.employee_year_link import EmployeeYearLink
@@ -29,10 +34,14 @@ router = APIRouter(prefix="/employees", tags=["Employees"])
 async def get_employees(
     session: SessionDep,
     user_in: admin_route,
+    filters: EmployeeFilters,
     q: Annotated[Optional[str], Query()] = None,
 ) -> Sequence[Employee]:
-    """This endpoint will return employees based on the provided filters."""
-    stm = select(Employee)
+    """
+    This endpoint will return employees based on the provided filters,
+    see the `filter` and `sort` parameters.
+    """
+    stm = filters.apply(select(Employee))
 
     if q:
         stm = stm.where(Employee.first_name.ilike(f"%{q}%"))
@@ -66,6 +75,7 @@ async def delete_employees(
     user_in: admin_route,
 ) -> SuccessResponseSchema:
     """This endpoint will delete employees by their IDs."""
+    counted = await employee_stat_keys(session, employee_ids, lock=True)
     for employee_id in employee_ids:
         employee = await session.get(Employee, employee_id)
         if not employee:
@@ -73,7 +83,9 @@ async def delete_employees(
                 status_code=404,
                 detail=f"Employee with ID {employee_id} not found.",
             )
-        session.delete(employee)
+        await session.delete(employee)
+    await session.flush()
+    await apply_stat_changes(session, counted, [])
     await session.commit()
 
     return SuccessResponseSchema(message="Employees deleted successfully.")
@@ -93,6 +105,7 @@ async def update_employee_status(
             detail="No academic year found.",
         )
 
+    counted = await employee_stat_keys(session, employees.employee_ids, lock=True)
     for employee_id in employees.employee_ids:
         employee = await session.get(Employee, employee_id)
         if not employee:
@@ -115,17 +128,23 @@ async def update_employee_status(
             and employee.position == EmployeePositionEnum.TEACHING_STAFF
             and employee.user_id is None
         ):
-            username = generate_id(session=session, role=RoleEnum.TEACHER, year=year)
+            username = await generate_id(
+                session=session, role=RoleEnum.TEACHER, year=year
+            )
             new_user = User(
                 role=RoleEnum.TEACHER,
-                username=generate_id(session=session, role=RoleEnum.TEACHER, year=year),
+                username=username,
                 password=get_password_hash(username),
             )
             session.add(new_user)
-            await session.commit()
+            await session.flush()
+
+            stmt = stmt.values(user_id=new_user.id)
 
-            stmt.values(user_id=new_user.id)
+        await session.execute(stmt)
 
-    await session.execute(stmt)
+    await apply_stat_changes(
+        session, counted, await employee_stat_keys(session, employees.employee_ids)
+    )
     await session.commit()
     return SuccessResponseSchema(message="Employees status updated successfully.")
@@ -0,0 +1,195 @@
+import uuid
+from typing import Annotated, List, Sequence
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from sqlalchemy import select
+
+from project.api.v1.routers.dependencies import (
+    RedisDep,
+    SessionDep,
+    admin_route,
+    member_route,
+)
+from project.api.v1.routers.events.schema import (
+    EventRangeParams,
+    NewEvent,
+    UpdateEvent,
+)
+from project.api.v1.routers.events.service import (
+    cached_calendar,
+    invalidate_calendar,
+    overlapping,
+)
+from project.core.compression import accepts_gzip, gzip_body
+from project.models.event import Event
+from project.models.year import Year
+from project.schema.models.event_schema import EventSchema
+from project.schema.schema import SuccessResponseSchema
+
+router = APIRouter(prefix="/events", tags=["Events"])
+
+
+async def _get_year(session: SessionDep, year_id: uuid.UUID) -> Year:
+    year = await session.get(Year, year_id)
+    if not year:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Year with ID {year_id} not found.",
+        )
+    return year
+
+
+async def _get_event(session: SessionDep, event_id: uuid.UUID) -> Event:
+    event = await session.get(Event, event_id)
+    if not event:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Event with ID {event_id} not found.",
+        )
+    return event
+
+
+@router.get("", response_model=List[EventSchema])
+async def get_events(
+    session: SessionDep,
+    query: Annotated[EventRangeParams, Query()],
+    user_in: member_route,
+) -> Sequence[Event]:
+    """
+    This endpoint will return the events of a year that overlap the days
+    from `start` to `end`, e.g. the week a calendar is showing.
+    """
+    await _get_year(session, query.year_id)
+
+    return (
+        (
+            await session.execute(
+                select(Event)
+                .where(
+                    Event.year_id == query.year_id,
+                    overlapping(query.start, query.end),
+                )
+                .order_by(Event.start_date, Event.start_time, Event.id)
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+
+def _if_none_match(request: Request) -> List[str]:
+    """The ETags of `If-None-Match`, compared weakly as RFC 9110 asks."""
+    return [
+        tag.strip().removeprefix("W/")
+        for tag in request.headers.get("if-none-match", "").split(",")
+    ]
+
+
+@router.get("/years/{year_id}/calendar.ics")
+async def get_year_calendar(
+    request: Request,
+    session: SessionDep,
+    redis: RedisDep,
+    year_id: uuid.UUID,
+    user_in: member_route,
+) -> Response:
+    """
+    This endpoint will return all events of a year as an iCalendar feed.
+    The feed is rendered once per change, and clients sending the ETag
+    back in `If-None-Match` get an empty 304 until an event changes.
+    """
+    year = await _get_year(session, year_id)
+    body, etag = await cached_calendar(session, redis, year)
+
+    # Weak, as the gzip and identity bodies share it
+    headers = {
+        "ETag": f"W/{etag}",
+        "Cache-Control": "private, no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    if etag in _if_none_match(request):
+        return Response(status_code=304, headers=headers)
+
+    content = body.encode()
+    if accepts_gzip(request.headers):
+        # Compressed once per version of the feed, not on every request
+        content = gzip_body(content)
+        headers["Content-Encoding"] = "gzip"
+    return Response(
+        content=content, media_type="text/calendar; charset=utf-8", headers=headers
+    )
+
+
+@router.get("/{event_id}", response_model=EventSchema)
+async def get_event(
+    session: SessionDep,
+    event_id: uuid.UUID,
+    user_in: member_route,
+) -> Event:
+    """This endpoint will return a single event."""
+    return await _get_event(session, event_id)
+
+
+@router.post("", response_model=EventSchema, status_code=201)
+async def create_event(
+    session: SessionDep,
+    redis: RedisDep,
+    event_in: NewEvent,
+    user_in: admin_route,
+) -> Event:
+    """This endpoint will add an event to a year's calendar."""
+    await _get_year(session, event_in.year_id)
+
+    event = Event(**event_in.model_dump())
+    session.add(event)
+    await session.commit()
+    await invalidate_calendar(redis, event.year_id)
+
+    return event
+
+
+@router.patch("/{event_id}", response_model=EventSchema)
+async def update_event(
+    session: SessionDep,
+    redis: RedisDep,
+    event_id: uuid.UUID,
+    event_in: UpdateEvent,
+    user_in: admin_route,
+) -> Event:
+    """This endpoint will change the fields of an event that are sent."""
+    event = await _get_event(session, event_id)
+    for key in event_in.model_fields_set:
+        setattr(event, key, getattr(event_in, key))
+
+    if event.start_date > event.end_date:
+        raise HTTPException(
+            status_code=400,
+            detail="startDate must not be after endDate",
+        )
+    if event.start_time and event.end_time and event.start_time > event.end_time:
+        raise HTTPException(
+            status_code=400,
+            detail="startTime must not be after endTime",
+        )
+
+    await session.commit()
+    await session.refresh(event)
+    await invalidate_calendar(redis, event.year_id)
+
+    return event
+
+
+@router.delete("/{event_id}", response_model=SuccessResponseSchema)
+async def delete_event(
+    session: SessionDep,
+    redis: RedisDep,
+    event_id: uuid.UUID,
+    user_in: admin_route,
+) -> SuccessResponseSchema:
+    """This endpoint will remove an event from its year's calendar."""
+    event = await _get_event(session, event_id)
+    await session.delete(event)
+    await session.commit()
+    await invalidate_calendar(redis, event.year_id)
+
+    return SuccessResponseSchema(message="Event deleted successfully.")
@@ -0,0 +1,107 @@
+import uuid
+from datetime import date, datetime
+from typing import Any, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from project.utils.enum import (
+    EventEligibilityEnum,
+    EventLocationEnum,
+    EventOrganizerEnum,
+    EventPurposeEnum,
+)
+from project.utils.utils import to_camel
+
+
+class EventRangeParams(BaseModel):
+    """Events of a year overlapping `start`..`end`, both days included."""
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+    year_id: uuid.UUID
+    start: date
+    end: date
+
+    @model_validator(mode="after")
+    def check_range(self) -> "EventRangeParams":
+        if self.start > self.end:
+            raise ValueError("start must not be after end")
+        return self
+
+
+class NewEvent(BaseModel):
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+    year_id: uuid.UUID
+    title: str = Field(min_length=1, max_length=100)
+    purpose: EventPurposeEnum
+    organizer: EventOrganizerEnum
+    start_date: date
+    end_date: date
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    location: Optional[EventLocationEnum] = None
+    is_hybrid: bool = False
+    online_link: Optional[str] = None
+    eligibility: Optional[EventEligibilityEnum] = None
+    has_fee: bool = False
+    fee_amount: int = Field(default=0, ge=0)
+    description: Optional[str] = Field(default=None, max_length=255)
+
+    @model_validator(mode="after")
+    def check_dates(self) -> "NewEvent":
+        if self.start_date > self.end_date:
+            raise ValueError("startDate must not be after endDate")
+        if self.start_time and self.end_time and self.start_time > self.end_time:
+            raise ValueError("startTime must not be after endTime")
+        return self
+
+
+class UpdateEvent(BaseModel):
+    """Only the fields that are sent are changed."""
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+    title: Optional[str] = Field(default=None, min_length=1, max_length=100)
+    purpose: Optional[EventPurposeEnum] = None
+    organizer: Optional[EventOrganizerEnum] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    location: Optional[EventLocationEnum] = None
+    is_hybrid: Optional[bool] = None
+    online_link: Optional[str] = None
+    eligibility: Optional[EventEligibilityEnum] = None
+    has_fee: Optional[bool] = None
+    fee_amount: Optional[int] = Field(default=None, ge=0)
+    description: Optional[str] = Field(default=None, max_length=255)
+
+    @field_validator(
+        "title",
+        "purpose",
+        "organizer",
+        "start_date",
+        "end_date",
+        "is_hybrid",
+        "has_fee",
+        "fee_amount",
+    )
+    @classmethod
+    def not_null(cls, value: Any) -> Any:
+        # Left out means unchanged; null would clear a required column
+        if value is None:
+            raise ValueError("must not be null")
+        return value
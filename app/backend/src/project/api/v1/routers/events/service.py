@@ -0,0 +1,153 @@
+import hashlib
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, List, Optional, Tuple
+
+from redis.asyncio import Redis
+from sqlalchemy import Boolean, ColumnElement, func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from project.core.config import settings
+from project.core.tenancy import tenant_key
+from project.models.event import Event
+from project.models.year import Year
+from project.utils.enum import EventLocationEnum, EventPurposeEnum
+
+PRODID = "-//ClassEase//School Calendar//EN"
+
+
+# Spelled exactly like ix_events_year_id_dates, with the bounds inlined
+# rather than bound, so the planner can use the index
+EVENT_DATES = func.daterange(Event.start_date, Event.end_date, literal_column("'[]'"))
+
+
+def overlapping(start: date, end: date) -> ColumnElement[bool]:
+    """Events with at least one day in `start`..`end`, both included."""
+    return EVENT_DATES.op("&&", return_type=Boolean)(func.daterange(start, end, "[]"))
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", r"\;")
+        .replace(",", r"\,")
+        .replace("\r\n", r"\n")
+        .replace("\n", r"\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Split a content line into pieces of at most 75 octets (RFC 5545 3.1)."""
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line
+
+    parts: List[str] = []
+    while encoded:
+        size = 75 if not parts else 74
+        # Never cut a multi-byte character in half
+        while size < len(encoded) and (encoded[size] & 0xC0) == 0x80:
+            size -= 1
+        parts.append(encoded[:size].decode())
+        encoded = encoded[size:]
+    return "\r\n ".join(parts)
+
+
+def _datetime(value: datetime) -> str:
+    if value.tzinfo is None:
+        # Stored without a zone, shown as local time wherever it is read
+        return value.strftime("%Y%m%dT%H%M%S")
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _event_lines(event: Event) -> List[str]:
+    stamp = event.updated_at or event.created_at
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{event.id}@classease",
+        f"DTSTAMP:{_datetime(stamp)}",
+    ]
+    if event.start_time is not None and event.end_time is not None:
+        lines += [
+            f"DTSTART:{_datetime(event.start_time)}",
+            f"DTEND:{_datetime(event.end_time)}",
+        ]
+    else:
+        # All-day events end on the day after their last day
+        end = event.end_date + timedelta(days=1)
+        lines += [
+            f"DTSTART;VALUE=DATE:{event.start_date:%Y%m%d}",
+            f"DTEND;VALUE=DATE:{end:%Y%m%d}",
+        ]
+    lines += [
+        f"SUMMARY:{_escape(event.title)}",
+        f"CATEGORIES:{EventPurposeEnum(event.purpose).value}",
+    ]
+    if event.description:
+        lines.append(f"DESCRIPTION:{_escape(event.description)}")
+    if event.location:
+        lines.append(f"LOCATION:{EventLocationEnum(event.location).value}")
+    if event.online_link:
+        lines.append(f"URL:{event.online_link}")
+    lines.append("END:VEVENT")
+    return lines
+
+
+def render_calendar(year: Year, events: Iterable[Event]) -> str:
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        f"X-WR-CALNAME:{_escape(year.name)}",
+    ]
+    for event in events:
+        lines += _event_lines(event)
+    lines.append("END:VCALENDAR")
+    return "".join(_fold(line) + "\r\n" for line in lines)
+
+
+def _version_key(year_id: uuid.UUID) -> str:
+    return tenant_key(f"calendar:{year_id}:version")
+
+
+async def invalidate_calendar(redis: Redis, year_id: uuid.UUID) -> None:
+    """
+    Make the next request render the year's feed again. Call after commit.
+
+    Bumping a version instead of deleting the feed means a render that read
+    the events before the change cannot overwrite the cache with them.
+    """
+    await redis.incr(_version_key(year_id))
+
+
+async def cached_calendar(
+    session: AsyncSession, redis: Redis, year: Year
+) -> Tuple[str, str]:
+    """The year's iCal feed and its ETag, rendered at most once per change."""
+    version: Optional[str] = await redis.get(_version_key(year.id))
+    key = tenant_key(f"calendar:{year.id}:{version or 0}")
+
+    cached = await redis.hgetall(key)  # ty:ignore[invalid-await]
+    if cached:
+        return cached["body"], cached["etag"]
+
+    events = (
+        (
+            await session.execute(
+                select(Event)
+                .where(Event.year_id == year.id)
+                .order_by(Event.start_date, Event.start_time, Event.id)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    body = render_calendar(year, events)
+    etag = '"' + hashlib.sha256(body.encode()).hexdigest()[:32] + '"'
+
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.hset(key, mapping={"body": body, "etag": etag})
+        pipe.expire(key, settings.EVENT_CALENDAR_CACHE_TTL)
+        await pipe.execute()
+    return body, etag
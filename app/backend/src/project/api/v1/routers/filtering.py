@@ -0,0 +1,314 @@
+"""
+A small, typed query language for list endpoints.
+
+    ?filter=status:eq:active&filter=dateOfBirth:gte:2012-01-01&sort=-createdAt
+
+Each list whitelists its fields together with the SQL they compile to and
+whether an index serves them. On large tables a predicate no index can
+answer is rejected instead of silently turning into a sequential scan.
+"""
+
+import operator
+from dataclasses import dataclass
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from fastapi import Depends, HTTPException, Query
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import ColumnElement, Select, bindparam, select
+
+from project.api.v1.routers.schema import FilterCondition, SortKey
+from project.models import Employee, Student, StudentSectionLink, Subject
+from project.utils.utils import to_camel
+
+
+@dataclass(frozen=True)
+class QueryField:
+    expression: ColumnElement[Any]
+    # What the field orders by; None for fields that cannot be sorted, such
+    # as nullable columns, which keyset pagination cannot page through
+    sort_by: Optional[ColumnElement[Any]] = None
+    # A btree index answers equality, ranges, IN and IS NULL
+    indexed: bool = False
+    # A trigram index answers `contains`
+    searchable: bool = False
+    # For fields reached through a link table: turns a predicate on
+    # `expression` into one on the listed rows
+    through: Optional[Callable[[ColumnElement[bool]], ColumnElement[bool]]] = None
+
+
+def query_field(
+    expression: Any,
+    *,
+    sortable: bool = True,
+    indexed: bool = False,
+    searchable: bool = False,
+) -> QueryField:
+    return QueryField(
+        expression,
+        sort_by=expression if sortable else None,
+        indexed=indexed,
+        searchable=searchable,
+    )
+
+
+@dataclass(frozen=True)
+class FieldSet:
+    fields: Mapping[str, QueryField]
+    # Large tables only accept predicates and sorts an index can serve
+    large: bool = False
+
+    def resolve(self, name: str) -> QueryField:
+        """Look a field up by its camelCase API name or its column name."""
+        if name in self.fields:
+            return self.fields[name]
+        for key, value in self.fields.items():
+            if to_camel(key) == name:
+                return value
+        raise _invalid(f"Unknown field {name!r}")
+
+    def extend(self, **fields: QueryField) -> "FieldSet":
+        return FieldSet({**self.fields, **fields}, large=self.large)
+
+
+def _invalid(detail: str) -> HTTPException:
+    return HTTPException(status_code=400, detail=detail)
+
+
+_COMPARISONS: Dict[str, Callable[[Any, Any], ColumnElement[bool]]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "gt": operator.gt,
+    "gte": operator.ge,
+}
+
+
+def _check_indexable(
+    fields: FieldSet, query_field: QueryField, condition: FilterCondition
+) -> None:
+    if not fields.large:
+        return
+    if condition.op == "contains":
+        usable = query_field.searchable
+    else:
+        # `ne` matches nearly every row, no index helps with that
+        usable = query_field.indexed and condition.op != "ne"
+    if not usable:
+        raise _invalid(
+            f"{condition.field!r} cannot be filtered with {condition.op!r} "
+            "here without scanning every row"
+        )
+
+
+def compile_condition(
+    fields: FieldSet, condition: FilterCondition, name: str
+) -> Tuple[ColumnElement[bool], Optional[Any]]:
+    """
+    The SQL for one condition, with its value left as the bound parameter
+    `name`, and the value to bind, if any.
+    """
+    query_field = fields.resolve(condition.field)
+    _check_indexable(fields, query_field, condition)
+    expression = query_field.expression
+
+    value: Any = None
+    if condition.op == "isNull" and condition.value is False:
+        clause = expression.is_not(None)
+    elif condition.op == "isNull":
+        clause = expression.is_(None)
+    else:
+        adapter = TypeAdapter(expression.type.python_type)
+        try:
+            if condition.op == "in":
+                if not isinstance(condition.value, list):
+                    raise _invalid(f"{condition.field!r}: 'in' expects a list")
+                value = [adapter.validate_python(v) for v in condition.value]
+            else:
+                value = adapter.validate_python(condition.value)
+        except ValidationError:
+            raise _invalid(f"{condition.field!r}: invalid value {condition.value!r}")
+
+        param = bindparam(name, type_=expression.type, expanding=condition.op == "in")
+        if condition.op == "in":
+            clause = expression.in_(param)
+        elif condition.op == "contains":
+            if not isinstance(value, str):
+                raise _invalid(f"{condition.field!r}: 'contains' needs a text field")
+            escaped = value.replace("\\", "\\\\").replace("%", r"\%")
+            value = "%" + escaped.replace("_", r"\_") + "%"
+            clause = expression.ilike(param, escape="\\")
+        else:
+            clause = _COMPARISONS[condition.op](expression, param)
+
+    if query_field.through is not None:
+        clause = query_field.through(clause)
+    return clause, value
+
+
+def compile_sort(
+    fields: FieldSet, keys: Sequence[SortKey]
+) -> List[Tuple[ColumnElement[Any], bool]]:
+    """Each sort key as `(expression, descending)`, without repeats."""
+    compiled: List[Tuple[ColumnElement[Any], bool]] = []
+    for key in keys:
+        query_field = fields.resolve(key.field)
+        if query_field.sort_by is None:
+            raise _invalid(f"Cannot sort by {key.field!r}")
+        if fields.large and not query_field.indexed:
+            raise _invalid(f"{key.field!r} cannot be sorted without a full scan")
+        if all(query_field.sort_by is not seen for seen, _ in compiled):
+            compiled.append((query_field.sort_by, key.direction == "desc"))
+    return compiled
+
+
+def parse_filter(raw: str) -> FilterCondition:
+    """Parse `field:op:value`; `in` takes a comma separated list."""
+    name, _, rest = raw.partition(":")
+    op, _, text = rest.partition(":")
+
+    value: Any = text
+    if op == "in":
+        value = [item for item in text.split(",") if item]
+    elif op == "isNull":
+        value = text.lower() != "false"
+
+    try:
+        return FilterCondition(field=name, op=op or "eq", value=value)
+    except ValidationError:
+        raise _invalid(f"Invalid filter {raw!r}, expected field:op:value")
+
+
+def parse_sort(raw: str) -> List[SortKey]:
+    """Parse `a,-b`: ascending on a, then descending on b."""
+    return [
+        SortKey(field=part.lstrip("-"), direction="desc" if part[0] == "-" else "asc")
+        for part in (item.strip() for item in raw.split(","))
+        if part
+    ]
+
+
+@dataclass(frozen=True)
+class FilterSort:
+    where: Tuple[ColumnElement[bool], ...] = ()
+    order_by: Tuple[ColumnElement[Any], ...] = ()
+
+    def apply(self, stmt: Select[Any]) -> Select[Any]:
+        return stmt.where(*self.where).order_by(*self.order_by)
+
+
+class FilterSortDependency:
+    """
+    Parses the `filter` and `sort` query parameters against `fields` and
+    hands the route a `FilterSort` to apply to its statement.
+    """
+
+    def __init__(self, fields: FieldSet):
+        self.fields = fields
+
+    def __call__(
+        self,
+        filter_: Annotated[
+            List[str],
+            Query(
+                alias="filter",
+                description="field:op:value, op is one of eq, ne, lt, lte, "
+                "gt, gte, in, contains, isNull. Repeat for more conditions.",
+            ),
+        ] = [],
+        sort: Annotated[
+            Optional[str],
+            Query(description="Comma separated fields, prefix with - to reverse"),
+        ] = None,
+    ) -> FilterSort:
+        where = []
+        for i, raw in enumerate(filter_):
+            clause, value = compile_condition(self.fields, parse_filter(raw), f"f{i}")
+            where.append(clause if value is None else clause.params({f"f{i}": value}))
+
+        keys = compile_sort(self.fields, parse_sort(sort)) if sort else []
+        return FilterSort(
+            where=tuple(where),
+            order_by=tuple(key.desc() if desc else key.asc() for key, desc in keys),
+        )
+
+
+STUDENT_FIELDS = FieldSet(
+    {
+        "id": query_field(Student.id, indexed=True),
+        "first_name": query_field(Student.first_name, indexed=True, searchable=True),
+        "father_name": query_field(Student.father_name, indexed=True, searchable=True),
+        "grand_father_name": query_field(Student.grand_father_name, sortable=False),
+        "date_of_birth": query_field(Student.date_of_birth, indexed=True),
+        "gender": query_field(Student.gender, indexed=True),
+        "status": query_field(Student.status, indexed=True),
+        "grade_id": query_field(Student.registered_for_grade_id, indexed=True),
+        "section_id": QueryField(
+            StudentSectionLink.section_id,
+            indexed=True,
+            through=lambda clause: Student.id.in_(
+                select(StudentSectionLink.student_id).where(clause)
+            ),
+        ),
+        "created_at": query_field(Student.created_at, indexed=True),
+        # Shown by saved views, too costly to filter on
+        "nationality": query_field(Student.nationality, sortable=False),
+        "city": query_field(Student.city),
+        "state": query_field(Student.state),
+        "is_transfer": query_field(Student.is_transfer),
+        "has_medical_condition": query_field(Student.has_medical_condition),
+        "has_disability": query_field(Student.has_disability),
+        "student_photo": query_field(Student.student_photo, sortable=False),
+    },
+    large=True,
+)
+
+EMPLOYEE_FIELDS = FieldSet(
+    {
+        "id": query_field(Employee.id, indexed=True),
+        "first_name": query_field(Employee.first_name, indexed=True, searchable=True),
+        "father_name": query_field(Employee.father_name, indexed=True, searchable=True),
+        "gender": query_field(Employee.gender, indexed=True),
+        "position": query_field(Employee.position, indexed=True),
+        "status": query_field(Employee.status, indexed=True),
+        "subject_id": query_field(Employee.subject_id, sortable=False, indexed=True),
+        "created_at": query_field(Employee.created_at, indexed=True),
+        # Shown by saved views, too costly to filter on
+        "grand_father_name": query_field(Employee.grand_father_name),
+        "date_of_birth": query_field(Employee.date_of_birth),
+        "nationality": query_field(Employee.nationality),
+        "city": query_field(Employee.city),
+        "state": query_field(Employee.state),
+        "country": query_field(Employee.country),
+        "highest_education": query_field(Employee.highest_education),
+        "university": query_field(Employee.university),
+        "graduation_year": query_field(Employee.graduation_year),
+        "gpa": query_field(Employee.gpa),
+        "years_of_experience": query_field(Employee.years_of_experience),
+    },
+    large=True,
+)
+
+# One row per subject and year, small enough to filter any way
+SUBJECT_FIELDS = FieldSet(
+    {
+        "id": query_field(Subject.id),
+        "name": query_field(Subject.name),
+        "code": query_field(Subject.code),
+        "created_at": query_field(Subject.created_at),
+    }
+)
+
+StudentFilters = Annotated[FilterSort, Depends(FilterSortDependency(STUDENT_FIELDS))]
+EmployeeFilters = Annotated[FilterSort, Depends(FilterSortDependency(EMPLOYEE_FIELDS))]
+SubjectFilters = Annotated[FilterSort, Depends(FilterSortDependency(SUBJECT_FIELDS))]
@@ -10,22 +10,25 @@ from sqlalchemy.orm import selectinload
 
 from project.api.v1.routers.dependencies import SessionDep, admin_route, shared_route
 from project.api.v1.routers.grades.schema import (
+    GradeFilterParams,
     GradeSetupSchema,
     NewGrade,
     NewGradeSuccess,
     UpdateGradeSetup,
     UpdateGradeSetupSuccess,
 )
-from project.api.v1.routers.grades.service import update_grade_relationships
-from project.api.v1.routers.schema import FilterParams
+from project.api.v1.routers.grades.service import (
+    apply_grade_filters,
+    update_grade_relationships,
+)
+from project.api.v1.routers.idempotency import IdempotentRoute
 from project.models import GradeStreamSubject
 from project.models.grade import Grade
 from project.models.year import Year
 from project.schema.models import GradeWithRelatedSchema
 from project.schema.models.grade_schema import GradeSchema
-from project.utils.utils import sort_grade_key
 
-router = APIRouter(prefix="/grades", tags=["Grades"])
+router = APIRouter(prefix="/grades", tags=["Grades"], route_class=IdempotentRoute)
 
 
 @router.get(
@@ -34,7 +37,7 @@ router = APIRouter(prefix="/grades", tags=["Grades"])
 )
 async def get_grades(
     session: SessionDep,
-    query: Annotated[FilterParams, Query()],
+    query: Annotated[GradeFilterParams, Query()],
     user_in: shared_route,
 ) -> Sequence[Grade]:
     """
@@ -47,15 +50,12 @@ async def get_grades(
             detail=f"Year with ID {query.year_id} not found.",
         )
 
-    grades = (
-        (await session.execute(select(Grade).where(Grade.year_id == query.year_id)))
-        .scalars()
-        .all()
+    stmt = apply_grade_filters(
+        select(Grade).where(Grade.year_id == query.year_id), query
     )
+    grades = (await session.execute(stmt)).scalars().all()
 
-    sorted_grades = sorted(grades, key=sort_grade_key)
-
-    return sorted_grades
+    return grades
 
 
 @router.post(
@@ -110,7 +110,7 @@ async def post_grade(
     response_model=List[GradeSetupSchema],
 )
 async def get_grades_setup(
-    query: Annotated[FilterParams, Query()],
+    query: Annotated[GradeFilterParams, Query()],
     session: SessionDep,
     user_in: shared_route,
 ) -> Sequence[Grade]:
@@ -129,11 +129,9 @@ async def get_grades_setup(
         filter = re.sub(r"^gr?a?d?e? ?", "", query.q.strip(), flags=re.IGNORECASE)
         stmt = stmt.where(Grade.grade.ilike(f"%{filter}%"))
 
-    grades = (await session.execute(stmt)).scalars().all()
-
-    sorted_grades = sorted(grades, key=sort_grade_key)
+    grades = (await session.execute(apply_grade_filters(stmt, query))).scalars().all()
 
-    return sorted_grades
+    return grades
 
 
 @router.get(
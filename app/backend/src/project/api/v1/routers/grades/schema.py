@@ -3,6 +3,7 @@ from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from project.api.v1.routers.schema import FilterParams, PaginationParams
 from project.schema.models.grade_schema import GradeSchema
 from project.schema.models.section_schema import (
     SectionSchema,
@@ -124,3 +125,10 @@ class NewGrade(BaseModel):
 class NewGradeSuccess(BaseModel):
     id: uuid.UUID
     message: str = Field(default="Grade created Successfully")
+
+
+class GradeFilterParams(FilterParams, PaginationParams):
+    """Filters for grade listings, ordered by the grade ordinal."""
+
+    min_grade: Optional[GradeEnum] = Field(default=None)
+    max_grade: Optional[GradeEnum] = Field(default=None)
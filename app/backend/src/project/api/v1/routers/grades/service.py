@@ -1,10 +1,11 @@
 import uuid
 from typing import List, Sequence
 
-from sqlalchemy import delete, select
+from sqlalchemy import Select, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from project.api.v1.routers.grades.schema import (
+    GradeFilterParams,
     UpdateGradeSetup,
     UpdateSection,
     UpdateStreamSetup,
@@ -17,6 +18,27 @@ from project.models.stream import Stream
 from project.models.subject import Subject
 
 
+def apply_grade_filters(
+    stmt: Select[tuple[Grade]], query: GradeFilterParams
+) -> Select[tuple[Grade]]:
+    """
+    Restrict a Grade select to the requested grade range and page.
+
+    Ordering uses the persisted ordinal, so the (year_id, ordinal) index
+    serves both the range scan and the ORDER BY.
+    """
+    if query.min_grade is not None:
+        stmt = stmt.where(Grade.ordinal >= query.min_grade.ordinal)
+    if query.max_grade is not None:
+        stmt = stmt.where(Grade.ordinal <= query.max_grade.ordinal)
+
+    stmt = stmt.order_by(Grade.ordinal).offset(query.offset)
+    if query.limit is not None:
+        stmt = stmt.limit(query.limit)
+
+    return stmt
+
+
 async def update_grade_relationships(
     grade: Grade, update_data: UpdateGradeSetup, session: AsyncSession
 ) -> None:
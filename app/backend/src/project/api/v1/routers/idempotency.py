@@ -0,0 +1,134 @@
+"""
+Replay of POST responses for retried requests carrying an Idempotency-Key.
+
+Routers opt in with ``APIRouter(route_class=IdempotentRoute)``. The first
+successful response to a key is kept in Redis for
+``IDEMPOTENCY_TTL_SECONDS``; a retry with the same key and body gets that
+response back, marked with ``Idempotent-Replayed: true``, without the
+handler running again. A duplicate arriving while the first request is
+still running waits on a short lock for its result.
+"""
+
+import asyncio
+import hashlib
+import json
+import secrets
+from typing import Any, Callable, Coroutine, Optional
+
+from fastapi import HTTPException, Request, Response
+from fastapi.routing import APIRoute
+
+from project.core.config import settings
+from project.core.redis import get_redis_client
+from project.core.tenancy import tenant_key
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+# Delete the lock only if this request still holds it.
+# KEYS: lock key
+# ARGV: lock token
+RELEASE_LOCK_SCRIPT = get_redis_client().register_script(
+    """
+    if redis.call('GET', KEYS[1]) == ARGV[1] then
+        return redis.call('DEL', KEYS[1])
+    end
+    return 0
+    """
+)
+
+
+def idempotency_key(request: Request, path: str, key: str) -> str:
+    """
+    Scope a client's key to the route and the caller's credentials, so two
+    callers picking the same key never see each other's responses.
+    """
+    caller = hashlib.sha256(
+        request.headers.get("Authorization", "").encode()
+    ).hexdigest()[:32]
+    return tenant_key(f"idempotency:{path}:{caller}:{key}")
+
+
+def _replay(stored: str, fingerprint: str) -> Response:
+    saved = json.loads(stored)
+    if saved["fingerprint"] != fingerprint:
+        raise HTTPException(
+            status_code=422,
+            detail=f"{IDEMPOTENCY_HEADER} was already used with a different body.",
+        )
+    return Response(
+        content=saved["body"],
+        status_code=saved["status"],
+        media_type=saved["media_type"],
+        headers={REPLAYED_HEADER: "true"},
+    )
+
+
+class IdempotentRoute(APIRoute):
+    """A route whose POST requests can be retried safely with a key."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def idempotent_handler(request: Request) -> Response:
+            key = request.headers.get(IDEMPOTENCY_HEADER)
+            if request.method != "POST" or not key:
+                return await handler(request)
+
+            redis = get_redis_client()
+            cache_key = idempotency_key(request, self.path_format, key)
+            fingerprint = hashlib.sha256(await request.body()).hexdigest()
+
+            stored = await redis.get(cache_key)
+            if stored is not None:
+                return _replay(stored, fingerprint)
+
+            lock_key = f"{cache_key}:lock"
+            token = secrets.token_hex(16)
+            if not await redis.set(
+                lock_key, token, nx=True, ex=settings.IDEMPOTENCY_LOCK_SECONDS
+            ):
+                stored = await _wait_for_result(cache_key)
+                if stored is None:
+                    raise HTTPException(
+                        status_code=409,
+                        detail="A request with this Idempotency-Key is in progress.",
+                    )
+                return _replay(stored, fingerprint)
+
+            try:
+                response = await handler(request)
+                # Failures are not kept, so a corrected retry can succeed
+                if response.status_code < 400 and hasattr(response, "body"):
+                    await redis.set(
+                        cache_key,
+                        json.dumps(
+                            {
+                                "fingerprint": fingerprint,
+                                "status": response.status_code,
+                                "media_type": response.media_type,
+                                "body": bytes(response.body).decode(),
+                            }
+                        ),
+                        ex=settings.IDEMPOTENCY_TTL_SECONDS,
+                    )
+                return response
+            finally:
+                await RELEASE_LOCK_SCRIPT(keys=[lock_key], args=[token], client=redis)
+
+        return idempotent_handler
+
+
+async def _wait_for_result(cache_key: str) -> Optional[str]:
+    """Poll for the response of the request holding the lock."""
+    redis = get_redis_client()
+    deadline = asyncio.get_running_loop().time() + settings.IDEMPOTENCY_LOCK_SECONDS
+    while asyncio.get_running_loop().time() < deadline:
+        await asyncio.sleep(0.1)
+        stored = await redis.get(cache_key)
+        if stored is not None:
+            return stored
+        if not await redis.exists(f"{cache_key}:lock"):
+            # The first request failed, so nothing will be stored
+            return None
+    return None
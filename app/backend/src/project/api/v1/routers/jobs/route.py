@@ -0,0 +1,29 @@
+from fastapi import APIRouter, HTTPException
+
+from project.api.v1.routers.dependencies import RedisDep, admin_route
+from project.api.v1.routers.jobs.schema import JobStatus
+from project.core.tenancy import current_tenant
+from project.workers.jobs import get_job
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+@router.get("/{job_id}", response_model=JobStatus)
+async def get_job_status(
+    job_id: str,
+    redis: RedisDep,
+    user_in: admin_route,
+) -> JobStatus:
+    """
+    Status, progress and, once finished, the result of a background job
+    started by the current user.
+    """
+    job = await get_job(redis, job_id)
+    if (
+        job is None
+        or job["user_id"] != str(user_in.id)
+        or job.get("tenant", "") != (current_tenant() or "")
+    ):
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found.")
+
+    return JobStatus.from_hash(job)
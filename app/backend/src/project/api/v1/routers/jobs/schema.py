@@ -0,0 +1,70 @@
+import json
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from project.utils.utils import to_camel
+
+JobState = Literal["queued", "running", "succeeded", "failed"]
+
+
+class JobAccepted(BaseModel):
+    """Answer of an endpoint that finishes its work in the background."""
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+    job_id: uuid.UUID
+    message: str = "Accepted, poll the job for its result."
+
+
+class JobStatus(BaseModel):
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+    id: uuid.UUID
+    name: str
+    status: JobState
+    attempts: int
+    done: Optional[int] = None
+    total: Optional[int] = None
+    message: Optional[str] = None
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    enqueued_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    # Of the last attempt only
+    run_seconds: Optional[float] = None
+
+    @classmethod
+    def from_hash(cls, job: Dict[str, str]) -> "JobStatus":
+        """Build the status from a job hash as stored by project.workers.jobs."""
+
+        def timestamp(field: str) -> Optional[datetime]:
+            value = job.get(field)
+            return datetime.fromtimestamp(float(value), timezone.utc) if value else None
+
+        return cls(
+            id=job["id"],
+            name=job["name"],
+            status=job["status"],
+            attempts=job["attempts"],
+            done=job.get("done"),
+            total=job.get("total"),
+            message=job.get("message"),
+            result=json.loads(job["result"]) if "result" in job else None,
+            error=job.get("error"),
+            enqueued_at=timestamp("enqueued_at"),
+            started_at=timestamp("started_at"),
+            finished_at=timestamp("finished_at"),
+            run_seconds=job.get("run_seconds"),
+        )
@@ -0,0 +1,76 @@
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from project.api.v1.routers.dependencies import shared_route
+from project.api.v1.routers.media.schema import ImageUploadResponse
+from project.api.v1.routers.media.service import serve_immutable, store_image
+from project.api.v1.routers.schema import HTTPError
+from project.core.config import settings
+from project.core.media import original_path, parse_image_ref, thumbnail_path
+
+router = APIRouter(prefix="/media", tags=["Media"])
+
+IMAGE_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"image/*": {"schema": {"type": "string", "format": "binary"}}},
+    }
+}
+
+MEDIA_TYPES = {
+    "jpg": "image/jpeg",
+    "png": "image/png",
+    "webp": "image/webp",
+    "gif": "image/gif",
+}
+
+
+@router.post(
+    "/images",
+    status_code=201,
+    response_model=ImageUploadResponse,
+    openapi_extra=IMAGE_BODY,
+    responses={
+        413: {"model": HTTPError, "description": "Image too large"},
+        415: {"model": HTTPError, "description": "Not a supported image"},
+    },
+)
+async def upload_image(request: Request, user_in: shared_route) -> ImageUploadResponse:
+    """
+    Stores an image sent as the raw request body and returns its reference
+    together with the URLs of the original and its thumbnails.
+    """
+    return await store_image(request)
+
+
+@router.get("/images/{ref}", response_class=Response)
+async def get_image(request: Request, ref: str) -> Response:
+    """
+    Returns an original image.
+
+    References are hashes of the image content, so they cannot be guessed
+    and never change meaning; this is what lets `<img>` tags load them
+    without a bearer token and lets browsers cache them for good.
+    """
+    match = parse_image_ref(ref)
+    if match is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    return await serve_immutable(
+        request,
+        original_path(match["digest"], match["ext"]),
+        MEDIA_TYPES[match["ext"]],
+        f'"{match["digest"]}"',
+    )
+
+
+@router.get("/images/{digest}/thumbnails/{size}", response_class=Response)
+async def get_thumbnail(request: Request, digest: str, size: int) -> Response:
+    """Returns a JPEG thumbnail of an image at one of the configured sizes."""
+    if size not in settings.MEDIA_THUMBNAIL_SIZES or not parse_image_ref(
+        f"{digest}.jpg"
+    ):
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    return await serve_immutable(
+        request, thumbnail_path(digest, size), "image/jpeg", f'"{digest}-{size}"'
+    )
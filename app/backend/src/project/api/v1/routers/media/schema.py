@@ -0,0 +1,21 @@
+from typing import Dict
+
+from pydantic import BaseModel, ConfigDict
+
+from project.utils.utils import to_camel
+
+
+class ImageUploadResponse(BaseModel):
+    """A stored image and where its original and thumbnails are served."""
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+    ref: str
+    url: str
+    width: int
+    height: int
+    thumbnails: Dict[int, str]
@@ -0,0 +1,137 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict
+
+from fastapi import HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+from PIL import Image
+
+from project.api.v1.routers.media.schema import ImageUploadResponse
+from project.core.config import settings
+from project.core.executors import get_process_pool
+from project.core.media import (
+    IMMUTABLE_CACHE_CONTROL,
+    image_url,
+    original_path,
+    thumbnail_path,
+    thumbnail_url,
+    upload_dir,
+)
+from project.utils.images import FORMATS, UnsupportedImage, make_thumbnails
+
+
+def _already_stored(digest: str, thumbnails: Dict[int, Path]) -> Path | None:
+    if not all(path.is_file() for path in thumbnails.values()):
+        return None
+    for ext in FORMATS.values():
+        path = original_path(digest, ext)
+        if path.is_file():
+            return path
+    return None
+
+
+def _describe(path: Path) -> tuple[int, int]:
+    with Image.open(path) as image:
+        return image.size
+
+
+def _response(ref: str, width: int, height: int) -> ImageUploadResponse:
+    return ImageUploadResponse(
+        ref=ref,
+        url=image_url(ref),
+        width=width,
+        height=height,
+        thumbnails={
+            size: thumbnail_url(ref, size) or ""
+            for size in settings.MEDIA_THUMBNAIL_SIZES
+        },
+    )
+
+
+async def store_image(request: Request) -> ImageUploadResponse:
+    """
+    Stream the request body to disk while hashing it, then thumbnail it in
+    the process pool and move it into the content-addressed store.
+
+    The body is never held in memory as a whole, and an image that is
+    already stored is neither decoded nor written again.
+    """
+    if not request.headers.get("content-type", "").startswith("image/"):
+        raise HTTPException(
+            status_code=415,
+            detail="Send the image as the raw request body with an image/* type",
+        )
+
+    limit = settings.MEDIA_MAX_UPLOAD_BYTES
+    too_large = HTTPException(
+        status_code=413,
+        detail=f"Images must be at most {limit} bytes",
+    )
+    declared = request.headers.get("content-length")
+    if declared is not None and declared.isdigit() and int(declared) > limit:
+        raise too_large
+
+    await run_in_threadpool(upload_dir().mkdir, parents=True, exist_ok=True)
+    fd, name = tempfile.mkstemp(dir=upload_dir())
+    upload = Path(name)
+    try:
+        hasher = hashlib.sha256()
+        received = 0
+        with os.fdopen(fd, "wb") as file:
+            async for chunk in request.stream():
+                received += len(chunk)
+                if received > limit:
+                    raise too_large
+                hasher.update(chunk)
+                await run_in_threadpool(file.write, chunk)
+
+        if received == 0:
+            raise HTTPException(status_code=400, detail="Empty upload")
+
+        digest = hasher.hexdigest()
+        thumbnails = {
+            size: thumbnail_path(digest, size)
+            for size in settings.MEDIA_THUMBNAIL_SIZES
+        }
+
+        existing = await run_in_threadpool(_already_stored, digest, thumbnails)
+        if existing is not None:
+            width, height = await run_in_threadpool(_describe, existing)
+            return _response(existing.name, width, height)
+
+        loop = asyncio.get_running_loop()
+        try:
+            ext, width, height = await loop.run_in_executor(
+                get_process_pool(),
+                make_thumbnails,
+                str(upload),
+                {size: str(path) for size, path in thumbnails.items()},
+                settings.MEDIA_MAX_PIXELS,
+            )
+        except UnsupportedImage as exc:
+            raise HTTPException(status_code=415, detail=str(exc))
+
+        destination = original_path(digest, ext)
+        await run_in_threadpool(destination.parent.mkdir, parents=True, exist_ok=True)
+        await run_in_threadpool(os.replace, upload, destination)
+
+        return _response(destination.name, width, height)
+    finally:
+        upload.unlink(missing_ok=True)
+
+
+async def serve_immutable(
+    request: Request, path: Path, media_type: str, etag: str
+) -> Response:
+    """Serve a content-addressed file that may be cached forever."""
+    if not await run_in_threadpool(path.is_file):
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    headers = {"Cache-Control": IMMUTABLE_CACHE_CONTROL, "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type=media_type, headers=headers)
@@ -0,0 +1,46 @@
+import secrets
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from project.core.config import settings
+from project.core.metrics import METRICS_CONTENT_TYPE, render_metrics
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+metrics_bearer = HTTPBearer(auto_error=False)
+
+
+def verify_scrape_token(
+    credentials: Annotated[
+        Optional[HTTPAuthorizationCredentials], Depends(metrics_bearer)
+    ],
+) -> None:
+    """Only the scraper holding METRICS_TOKEN may read the metrics."""
+    if settings.METRICS_TOKEN is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if credentials is None or not secrets.compare_digest(
+        credentials.credentials.encode(),
+        settings.METRICS_TOKEN.get_secret_value().encode(),
+    ):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid scrape token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+@router.get(
+    "",
+    response_class=Response,
+    include_in_schema=False,
+    dependencies=[Depends(verify_scrape_token)],
+)
+async def get_metrics() -> Response:
+    """
+    Returns Prometheus metrics aggregated across all workers.
+    """
+    content = await run_in_threadpool(render_metrics)
+    return Response(content=content, media_type=METRICS_CONTENT_TYPE)
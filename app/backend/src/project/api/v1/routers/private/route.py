@@ -1,11 +1,15 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 
 from project.api.v1.routers.dependencies import (
+    SessionDep,
     admin_route,
     shared_route,
     student_route,
     teacher_route,
 )
+from project.api.v1.routers.media.route import IMAGE_BODY
+from project.api.v1.routers.media.schema import ImageUploadResponse
+from project.api.v1.routers.media.service import store_image
 from project.api.v1.routers.private.schema import AdminInfo, StudentInfo, TeacherInfo
 from project.models.user import User
 from project.schema.models.user_schema import UserSchema
@@ -24,6 +28,24 @@ def get_logged_in_user(user_in: shared_route) -> User:
     return user_in
 
 
+@router.put(
+    "/photo",
+    response_model=ImageUploadResponse,
+    openapi_extra=IMAGE_BODY,
+)
+async def upload_profile_photo(
+    request: Request, session: SessionDep, user_in: shared_route
+) -> ImageUploadResponse:
+    """
+    Stores an image and sets it as the current user's profile photo.
+    """
+    image = await store_image(request)
+    user_in.image_path = image.ref
+    await session.commit()
+
+    return image
+
+
 @router.get(
     "/admin",
     response_model=AdminInfo,
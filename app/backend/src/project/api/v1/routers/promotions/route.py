@@ -0,0 +1,105 @@
+import uuid
+
+from fastapi import APIRouter, HTTPException
+from sqlalchemy import select
+
+from project.api.v1.routers.dependencies import RedisDep, SessionDep, admin_route
+from project.api.v1.routers.promotions.schema import (
+    PromotionProgress,
+    PromotionReport,
+    PromotionRequest,
+)
+from project.api.v1.routers.promotions.service import (
+    apply_promotion,
+    drop_plan,
+    get_progress,
+    plan_promotion,
+    refresh_statistics,
+    set_progress,
+    summarize_plan,
+)
+from project.models.year import Year
+
+router = APIRouter(prefix="/promotions", tags=["Promotions"])
+
+
+@router.post("", response_model=PromotionReport)
+async def promote_students(
+    session: SessionDep,
+    redis: RedisDep,
+    promotion_in: PromotionRequest,
+    user_in: admin_route,
+) -> PromotionReport:
+    """
+    This endpoint will promote, retain or graduate every active student of
+    a year into the next one in a single transaction. With `dryRun` only
+    the report is returned. Poll `/promotions/{toYearId}/progress` to follow
+    a long rollover.
+    """
+    from_year = await session.get(Year, promotion_in.from_year_id)
+    if not from_year:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Year with ID {promotion_in.from_year_id} not found.",
+        )
+    # Locked so two rollovers into the same year cannot interleave
+    to_year = (
+        await session.execute(
+            select(Year).where(Year.id == promotion_in.to_year_id).with_for_update()
+        )
+    ).scalar_one_or_none()
+    if not to_year:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Year with ID {promotion_in.to_year_id} not found.",
+        )
+
+    # Plain IDs, the ORM objects expire when the dry run rolls back
+    from_year_id, to_year_id = from_year.id, to_year.id
+
+    # A dry run plans inside a savepoint and throws the plan away
+    savepoint = await session.begin_nested() if promotion_in.dry_run else None
+
+    await set_progress(redis, to_year_id, "planning")
+    planned = await plan_promotion(
+        session, from_year_id, to_year_id, promotion_in.pass_threshold
+    )
+    grades = await summarize_plan(session)
+
+    if savepoint is not None:
+        await savepoint.rollback()
+    else:
+        await set_progress(redis, to_year_id, "links", planned)
+        await apply_promotion(session, to_year_id)
+        await drop_plan(session)
+        await set_progress(redis, to_year_id, "statistics", planned)
+        await refresh_statistics(session, from_year_id, to_year_id)
+    await session.commit()
+    await set_progress(redis, to_year_id, "done", planned)
+
+    return PromotionReport(
+        from_year_id=from_year_id,
+        to_year_id=to_year_id,
+        dry_run=promotion_in.dry_run,
+        promoted=sum(grade.promoted for grade in grades),
+        retained=sum(grade.retained for grade in grades),
+        graduated=sum(grade.graduated for grade in grades),
+        unmapped=sum(grade.unmapped for grade in grades),
+        grades=grades,
+    )
+
+
+@router.get("/{to_year_id}/progress", response_model=PromotionProgress)
+async def get_promotion_progress(
+    redis: RedisDep,
+    to_year_id: uuid.UUID,
+    user_in: admin_route,
+) -> PromotionProgress:
+    """This endpoint will return how far the last rollover into a year got."""
+    progress = await get_progress(redis, to_year_id)
+    if progress is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No promotion into year {to_year_id} has run recently.",
+        )
+    return progress
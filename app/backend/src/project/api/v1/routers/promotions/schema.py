@@ -0,0 +1,80 @@
+import uuid
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from typing_extensions import Self
+
+from project.utils.enum import GradeEnum
+from project.utils.utils import to_camel
+
+PromotionStage = Literal["planning", "links", "statistics", "done"]
+
+
+class PromotionRequest(BaseModel):
+    """
+    Moves the students of `from_year` into `to_year`: those with a final
+    score of at least `pass_threshold` go up one grade, or graduate from
+    the last one, the others repeat their grade.
+    """
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+    from_year_id: uuid.UUID
+    to_year_id: uuid.UUID
+    pass_threshold: float = Field(ge=0)
+    dry_run: bool = False
+
+    @model_validator(mode="after")
+    def _distinct_years(self) -> Self:
+        if self.from_year_id == self.to_year_id:
+            raise ValueError("fromYearId and toYearId must differ")
+        return self
+
+
+class GradePromotion(BaseModel):
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+    grade_id: uuid.UUID
+    grade: GradeEnum
+    promoted: int = 0
+    retained: int = 0
+    graduated: int = 0
+    # Students whose next grade does not exist in the new year
+    unmapped: int = 0
+
+
+class PromotionReport(BaseModel):
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+    from_year_id: uuid.UUID
+    to_year_id: uuid.UUID
+    dry_run: bool
+    promoted: int
+    retained: int
+    graduated: int
+    unmapped: int
+    grades: List[GradePromotion]
+
+
+class PromotionProgress(BaseModel):
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+    to_year_id: uuid.UUID
+    stage: PromotionStage
+    students: Optional[int] = None
@@ -0,0 +1,279 @@
+"""
+Year rollover done set-based: every student's outcome is worked out into a
+temporary table by one INSERT ... SELECT, and each table of the new year is
+then filled from it with a single statement, whatever the number of
+students.
+"""
+
+import uuid
+from typing import Dict, List, Optional
+
+from redis.asyncio import Redis
+from sqlalchemy import (
+    UUID,
+    Column,
+    MetaData,
+    String,
+    Table,
+    and_,
+    case,
+    exists,
+    func,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from project.api.v1.routers.promotions.schema import (
+    GradePromotion,
+    PromotionProgress,
+    PromotionStage,
+)
+from project.api.v1.routers.statistics.service import rebuild_year_stats
+from project.core.tenancy import tenant_key
+from project.models import (
+    AcademicTerm,
+    Grade,
+    Stream,
+    Student,
+    StudentAcademicTermLink,
+    StudentGradeLink,
+    StudentStreamLink,
+    StudentYearLink,
+    StudentYearRecord,
+)
+from project.utils.enum import GradeEnum, StudentApplicationStatusEnum
+
+PROMOTED = "promoted"
+RETAINED = "retained"
+GRADUATED = "graduated"
+UNMAPPED = "unmapped"
+
+LAST_ORDINAL = max(grade.ordinal for grade in GradeEnum)
+
+PROGRESS_TTL = 60 * 60 * 24
+
+# Lives for one transaction only, so it is kept out of Base.metadata
+promotion_plan = Table(
+    "promotion_plan",
+    MetaData(),
+    Column("student_id", UUID(), primary_key=True),
+    Column("from_grade_id", UUID(), nullable=False),
+    Column("to_grade_id", UUID()),
+    Column("to_stream_id", UUID()),
+    Column("outcome", String(10), nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+
+async def plan_promotion(
+    session: AsyncSession,
+    from_year_id: uuid.UUID,
+    to_year_id: uuid.UUID,
+    pass_threshold: float,
+) -> int:
+    """
+    Fill `promotion_plan` with the outcome and new grade and stream of every
+    active student with a record in `from_year_id`. Streams carry over by
+    name. Returns the number of students planned.
+    """
+    connection = await session.connection()
+    await connection.run_sync(promotion_plan.create)
+
+    old_grade = aliased(Grade)
+    new_grade = aliased(Grade)
+    old_stream = aliased(Stream)
+    new_stream = aliased(Stream)
+
+    # NULL for students without a score, which counts as not passed
+    passed = StudentYearRecord.final_score >= pass_threshold
+    outcome = case(
+        (and_(passed, old_grade.ordinal == LAST_ORDINAL), GRADUATED),
+        (new_grade.id.is_(None), UNMAPPED),
+        (passed, PROMOTED),
+        else_=RETAINED,
+    )
+    plan = (
+        select(
+            StudentYearRecord.student_id,
+            old_grade.id,
+            new_grade.id,
+            new_stream.id,
+            outcome,
+        )
+        .join(Student, Student.id == StudentYearRecord.student_id)
+        .join(old_grade, old_grade.id == StudentYearRecord.grade_id)
+        .outerjoin(
+            new_grade,
+            and_(
+                new_grade.year_id == to_year_id,
+                new_grade.ordinal == old_grade.ordinal + case((passed, 1), else_=0),
+            ),
+        )
+        .outerjoin(old_stream, old_stream.id == StudentYearRecord.stream_id)
+        .outerjoin(
+            new_stream,
+            and_(
+                new_stream.grade_id == new_grade.id,
+                new_stream.name == old_stream.name,
+            ),
+        )
+        .where(
+            StudentYearRecord.year_id == from_year_id,
+            Student.status == StudentApplicationStatusEnum.ACTIVE,
+        )
+        # The latest record, should a student have more than one
+        .distinct(StudentYearRecord.student_id)
+        .order_by(StudentYearRecord.student_id, StudentYearRecord.created_at.desc())
+    )
+    result = await session.execute(
+        promotion_plan.insert().from_select(
+            [column.name for column in promotion_plan.c], plan
+        )
+    )
+    return result.rowcount
+
+
+async def drop_plan(session: AsyncSession) -> None:
+    """Drop `promotion_plan` early, for sessions that outlive the commit."""
+    connection = await session.connection()
+    await connection.run_sync(promotion_plan.drop, checkfirst=True)
+
+
+async def apply_promotion(session: AsyncSession, to_year_id: uuid.UUID) -> None:
+    """
+    Enrol the planned students in `to_year_id`: year, grade, stream and term
+    links, a fresh year record and their current grade. Graduates are only
+    marked as graduated. Running it again adds nothing twice.
+    """
+    plan = promotion_plan.c
+    moving = plan.to_grade_id.is_not(None)
+    to_year = literal(to_year_id, UUID())
+
+    await session.execute(
+        insert(StudentYearLink)
+        .from_select(
+            ["student_id", "year_id"],
+            select(plan.student_id, to_year).where(moving),
+        )
+        .on_conflict_do_nothing()
+    )
+    await session.execute(
+        insert(StudentGradeLink)
+        .from_select(
+            ["student_id", "grade_id"],
+            select(plan.student_id, plan.to_grade_id).where(moving),
+        )
+        .on_conflict_do_nothing()
+    )
+    await session.execute(
+        insert(StudentStreamLink)
+        .from_select(
+            ["student_id", "stream_id"],
+            select(plan.student_id, plan.to_stream_id).where(
+                plan.to_stream_id.is_not(None)
+            ),
+        )
+        .on_conflict_do_nothing()
+    )
+    await session.execute(
+        insert(StudentAcademicTermLink)
+        .from_select(
+            ["student_id", "academic_term_id"],
+            select(plan.student_id, AcademicTerm.id).where(
+                moving, AcademicTerm.year_id == to_year_id
+            ),
+        )
+        .on_conflict_do_nothing()
+    )
+    await session.execute(
+        insert(StudentYearRecord).from_select(
+            ["id", "student_id", "grade_id", "year_id", "stream_id"],
+            select(
+                func.gen_random_uuid(),
+                plan.student_id,
+                plan.to_grade_id,
+                to_year,
+                plan.to_stream_id,
+            ).where(
+                moving,
+                ~exists().where(
+                    StudentYearRecord.student_id == plan.student_id,
+                    StudentYearRecord.year_id == to_year_id,
+                ),
+            ),
+        )
+    )
+
+    await session.execute(
+        update(Student)
+        .where(Student.id == plan.student_id, moving)
+        .values(registered_for_grade_id=plan.to_grade_id)
+        .execution_options(synchronize_session=False)
+    )
+    await session.execute(
+        update(Student)
+        .where(Student.id == plan.student_id, plan.outcome == GRADUATED)
+        .values(status=StudentApplicationStatusEnum.GRADUATED)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def refresh_statistics(
+    session: AsyncSession, from_year_id: uuid.UUID, to_year_id: uuid.UUID
+) -> None:
+    """Students changed year wholesale, recounting is cheaper than diffing."""
+    await rebuild_year_stats(session, from_year_id)
+    await rebuild_year_stats(session, to_year_id)
+
+
+async def summarize_plan(session: AsyncSession) -> List[GradePromotion]:
+    """Outcome counts per old grade, lowest grade first."""
+    plan = promotion_plan.c
+    rows = await session.execute(
+        select(Grade.id, Grade.grade, plan.outcome, func.count())
+        .join(Grade, Grade.id == plan.from_grade_id)
+        .group_by(Grade.id, Grade.grade, Grade.ordinal, plan.outcome)
+        .order_by(Grade.ordinal)
+    )
+
+    grades: Dict[uuid.UUID, GradePromotion] = {}
+    for grade_id, grade, outcome, count in rows:
+        summary = grades.setdefault(
+            grade_id, GradePromotion(grade_id=grade_id, grade=grade)
+        )
+        setattr(summary, outcome, count)
+    return list(grades.values())
+
+
+def _progress_key(to_year_id: uuid.UUID) -> str:
+    return tenant_key(f"promotion:{to_year_id}")
+
+
+async def set_progress(
+    redis: Redis,
+    to_year_id: uuid.UUID,
+    stage: PromotionStage,
+    students: Optional[int] = None,
+) -> None:
+    key = _progress_key(to_year_id)
+    mapping = {"stage": stage}
+    if students is not None:
+        mapping["students"] = str(students)
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.hset(key, mapping=mapping)
+        pipe.expire(key, PROGRESS_TTL)
+        await pipe.execute()
+
+
+async def get_progress(
+    redis: Redis, to_year_id: uuid.UUID
+) -> Optional[PromotionProgress]:
+    progress = await redis.hgetall(_progress_key(to_year_id))  # ty:ignore[invalid-await]
+    if not progress:
+        return None
+    return PromotionProgress(to_year_id=to_year_id, **progress)
@@ -1,12 +1,16 @@
 #!/usr/bin/python3
 """Public views module for the API"""
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException
+import uuid
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Query
 from pydantic import NameEmail
 from starlette import status
 
 from project.api.v1.routers.auth.service import send_verification_email
-from project.api.v1.routers.dependencies import SessionDep, admin_route
+from project.api.v1.routers.dependencies import RedisDep, SessionDep, admin_route
+from project.api.v1.routers.idempotency import IdempotentRoute
 from project.api.v1.routers.registrations.schema import (
     AdminRegistration,
     EmployeeRegistrationForm,
@@ -17,6 +21,7 @@ from project.api.v1.routers.registrations.schema import (
     ParentRegistrationForm,
     RegistrationResponse,
     RegistrationStep,
+    StudentDraftSubmit,
     StudentRegistrationForm,
     StudRegStep1,
     StudRegStep2,
@@ -24,17 +29,29 @@ from project.api.v1.routers.registrations.schema import (
     StudRegStep4,
     StudRegStep5,
 )
-from project.core.security import get_password_hash
+from project.api.v1.routers.registrations.service import (
+    create_employee,
+    create_student,
+    save_draft_step,
+    submitted_draft,
+)
+from project.core.security import get_password_hash_async
 from project.models import AuthIdentity, User
 from project.models.admin import Admin
-from project.models.employee import Employee
-from project.models.grade import Grade
 from project.models.parent import Parent
-from project.models.parent_student_link import ParentStudentLink
-from project.models.student import Student
 from project.utils.enum import AuthProviderEnum, RoleEnum
 
-router = APIRouter(prefix="/register", tags=["registration"])
+STUDENT_DRAFT = "student"
+STUDENT_STEPS = (1, 2, 3, 4, 5)
+EMPLOYEE_DRAFT = "employee"
+EMPLOYEE_STEPS = (1, 2, 3, 4)
+
+# Continues an existing draft, or starts one when left out
+DraftIdQuery = Annotated[Optional[uuid.UUID], Query(alias="draftId")]
+
+router = APIRouter(
+    prefix="/register", tags=["registration"], route_class=IdempotentRoute
+)
 
 
 @router.post("/admins", status_code=201, response_model=RegistrationResponse)
@@ -42,10 +59,10 @@ async def register_new_admin(
     session: SessionDep,
     admin_data: AdminRegistration,
     user_in: admin_route,
-    background_tasks: BackgroundTasks,
+    redis: RedisDep,
 ) -> RegistrationResponse:
     """Registers a new admin in the system."""
-    hash_password = get_password_hash(admin_data.password)
+    hash_password = await get_password_hash_async(admin_data.password)
 
     user = User(
         username=admin_data.username,
@@ -78,9 +95,8 @@ async def register_new_admin(
     session.add(provider)
     await session.commit()
 
-    background_tasks.add_task(
-        send_verification_email,
-        NameEmail(name=new_admin.first_name, email=admin_data.email),
+    await send_verification_email(
+        NameEmail(name=new_admin.first_name, email=admin_data.email), redis
     )
 
     return RegistrationResponse(
@@ -89,43 +105,63 @@ async def register_new_admin(
 
 
 @router.post("/students/step1", response_model=RegistrationStep)
-def register_student_step1(
-    session: SessionDep, student_data: StudRegStep1
+async def register_student_step1(
+    redis: RedisDep,
+    student_data: StudRegStep1,
+    draft_id: DraftIdQuery = None,
 ) -> RegistrationStep:
-    """Validate student data for each step"""
-    return RegistrationStep(message="Student Step 1 Successful")
+    """Validate student data for each step and keep it in the draft"""
+    draft_id = draft_id or uuid.uuid4()
+    await save_draft_step(redis, STUDENT_DRAFT, draft_id, 1, student_data)
+    return RegistrationStep(message="Student Step 1 Successful", draft_id=draft_id)
 
 
 @router.post("/students/step2", response_model=RegistrationStep)
-def register_student_step2(
-    session: SessionDep, student_data: StudRegStep2
+async def register_student_step2(
+    redis: RedisDep,
+    student_data: StudRegStep2,
+    draft_id: DraftIdQuery = None,
 ) -> RegistrationStep:
-    """Validate student data for each step"""
-    return RegistrationStep(message="Student Step 2 Successful")
+    """Validate student data for each step and keep it in the draft"""
+    draft_id = draft_id or uuid.uuid4()
+    await save_draft_step(redis, STUDENT_DRAFT, draft_id, 2, student_data)
+    return RegistrationStep(message="Student Step 2 Successful", draft_id=draft_id)
 
 
 @router.post("/students/step3", response_model=RegistrationStep)
-def register_student_step3(
-    session: SessionDep, student_data: StudRegStep3
+async def register_student_step3(
+    redis: RedisDep,
+    student_data: StudRegStep3,
+    draft_id: DraftIdQuery = None,
 ) -> RegistrationStep:
-    """Validate student data for each step"""
-    return RegistrationStep(message="Student Step 3 Successful")
+    """Validate student data for each step and keep it in the draft"""
+    draft_id = draft_id or uuid.uuid4()
+    await save_draft_step(redis, STUDENT_DRAFT, draft_id, 3, student_data)
+    return RegistrationStep(message="Student Step 3 Successful", draft_id=draft_id)
 
 
 @router.post("/students/step4", response_model=RegistrationStep)
-def register_student_step4(
-    session: SessionDep, student_data: StudRegStep4
+async def register_student_step4(
+    redis: RedisDep,
+    student_data: StudRegStep4,
+    draft_id: DraftIdQuery = None,
 ) -> RegistrationStep:
-    """Validate student data for each step"""
-    return RegistrationStep(message="Student Step 4 Successful")
+    """Validate student data for each step and keep it in the draft"""
+    draft_id = draft_id or uuid.uuid4()
+    await save_draft_step(redis, STUDENT_DRAFT, draft_id, 4, student_data)
+    return RegistrationStep(message="Student Step 4 Successful", draft_id=draft_id)
 
 
 @router.post("/students/step5", response_model=RegistrationStep)
-def register_student_step5(
-    session: SessionDep, student_data: StudRegStep5
+async def register_student_step5(
+    redis: RedisDep,
+    student_data: StudRegStep5,
+    draft_id: DraftIdQuery = None,
 ) -> RegistrationStep:
-    """Validate student data for each step"""
-    return RegistrationStep(message="Student Step 5 Successful")
+    """Validate student data for each step and keep it in the draft"""
+    draft_id = draft_id or uuid.uuid4()
+    await save_draft_step(redis, STUDENT_DRAFT, draft_id, 5, student_data)
+    return RegistrationStep(message="Student Step 5 Successful", draft_id=draft_id)
 
 
 @router.post("/parents", status_code=201)
@@ -163,47 +199,7 @@ async def register_new_student(
     },
 ) -> RegistrationResponse:
     """Registers a new student in the system."""
-    grade = await session.get(Grade, student_data.registered_for_grade_id)
-    if not grade:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid grade"
-        )
-    parent = await session.get(Parent, student_data.parent_id)
-    if not parent:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid parent"
-        )
-
-    # Create SQLAlchemy model instance
-    new_student = Student(
-        first_name=student_data.first_name,
-        father_name=student_data.father_name,
-        grand_father_name=student_data.grand_father_name,
-        date_of_birth=student_data.date_of_birth,
-        gender=student_data.gender,
-        city=student_data.city,
-        state=student_data.state,
-        postal_code=student_data.postal_code,
-        nationality=student_data.nationality,
-        blood_type=student_data.blood_type,
-        previous_school=student_data.previous_school,
-        transportation=student_data.transportation,
-        has_medical_condition=student_data.has_medical_condition,
-        medical_details=student_data.medical_details,
-        has_disability=student_data.has_disability,
-        disability_details=student_data.disability_details,
-        is_transfer=student_data.is_transfer,
-        registered_for_grade_id=grade.id,
-    )
-
-    session.add(new_student)
-    await session.flush()
-
-    student_parent_link = ParentStudentLink(
-        parent_id=parent.id, student_id=new_student.id
-    )
-
-    session.add(student_parent_link)
+    new_student = await create_student(session, student_data)
     await session.commit()
 
     return RegistrationResponse(
@@ -212,43 +208,55 @@ async def register_new_student(
 
 
 @router.post("/employees/step1", response_model=RegistrationStep)
-def register_employee_step1(
-    session: SessionDep,
+async def register_employee_step1(
+    redis: RedisDep,
     employee_data: EmployeeRegStep1,
     user_in: admin_route,
+    draft_id: DraftIdQuery = None,
 ) -> RegistrationStep:
-    """Validate employee data for each step"""
-    return RegistrationStep(message="Employee Step 1 Successful")
+    """Validate employee data for each step and keep it in the draft"""
+    draft_id = draft_id or uuid.uuid4()
+    await save_draft_step(redis, EMPLOYEE_DRAFT, draft_id, 1, employee_data)
+    return RegistrationStep(message="Employee Step 1 Successful", draft_id=draft_id)
 
 
 @router.post("/employees/step2", response_model=RegistrationStep)
-def register_employee_step2(
-    session: SessionDep,
+async def register_employee_step2(
+    redis: RedisDep,
     employee_data: EmployeeRegStep2,
     user_in: admin_route,
+    draft_id: DraftIdQuery = None,
 ) -> RegistrationStep:
-    """Validate employee data for each step"""
-    return RegistrationStep(message="Employee Step 2 Successful")
+    """Validate employee data for each step and keep it in the draft"""
+    draft_id = draft_id or uuid.uuid4()
+    await save_draft_step(redis, EMPLOYEE_DRAFT, draft_id, 2, employee_data)
+    return RegistrationStep(message="Employee Step 2 Successful", draft_id=draft_id)
 
 
 @router.post("/employees/step3", response_model=RegistrationStep)
-def register_employee_step3(
-    session: SessionDep,
+async def register_employee_step3(
+    redis: RedisDep,
     employee_data: EmployeeRegStep3,
     user_in: admin_route,
+    draft_id: DraftIdQuery = None,
 ) -> RegistrationStep:
-    """Validate employee data for each step"""
-    return RegistrationStep(message="Employee Step 3 Successful")
+    """Validate employee data for each step and keep it in the draft"""
+    draft_id = draft_id or uuid.uuid4()
+    await save_draft_step(redis, EMPLOYEE_DRAFT, draft_id, 3, employee_data)
+    return RegistrationStep(message="Employee Step 3 Successful", draft_id=draft_id)
 
 
 @router.post("/employees/step4", response_model=RegistrationStep)
-def register_employee_step4(
-    session: SessionDep,
+async def register_employee_step4(
+    redis: RedisDep,
     employee_data: EmployeeRegStep4,
     user_in: admin_route,
+    draft_id: DraftIdQuery = None,
 ) -> RegistrationStep:
-    """Validate employee data for each step"""
-    return RegistrationStep(message="Employee Step 4 Successful")
+    """Validate employee data for each step and keep it in the draft"""
+    draft_id = draft_id or uuid.uuid4()
+    await save_draft_step(redis, EMPLOYEE_DRAFT, draft_id, 4, employee_data)
+    return RegistrationStep(message="Employee Step 4 Successful", draft_id=draft_id)
 
 
 @router.post("/employees", status_code=201, response_model=RegistrationResponse)
@@ -261,31 +269,63 @@ async def register_new_employee(
     Registers a new user (Admin, Student, Employee) in the system.
     """
 
-    # Create SQLAlchemy model instance
-    new_employee = Employee(
-        first_name=employee_data.first_name,
-        father_name=employee_data.father_name,
-        grand_father_name=employee_data.grand_father_name,
-        date_of_birth=employee_data.date_of_birth,
-        gender=employee_data.gender,
-        nationality=employee_data.nationality,
-        social_security_number=employee_data.social_security_number,
-        city=employee_data.city,
-        state=employee_data.state,
-        country=employee_data.country,
-        emergency_contact_name=employee_data.emergency_contact_name,
-        emergency_contact_relation=employee_data.emergency_contact_relation,
-        emergency_contact_phone=employee_data.emergency_contact_phone,
-        highest_education=employee_data.highest_education,
-        university=employee_data.university,
-        graduation_year=employee_data.graduation_year,
-        gpa=employee_data.gpa,
-        position=employee_data.position,
-        years_of_experience=employee_data.years_of_experience,
+    new_employee = create_employee(session, employee_data)
+    await session.commit()
+
+    return RegistrationResponse(
+        id=new_employee.id, message="Employee Registered Successfully"
     )
 
-    session.add(new_employee)
-    await session.commit()
+
+@router.post(
+    "/students/drafts/{draft_id}",
+    status_code=201,
+    response_model=RegistrationResponse,
+)
+async def submit_student_draft(
+    session: SessionDep,
+    redis: RedisDep,
+    draft_id: uuid.UUID,
+    submit: StudentDraftSubmit,
+) -> RegistrationResponse:
+    """Registers the student collected by the wizard steps of a draft."""
+    async with submitted_draft(
+        redis,
+        STUDENT_DRAFT,
+        draft_id,
+        STUDENT_STEPS,
+        StudentRegistrationForm,
+        **submit.model_dump(),
+    ) as student_data:
+        new_student = await create_student(session, student_data)
+        await session.commit()
+
+    return RegistrationResponse(
+        id=new_student.id, message="Student Registered Successfully"
+    )
+
+
+@router.post(
+    "/employees/drafts/{draft_id}",
+    status_code=201,
+    response_model=RegistrationResponse,
+)
+async def submit_employee_draft(
+    session: SessionDep,
+    redis: RedisDep,
+    draft_id: uuid.UUID,
+    user_in: admin_route,
+) -> RegistrationResponse:
+    """Registers the employee collected by the wizard steps of a draft."""
+    async with submitted_draft(
+        redis,
+        EMPLOYEE_DRAFT,
+        draft_id,
+        EMPLOYEE_STEPS,
+        EmployeeRegistrationForm,
+    ) as employee_data:
+        new_employee = create_employee(session, employee_data)
+        await session.commit()
 
     return RegistrationResponse(
         id=new_employee.id, message="Employee Registered Successfully"
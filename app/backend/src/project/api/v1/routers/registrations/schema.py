@@ -25,7 +25,14 @@ from project.utils.utils import to_camel
 
 
 class RegistrationStep(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
     message: str
+    # Send back with the next step, and to submit the draft at the end
+    draft_id: uuid.UUID
 
 
 class RegistrationResponse(BaseModel):
@@ -176,6 +183,21 @@ class StudentRegistrationForm(
     )
 
 
+class StudentDraftSubmit(BaseModel):
+    """The fields of a student registration not covered by the wizard steps."""
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+    parent_id: uuid.UUID
+    status: StudentApplicationStatusEnum = Field(
+        default=StudentApplicationStatusEnum.PENDING
+    )
+
+
 class EmployeeRegStep1(BaseModel):
     model_config = ConfigDict(
         from_attributes=True,
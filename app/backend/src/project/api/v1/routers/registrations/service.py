@@ -0,0 +1,202 @@
+import json
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, Dict, Sequence, Type, TypeVar
+
+from fastapi import HTTPException
+from pydantic import BaseModel, ValidationError
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from project.api.v1.routers.registrations.schema import (
+    EmployeeRegistrationForm,
+    StudentRegistrationForm,
+)
+from project.api.v1.routers.statistics.service import (
+    apply_stat_changes,
+    student_stat_keys,
+)
+from project.core.config import settings
+from project.core.tenancy import tenant_key
+from project.models.employee import Employee
+from project.models.grade import Grade
+from project.models.parent import Parent
+from project.models.parent_student_link import ParentStudentLink
+from project.models.student import Student
+
+FormT = TypeVar("FormT", bound=BaseModel)
+
+
+def draft_key(kind: str, draft_id: uuid.UUID) -> str:
+    return tenant_key(f"registration:draft:{kind}:{draft_id}")
+
+
+async def save_draft_step(
+    redis: Redis,
+    kind: str,
+    draft_id: uuid.UUID,
+    step: int,
+    data: BaseModel,
+) -> None:
+    """
+    Store one validated wizard step. Each step is its own hash field, so
+    steps sent out of order or twice simply overwrite themselves.
+    """
+    key = draft_key(kind, draft_id)
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.hset(key, f"step{step}", data.model_dump_json())
+        pipe.expire(key, settings.REGISTRATION_DRAFT_TTL_SECONDS)
+        await pipe.execute()
+
+
+def claimed_key(kind: str, draft_id: uuid.UUID) -> str:
+    return f"{draft_key(kind, draft_id)}:submitting"
+
+
+@asynccontextmanager
+async def submitted_draft(
+    redis: Redis,
+    kind: str,
+    draft_id: uuid.UUID,
+    steps: Sequence[int],
+    form: Type[FormT],
+    **extra: Any,
+) -> AsyncGenerator[FormT, None]:
+    """
+    Claim a draft and merge its stored steps, plus `extra`, into the full
+    form. The draft is renamed away first, so a second submit of the same
+    draft cannot register it twice. It is deleted once the block finishes,
+    and given back if the block or the merge fails.
+    """
+    key = draft_key(kind, draft_id)
+    claimed = claimed_key(kind, draft_id)
+    try:
+        if not await redis.renamenx(key, claimed):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Registration draft {draft_id} is already being submitted.",
+            )
+    except ResponseError:
+        # RENAMENX fails when there is no draft to rename
+        raise HTTPException(
+            status_code=404,
+            detail=f"Registration draft {draft_id} not found or expired.",
+        )
+
+    try:
+        stored = await redis.hgetall(claimed)  # ty:ignore[invalid-await]
+        yield _merge_steps(stored, steps, form, **extra)
+    except BaseException:
+        # Keeps its TTL, so the client can fix it or simply submit again
+        await redis.rename(claimed, key)
+        raise
+    await redis.delete(claimed)
+
+
+def _merge_steps(
+    stored: Dict[str, str],
+    steps: Sequence[int],
+    form: Type[FormT],
+    **extra: Any,
+) -> FormT:
+    missing = [step for step in steps if f"step{step}" not in stored]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Registration steps {missing} have not been completed.",
+        )
+
+    data: Dict[str, Any] = {}
+    for step in steps:
+        data.update(json.loads(stored[f"step{step}"]))
+    try:
+        return form.model_validate({**data, **extra})
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=json.loads(e.json()),
+        )
+
+
+async def create_student(
+    session: AsyncSession, student_data: StudentRegistrationForm
+) -> Student:
+    """Add a student linked to its parent. The caller commits."""
+    grade = await session.get(Grade, student_data.registered_for_grade_id)
+    if not grade:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid grade"
+        )
+    parent = await session.get(Parent, student_data.parent_id)
+    if not parent:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid parent"
+        )
+
+    # Create SQLAlchemy model instance
+    new_student = Student(
+        first_name=student_data.first_name,
+        father_name=student_data.father_name,
+        grand_father_name=student_data.grand_father_name,
+        date_of_birth=student_data.date_of_birth,
+        gender=student_data.gender,
+        city=student_data.city,
+        state=student_data.state,
+        postal_code=student_data.postal_code,
+        nationality=student_data.nationality,
+        blood_type=student_data.blood_type,
+        previous_school=student_data.previous_school,
+        transportation=student_data.transportation,
+        has_medical_condition=student_data.has_medical_condition,
+        medical_details=student_data.medical_details,
+        has_disability=student_data.has_disability,
+        disability_details=student_data.disability_details,
+        is_transfer=student_data.is_transfer,
+        registered_for_grade_id=grade.id,
+    )
+
+    session.add(new_student)
+    await session.flush()
+
+    student_parent_link = ParentStudentLink(
+        parent_id=parent.id, student_id=new_student.id
+    )
+
+    session.add(student_parent_link)
+    await apply_stat_changes(
+        session, [], await student_stat_keys(session, [new_student.id])
+    )
+    return new_student
+
+
+def create_employee(
+    session: AsyncSession, employee_data: EmployeeRegistrationForm
+) -> Employee:
+    """Add an employee. The caller commits."""
+    # Create SQLAlchemy model instance
+    new_employee = Employee(
+        first_name=employee_data.first_name,
+        father_name=employee_data.father_name,
+        grand_father_name=employee_data.grand_father_name,
+        date_of_birth=employee_data.date_of_birth,
+        gender=employee_data.gender,
+        nationality=employee_data.nationality,
+        social_security_number=employee_data.social_security_number,
+        city=employee_data.city,
+        state=employee_data.state,
+        country=employee_data.country,
+        emergency_contact_name=employee_data.emergency_contact_name,
+        emergency_contact_relation=employee_data.emergency_contact_relation,
+        emergency_contact_phone=employee_data.emergency_contact_phone,
+        highest_education=employee_data.highest_education,
+        university=employee_data.university,
+        graduation_year=employee_data.graduation_year,
+        gpa=employee_data.gpa,
+        position=employee_data.position,
+        years_of_experience=employee_data.years_of_experience,
+    )
+
+    session.add(new_employee)
+    return new_employee
@@ -0,0 +1,44 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+
+from project.api.v1.routers.dependencies import SessionDep, admin_route
+from project.api.v1.routers.report_cards.schema import ReportCardParams
+from project.api.v1.routers.report_cards.service import (
+    load_report_cards,
+    zip_report_cards,
+)
+from project.api.v1.routers.schema import HTTPError
+
+router = APIRouter(prefix="/report-cards", tags=["Report Cards"])
+
+
+@router.get(
+    "",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"application/zip": {}}},
+        404: {"model": HTTPError, "description": "Year or term not found"},
+    },
+)
+async def download_report_cards(
+    session: SessionDep,
+    query: Annotated[ReportCardParams, Query()],
+    user_in: admin_route,
+) -> StreamingResponse:
+    """
+    Returns a zip of report cards, one PDF or PNG per student, for a term or
+    for every term of a year.
+    """
+    cards = await load_report_cards(session, query)
+    scope = query.term_id or query.year_id
+
+    return StreamingResponse(
+        zip_report_cards(cards, query.format),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": (f'attachment; filename="report-cards-{scope}.zip"'),
+            "X-Report-Card-Count": str(len(cards)),
+        },
+    )
@@ -0,0 +1,33 @@
+import uuid
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from typing_extensions import Self
+
+from project.utils.report_card import CardFormat
+from project.utils.utils import to_camel
+
+
+class ReportCardParams(BaseModel):
+    """
+    Selects the cards to print: every term of a year, or a single term,
+    optionally narrowed to one grade or section.
+    """
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+    year_id: Optional[uuid.UUID] = Field(default=None)
+    term_id: Optional[uuid.UUID] = Field(default=None)
+    grade_id: Optional[uuid.UUID] = Field(default=None)
+    section_id: Optional[uuid.UUID] = Field(default=None)
+    format: CardFormat = "pdf"
+
+    @model_validator(mode="after")
+    def _require_year_or_term(self) -> Self:
+        if (self.year_id is None) == (self.term_id is None):
+            raise ValueError("Provide exactly one of yearId or termId")
+        return self
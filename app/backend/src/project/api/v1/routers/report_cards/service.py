@@ -0,0 +1,315 @@
+import asyncio
+import hashlib
+import io
+import os
+import uuid
+import zipfile
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from project.api.v1.routers.report_cards.schema import ReportCardParams
+from project.core.config import settings
+from project.core.executors import get_process_pool
+from project.models import (
+    AcademicTerm,
+    Grade,
+    MarkList,
+    Section,
+    Student,
+    StudentTermRecord,
+    StudentYearRecord,
+    Subject,
+    Year,
+)
+from project.utils.report_card import (
+    RENDER_VERSION,
+    CardFormat,
+    ReportCard,
+    SubjectRow,
+    render_card,
+)
+
+
+@dataclass
+class _CardBuilder:
+    """Collects one student's rows before they are frozen into a card."""
+
+    student_name: str
+    grade: str
+    section: str
+    updated_at: datetime
+    averages: List[Optional[float]]
+    ranks: List[Optional[int]]
+    scores: Dict[str, List[Optional[float]]] = field(default_factory=dict)
+
+    def touch(self, updated_at: datetime) -> None:
+        self.updated_at = max(self.updated_at, updated_at)
+
+
+async def load_report_cards(
+    session: AsyncSession, params: ReportCardParams
+) -> List[ReportCard]:
+    """
+    Gather the data for every card selected by `params`.
+
+    Three set-based queries cover any number of students: the term records,
+    the per-subject totals of their mark lists and the year records.
+    """
+    if params.term_id is not None:
+        term = await session.get(AcademicTerm, params.term_id)
+        if not term:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Academic term with ID {params.term_id} not found.",
+            )
+        terms = [term]
+        year_id = term.year_id
+    elif params.year_id is not None:
+        year_id = params.year_id
+        terms = list(
+            (
+                await session.execute(
+                    select(AcademicTerm)
+                    .where(AcademicTerm.year_id == year_id)
+                    .order_by(AcademicTerm.name)
+                )
+            ).scalars()
+        )
+    else:
+        raise HTTPException(
+            status_code=400, detail="Either yearId or termId is required."
+        )
+
+    year = await session.get(Year, year_id)
+    if not year:
+        raise HTTPException(
+            status_code=404, detail=f"Year with ID {year_id} not found."
+        )
+
+    column = {term.id: i for i, term in enumerate(terms)}
+    selected = [StudentTermRecord.academic_term_id.in_(column)]
+    if params.grade_id is not None:
+        selected.append(StudentTermRecord.grade_id == params.grade_id)
+    if params.section_id is not None:
+        selected.append(StudentTermRecord.section_id == params.section_id)
+
+    records = await session.execute(
+        select(
+            StudentTermRecord.id,
+            StudentTermRecord.student_id,
+            StudentTermRecord.academic_term_id,
+            StudentTermRecord.average,
+            StudentTermRecord.rank,
+            StudentTermRecord.updated_at,
+            Student.first_name,
+            Student.father_name,
+            Grade.grade,
+            Section.section,
+        )
+        .join(Student, Student.id == StudentTermRecord.student_id)
+        .join(Grade, Grade.id == StudentTermRecord.grade_id)
+        .join(Section, Section.id == StudentTermRecord.section_id)
+        .where(*selected)
+        .order_by(
+            Grade.ordinal, Section.section, Student.first_name, Student.father_name
+        )
+    )
+
+    builders: Dict[uuid.UUID, _CardBuilder] = {}
+    record_owner: Dict[uuid.UUID, Tuple[_CardBuilder, int]] = {}
+    for row in records:
+        builder = builders.get(row.student_id)
+        if builder is None:
+            builder = builders[row.student_id] = _CardBuilder(
+                student_name=f"{row.first_name} {row.father_name}",
+                grade=row.grade.value,
+                section=row.section,
+                updated_at=row.updated_at,
+                averages=[None] * len(terms),
+                ranks=[None] * len(terms),
+            )
+        i = column[row.academic_term_id]
+        builder.averages[i] = row.average
+        builder.ranks[i] = row.rank
+        builder.touch(row.updated_at)
+        record_owner[row.id] = (builder, i)
+
+    marks = await session.execute(
+        select(
+            MarkList.student_term_record_id,
+            Subject.name,
+            func.sum(MarkList.score),
+            func.max(MarkList.updated_at),
+        )
+        .join(Subject, Subject.id == MarkList.subject_id)
+        .join(
+            StudentTermRecord,
+            StudentTermRecord.id == MarkList.student_term_record_id,
+        )
+        .where(*selected)
+        .group_by(MarkList.student_term_record_id, Subject.name)
+    )
+    for record_id, subject, score, updated_at in marks:
+        builder, i = record_owner[record_id]
+        scores = builder.scores.setdefault(subject, [None] * len(terms))
+        scores[i] = None if score is None else round(score, 2)
+        builder.touch(updated_at)
+
+    year_records = {
+        row.student_id: row
+        for row in await session.execute(
+            select(
+                StudentYearRecord.student_id,
+                StudentYearRecord.final_score,
+                StudentYearRecord.rank,
+                StudentYearRecord.updated_at,
+            ).where(
+                StudentYearRecord.year_id == year_id,
+                StudentYearRecord.student_id.in_(
+                    select(StudentTermRecord.student_id).where(*selected)
+                ),
+            )
+        )
+    }
+
+    cards = []
+    for student_id, builder in builders.items():
+        year_record = year_records.get(student_id)
+        if year_record is not None:
+            builder.touch(year_record.updated_at)
+
+        cards.append(
+            ReportCard(
+                key=str(student_id),
+                school=settings.PROJECT_NAME,
+                year=year.name,
+                student_name=builder.student_name,
+                grade=builder.grade,
+                section=builder.section,
+                terms=tuple(term.name.value for term in terms),
+                subjects=tuple(
+                    SubjectRow(name=name, scores=tuple(scores))
+                    for name, scores in sorted(builder.scores.items())
+                ),
+                averages=tuple(builder.averages),
+                ranks=tuple(builder.ranks),
+                final_score=year_record.final_score if year_record else None,
+                final_rank=year_record.rank if year_record else None,
+                updated_at=builder.updated_at,
+            )
+        )
+
+    return cards
+
+
+def cache_path(card: ReportCard, fmt: CardFormat) -> Path:
+    """Where the rendered card lives; any change to its records moves it."""
+    key = "|".join(
+        (
+            str(RENDER_VERSION),
+            card.key,
+            card.year,
+            ",".join(card.terms),
+            card.updated_at.isoformat(),
+            fmt,
+        )
+    )
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return settings.REPORT_CARD_CACHE_DIR / digest[:2] / f"{digest}.{fmt}"
+
+
+def _read_cached(path: Path) -> Optional[bytes]:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _write_cached(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write then rename so concurrent readers never see a partial file
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+async def _card_bytes(card: ReportCard, fmt: CardFormat) -> bytes:
+    path = cache_path(card, fmt)
+    cached = await run_in_threadpool(_read_cached, path)
+    if cached is not None:
+        return cached
+
+    loop = asyncio.get_running_loop()
+    data = await loop.run_in_executor(get_process_pool(), render_card, card, fmt)
+    await run_in_threadpool(_write_cached, path, data)
+    return data
+
+
+async def render_cards(
+    cards: List[ReportCard], fmt: CardFormat
+) -> AsyncIterator[Tuple[ReportCard, bytes]]:
+    """
+    Yield rendered cards in order while keeping every pool worker busy.
+
+    Only a small window of cards is in flight at once, so memory stays flat
+    no matter how many students are printed.
+    """
+    window = 2 * (settings.PROCESS_POOL_WORKERS or os.cpu_count() or 1)
+    in_flight: Deque[Tuple[ReportCard, asyncio.Task[bytes]]] = deque()
+
+    try:
+        for card in cards:
+            in_flight.append((card, asyncio.create_task(_card_bytes(card, fmt))))
+            if len(in_flight) >= window:
+                done, task = in_flight.popleft()
+                yield done, await task
+
+        while in_flight:
+            done, task = in_flight.popleft()
+            yield done, await task
+    finally:
+        for _, task in in_flight:
+            task.cancel()
+
+
+class _ZipSink(io.RawIOBase):
+    """Unseekable buffer that ZipFile streams into and we drain after each card."""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def zip_report_cards(
+    cards: List[ReportCard], fmt: CardFormat
+) -> AsyncIterator[bytes]:
+    """Stream `cards` as a zip archive, one entry per card."""
+    sink = _ZipSink()
+    # PNG and PDF are already compressed, deflating them again buys nothing
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED) as archive:
+        async for card, data in render_cards(cards, fmt):
+            info = zipfile.ZipInfo(
+                card.filename(fmt), date_time=card.updated_at.timetuple()[:6]
+            )
+            archive.writestr(info, data)
+            yield sink.drain()
+    yield sink.drain()
@@ -0,0 +1,111 @@
+import uuid
+from typing import Annotated, List, Optional, Sequence
+
+from fastapi import APIRouter, HTTPException, Query
+from sqlalchemy import select
+
+from project.api.v1.routers.dependencies import SessionDep, admin_route
+from project.api.v1.routers.saved_views.schema import (
+    NewSavedView,
+    SavedViewPage,
+    SavedViewRowsParams,
+)
+from project.api.v1.routers.saved_views.service import (
+    canonical_query,
+    compile_view,
+    run_view,
+)
+from project.models.saved_query_view import SavedQueryView
+from project.models.user import User
+from project.schema.models.saved_query_view_schema import SavedQueryViewSchema
+from project.schema.schema import SuccessResponseSchema
+from project.utils.enum import TableEnum
+
+router = APIRouter(prefix="/saved-views", tags=["Saved Views"])
+
+
+async def _own_view(
+    session: SessionDep, view_id: uuid.UUID, user: User
+) -> SavedQueryView:
+    view = await session.get(SavedQueryView, view_id)
+    if not view or view.user_id != user.id:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Saved view with ID {view_id} not found.",
+        )
+    return view
+
+
+@router.get("", response_model=List[SavedQueryViewSchema])
+async def get_saved_views(
+    session: SessionDep,
+    user_in: admin_route,
+    table_name: Annotated[Optional[TableEnum], Query(alias="tableName")] = None,
+) -> Sequence[SavedQueryView]:
+    """This endpoint will return the current user's saved views."""
+    stmt = (
+        select(SavedQueryView)
+        .where(SavedQueryView.user_id == user_in.id)
+        .order_by(SavedQueryView.name)
+    )
+    if table_name is not None:
+        stmt = stmt.where(SavedQueryView.table_name == table_name)
+
+    return (await session.execute(stmt)).scalars().all()
+
+
+@router.post("", response_model=SavedQueryViewSchema, status_code=201)
+async def create_saved_view(
+    session: SessionDep,
+    view_in: NewSavedView,
+    user_in: admin_route,
+) -> SavedQueryView:
+    """
+    This endpoint will save a view after checking that it compiles, so a
+    broken view is rejected now rather than every time it is opened.
+    """
+    query_json = view_in.query_json.model_dump(exclude_defaults=True)
+    compile_view(view_in.table_name, canonical_query(query_json))
+
+    view = SavedQueryView(
+        user_id=user_in.id,
+        name=view_in.name,
+        table_name=view_in.table_name,
+        query_json=query_json,
+    )
+    session.add(view)
+    await session.commit()
+
+    return view
+
+
+@router.get("/{view_id}/rows", response_model=SavedViewPage)
+async def get_saved_view_rows(
+    session: SessionDep,
+    view_id: uuid.UUID,
+    query: Annotated[SavedViewRowsParams, Query()],
+    user_in: admin_route,
+) -> SavedViewPage:
+    """
+    This endpoint will run a saved view and return one page of its rows.
+    Pass the returned `nextCursor` back as `cursor` for the following page.
+    """
+    view = await _own_view(session, view_id, user_in)
+    compiled = compile_view(view.table_name, canonical_query(view.query_json))
+    items, next_cursor = await run_view(session, compiled, query.cursor, query.limit)
+
+    return SavedViewPage(view_id=view.id, items=items, next_cursor=next_cursor)
+
+
+@router.delete("/{view_id}", response_model=SuccessResponseSchema)
+async def delete_saved_view(
+    session: SessionDep,
+    view_id: uuid.UUID,
+    user_in: admin_route,
+) -> SuccessResponseSchema:
+    """This endpoint will delete one of the current user's saved views."""
+    view = await _own_view(session, view_id, user_in)
+    await session.delete(view)
+    await session.commit()
+
+    return SuccessResponseSchema(message="Saved view deleted successfully.")
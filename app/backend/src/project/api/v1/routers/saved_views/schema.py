@@ -0,0 +1,57 @@
+import uuid
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from project.api.v1.routers.schema import FilterCondition, SortKey
+from project.utils.enum import TableEnum
+from project.utils.utils import to_camel
+
+
+class ViewQuery(BaseModel):
+    """
+    The `query_json` of a saved view: which columns to show, which rows to
+    keep and how to order them. Field names are the camelCase column names
+    the API uses elsewhere.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    columns: List[str] = Field(min_length=1)
+    filters: List[FilterCondition] = Field(default_factory=list)
+    sort: List[SortKey] = Field(default_factory=list)
+
+
+class NewSavedView(BaseModel):
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+    name: str = Field(min_length=1, max_length=50)
+    table_name: TableEnum
+    query_json: ViewQuery
+
+
+class SavedViewRowsParams(BaseModel):
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+    cursor: Optional[str] = None
+    limit: int = Field(default=50, ge=1, le=500)
+
+
+class SavedViewPage(BaseModel):
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+    view_id: uuid.UUID
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,241 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from fastapi import HTTPException
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import ColumnElement, Select, and_, bindparam, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from project.api.v1.routers.filtering import (
+    EMPLOYEE_FIELDS,
+    STUDENT_FIELDS,
+    FieldSet,
+    QueryField,
+    compile_condition,
+    compile_sort,
+    query_field,
+)
+from project.api.v1.routers.saved_views.schema import ViewQuery
+from project.core.config import settings
+from project.models import AcademicTerm, Admin, Employee, Grade, Student, Year
+from project.utils.enum import EmployeePositionEnum, TableEnum
+from project.utils.utils import to_camel
+
+
+@dataclass(frozen=True)
+class ViewSource:
+    """The whitelisted fields of one `TableEnum` and how to reach them."""
+
+    entity: Any
+    fields: FieldSet
+    joins: Tuple[Tuple[Any, ColumnElement[bool]], ...] = ()
+    where: Tuple[ColumnElement[bool], ...] = ()
+
+    def select(self, *columns: ColumnElement[Any]) -> Select[Any]:
+        stmt = select(*columns).select_from(self.entity)
+        for target, onclause in self.joins:
+            stmt = stmt.join(target, onclause)
+        return stmt.where(*self.where)
+
+
+SOURCES: Dict[TableEnum, ViewSource] = {
+    TableEnum.STUDENTS: ViewSource(
+        entity=Student,
+        # Grades and years are small and joined through indexed keys
+        fields=STUDENT_FIELDS.extend(
+            grade=QueryField(Grade.grade, sort_by=Grade.ordinal, indexed=True),
+            year_id=query_field(Grade.year_id, indexed=True),
+            year=query_field(Year.name, indexed=True),
+        ),
+        joins=(
+            (Grade, Student.registered_for_grade_id == Grade.id),
+            (Year, Grade.year_id == Year.id),
+        ),
+    ),
+    TableEnum.TEACHERS: ViewSource(
+        entity=Employee,
+        fields=EMPLOYEE_FIELDS,
+        where=(Employee.position == EmployeePositionEnum.TEACHING_STAFF,),
+    ),
+    TableEnum.ADMIN: ViewSource(
+        entity=Admin,
+        fields=FieldSet(
+            {
+                name: query_field(getattr(Admin, name))
+                for name in (
+                    "id",
+                    "first_name",
+                    "father_name",
+                    "grand_father_name",
+                    "date_of_birth",
+                    "gender",
+                    "created_at",
+                )
+            }
+        ),
+    ),
+    TableEnum.SEMESTERS: ViewSource(
+        entity=AcademicTerm,
+        fields=FieldSet(
+            {
+                "id": query_field(AcademicTerm.id),
+                "name": query_field(AcademicTerm.name),
+                "start_date": query_field(AcademicTerm.start_date, sortable=False),
+                "end_date": query_field(AcademicTerm.end_date, sortable=False),
+                "registration_start": query_field(
+                    AcademicTerm.registration_start, sortable=False
+                ),
+                "registration_end": query_field(
+                    AcademicTerm.registration_end, sortable=False
+                ),
+                "created_at": query_field(AcademicTerm.created_at),
+                "year_id": query_field(AcademicTerm.year_id),
+                "year": query_field(Year.name),
+            }
+        ),
+        joins=((Year, AcademicTerm.year_id == Year.id),),
+    ),
+}
+
+
+@dataclass(frozen=True)
+class CompiledView:
+    """
+    A saved view turned into SQL once. Filter values are bound parameters,
+    so executing it only binds `params` and the cursor.
+    """
+
+    columns: Tuple[str, ...]
+    key_count: int
+    first_page: Select[Any]
+    next_page: Select[Any]
+    cursor: TypeAdapter[Tuple[Any, ...]]
+    params: Mapping[str, Any] = field(default_factory=dict)
+
+
+def _invalid(detail: str) -> HTTPException:
+    return HTTPException(status_code=400, detail=detail)
+
+
+def _column(source: ViewSource, name: str) -> ColumnElement[Any]:
+    column = source.fields.resolve(name)
+    if column.through is not None:
+        raise _invalid(f"{name!r} can be filtered on but not shown")
+    return column.expression.label(to_camel(name))
+
+
+@lru_cache(maxsize=settings.SAVED_VIEW_CACHE_SIZE)
+def compile_view(table: TableEnum, query_json: str) -> CompiledView:
+    """
+    Compile a view's canonical `query_json` against the whitelist of `table`.
+
+    Cached on the JSON itself, so editing a view simply misses the cache and
+    identical views share one entry.
+    """
+    try:
+        query = ViewQuery.model_validate_json(query_json)
+    except ValidationError:
+        raise _invalid("Saved view has an invalid query")
+
+    source = SOURCES[table]
+    selected = {to_camel(name): _column(source, name) for name in query.columns}
+
+    params: Dict[str, Any] = {}
+    conditions = []
+    for i, condition in enumerate(query.filters):
+        clause, value = compile_condition(source.fields, condition, f"f{i}")
+        conditions.append(clause)
+        if value is not None:
+            params[f"f{i}"] = value
+
+    # Always end on the primary key so every row has a unique position
+    keys = compile_sort(source.fields, query.sort)
+    primary_key = source.fields.resolve("id").expression
+    if all(primary_key is not key for key, _ in keys):
+        keys.append((primary_key, False))
+
+    first_page = (
+        source.select(
+            *selected.values(),
+            *(key.label(f"_k{i}") for i, (key, _) in enumerate(keys)),
+        )
+        .where(*conditions)
+        .order_by(*(key.desc() if desc else key.asc() for key, desc in keys))
+    )
+
+    bound = [bindparam(f"k{i}", type_=key.type) for i, (key, _) in enumerate(keys)]
+    if len({desc for _, desc in keys}) == 1:
+        # One direction: a row comparison Postgres can answer from an index
+        columns = tuple_(*(key for key, _ in keys))
+        after = columns < tuple_(*bound) if keys[0][1] else columns > tuple_(*bound)
+    else:
+        after = or_(
+            *(
+                and_(
+                    *(keys[j][0] == bound[j] for j in range(i)),
+                    key < bound[i] if desc else key > bound[i],
+                )
+                for i, (key, desc) in enumerate(keys)
+            )
+        )
+
+    return CompiledView(
+        columns=tuple(selected),
+        key_count=len(keys),
+        first_page=first_page,
+        next_page=first_page.where(after),
+        cursor=TypeAdapter(Tuple[tuple(key.type.python_type for key, _ in keys)]),  # ty:ignore[invalid-type-form]
+        params=params,
+    )
+
+
+def canonical_query(query_json: Mapping[str, Any]) -> str:
+    return json.dumps(query_json, sort_keys=True, separators=(",", ":"))
+
+
+def encode_cursor(view: CompiledView, values: Tuple[Any, ...]) -> str:
+    return base64.urlsafe_b64encode(view.cursor.dump_json(values)).decode()
+
+
+def decode_cursor(view: CompiledView, cursor: str) -> Tuple[Any, ...]:
+    try:
+        return view.cursor.validate_json(base64.urlsafe_b64decode(cursor))
+    except (ValidationError, binascii.Error, ValueError):
+        raise _invalid("Invalid cursor")
+
+
+async def run_view(
+    session: AsyncSession,
+    view: CompiledView,
+    cursor: Optional[str],
+    limit: int,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Fetch one page of a compiled view and the cursor of the next page.
+
+    Pages continue after the last row seen rather than skipping an offset,
+    so deep pages cost the same as the first one.
+    """
+    params = dict(view.params)
+    stmt = view.first_page
+    if cursor is not None:
+        keys = decode_cursor(view, cursor)
+        params.update({f"k{i}": value for i, value in enumerate(keys)})
+        stmt = view.next_page
+
+    rows = (await session.execute(stmt.limit(limit + 1), params)).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]._mapping
+        next_cursor = encode_cursor(
+            view, tuple(last[f"_k{i}"] for i in range(view.key_count))
+        )
+
+    items = [{name: row._mapping[name] for name in view.columns} for row in rows]
+    return items, next_cursor
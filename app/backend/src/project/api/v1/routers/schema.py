@@ -1,7 +1,7 @@
 import uuid
 from typing import Any, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from project.utils.utils import to_camel
 
@@ -17,6 +17,37 @@ class FilterParams(BaseModel):
     q: str | None = None
 
 
+FilterOp = Literal["eq", "ne", "lt", "lte", "gt", "gte", "in", "contains", "isNull"]
+
+
+class FilterCondition(BaseModel):
+    """One condition on a field; `value` is ignored by `isNull`."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    field: str
+    op: FilterOp = "eq"
+    value: Any = None
+
+
+class SortKey(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    field: str
+    direction: Literal["asc", "desc"] = "asc"
+
+
+class PaginationParams(BaseModel):
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+    offset: int = Field(default=0, ge=0)
+    limit: int | None = Field(default=None, ge=1, le=500)
+
+
 # JSON Patch specific schemas
 class JSONPatchOperation(BaseModel):
     op: Literal["add", "remove", "replace", "move", "copy", "test"]
@@ -5,8 +5,20 @@ from fastapi import APIRouter, HTTPException, Query
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
-from project.api.v1.routers.dependencies import SessionDep, shared_route
-from project.api.v1.routers.sections.schema import SectionFilterParams
+from project.api.v1.routers.dependencies import SessionDep, admin_route, shared_route
+from project.api.v1.routers.sections.schema import (
+    Placement,
+    PlacementPlan,
+    PlacementRequest,
+    SectionFilterParams,
+    SectionPlacement,
+)
+from project.api.v1.routers.sections.service import (
+    load_sections,
+    plan_placement,
+    save_placement,
+    unplaced_students,
+)
 from project.models.grade import Grade
 from project.models.section import Section
 from project.schema.models import SectionWithRelatedSchema
@@ -47,6 +59,72 @@ async def get_sections(
     return sections
 
 
+@router.post("/placements", response_model=PlacementPlan)
+async def place_students(
+    session: SessionDep,
+    placement_in: PlacementRequest,
+    user_in: admin_route,
+) -> PlacementPlan:
+    """
+    This endpoint will place every student of a grade who is not in one of
+    its sections yet, keeping the sections even in size, gender and stream.
+    With `dryRun` the plan is only returned, nothing is saved.
+    """
+    stmt = select(Grade).where(Grade.id == placement_in.grade_id)
+    if not placement_in.dry_run:
+        # One placement per grade at a time, or both would see the same
+        # students as unplaced
+        stmt = stmt.with_for_update()
+    grade = (await session.execute(stmt)).scalar_one_or_none()
+    if not grade:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Grade with ID {placement_in.grade_id} not found.",
+        )
+
+    sections = await load_sections(session, grade.id)
+    if not sections:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Grade with ID {grade.id} has no sections.",
+        )
+    before = {section.id: section.total for section in sections}
+
+    candidates = await unplaced_students(session, grade.id, placement_in.status)
+    unplaced = plan_placement(candidates, sections, placement_in.capacity)
+
+    if not placement_in.dry_run:
+        await save_placement(session, grade.year_id, sections)
+        await session.commit()
+
+    return PlacementPlan(
+        grade_id=grade.id,
+        dry_run=placement_in.dry_run,
+        sections=[
+            SectionPlacement(
+                section_id=section.id,
+                section=section.name,
+                before=before[section.id],
+                added=len(section.added),
+                by_gender={
+                    gender.value: count for gender, count in section.genders.items()
+                },
+                by_stream={
+                    str(stream_id or "none"): count
+                    for stream_id, count in section.streams.items()
+                },
+            )
+            for section in sections
+        ],
+        placements=[
+            Placement(student_id=student_id, section_id=section.id)
+            for section in sections
+            for student_id in section.added
+        ],
+        unplaced=[candidate.id for candidate in unplaced],
+    )
+
+
 @router.get(
     "/{section_id}",
     response_model=SectionSchema,
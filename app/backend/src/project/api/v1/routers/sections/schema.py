@@ -1,7 +1,9 @@
 import uuid
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
+from project.utils.enum import StudentApplicationStatusEnum
 from project.utils.utils import to_camel
 
 
@@ -14,3 +16,59 @@ class SectionFilterParams(BaseModel):
 
     grade_id: uuid.UUID
     q: str | None = None
+
+
+class PlacementRequest(BaseModel):
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+    grade_id: uuid.UUID
+    # Only students with this status are placed
+    status: StudentApplicationStatusEnum = StudentApplicationStatusEnum.ACTIVE
+    # Most students any one section may hold, counting those already in it
+    capacity: Optional[int] = Field(default=None, ge=1)
+    dry_run: bool = False
+
+
+class SectionPlacement(BaseModel):
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+    section_id: uuid.UUID
+    section: str
+    before: int
+    added: int
+    by_gender: Dict[str, int]
+    by_stream: Dict[str, int]
+
+
+class Placement(BaseModel):
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+    student_id: uuid.UUID
+    section_id: uuid.UUID
+
+
+class PlacementPlan(BaseModel):
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+    grade_id: uuid.UUID
+    dry_run: bool
+    sections: List[SectionPlacement]
+    placements: List[Placement]
+    # Students left out because every section is full
+    unplaced: List[uuid.UUID]
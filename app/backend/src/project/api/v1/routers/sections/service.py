@@ -0,0 +1,185 @@
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import (
+    ARRAY,
+    UUID,
+    ScalarSelect,
+    bindparam,
+    exists,
+    func,
+    insert,
+    select,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from project.api.v1.routers.statistics.service import SECTION, apply_stat_changes
+from project.models import (
+    Section,
+    Stream,
+    Student,
+    StudentSectionLink,
+    StudentStreamLink,
+)
+from project.utils.enum import GenderEnum, StudentApplicationStatusEnum
+
+
+@dataclass(frozen=True)
+class Candidate:
+    """A student waiting for a section, with what placement balances on."""
+
+    id: uuid.UUID
+    gender: GenderEnum
+    stream_id: Optional[uuid.UUID] = None
+
+
+@dataclass
+class SectionLoad:
+    id: uuid.UUID
+    name: str
+    total: int = 0
+    genders: Counter[GenderEnum] = field(default_factory=Counter)
+    streams: Counter[Optional[uuid.UUID]] = field(default_factory=Counter)
+    groups: Counter[Tuple[Optional[uuid.UUID], GenderEnum]] = field(
+        default_factory=Counter
+    )
+    added: List[uuid.UUID] = field(default_factory=list)
+
+    def add(
+        self, gender: GenderEnum, stream_id: Optional[uuid.UUID], count: int = 1
+    ) -> None:
+        self.total += count
+        self.genders[gender] += count
+        self.streams[stream_id] += count
+        self.groups[stream_id, gender] += count
+
+
+def plan_placement(
+    candidates: Iterable[Candidate],
+    sections: Sequence[SectionLoad],
+    capacity: Optional[int] = None,
+) -> List[Candidate]:
+    """
+    Add each candidate to the section in `sections` that has the fewest
+    students, breaking ties by the fewest of the candidate's stream and then
+    of its stream and gender. Returns the candidates that did not fit.
+
+    Candidates are taken one stream and gender at a time, so each of those
+    groups is spread round-robin and ends up even to within one student.
+    """
+    unplaced: List[Candidate] = []
+    ordered = sorted(candidates, key=lambda c: (str(c.stream_id or ""), c.gender))
+    for candidate in ordered:
+        group = (candidate.stream_id, candidate.gender)
+        open_sections = [
+            section
+            for section in sections
+            if capacity is None or section.total < capacity
+        ]
+        if not open_sections:
+            unplaced.append(candidate)
+            continue
+
+        section = min(
+            open_sections,
+            key=lambda s: (s.total, s.streams[candidate.stream_id], s.groups[group]),
+        )
+        section.add(candidate.gender, candidate.stream_id)
+        section.added.append(candidate.id)
+    return unplaced
+
+
+def _grade_stream(grade_id: uuid.UUID) -> ScalarSelect[uuid.UUID]:
+    """The stream of the outer query's student within the grade, if any."""
+    return (
+        select(StudentStreamLink.stream_id)
+        .join(Stream, Stream.id == StudentStreamLink.stream_id)
+        .where(
+            StudentStreamLink.student_id == Student.id,
+            Stream.grade_id == grade_id,
+        )
+        .limit(1)
+        .scalar_subquery()
+    )
+
+
+async def load_sections(
+    session: AsyncSession, grade_id: uuid.UUID
+) -> List[SectionLoad]:
+    """The grade's sections with the students already placed in them."""
+    sections = {
+        section.id: SectionLoad(section.id, section.section or "")
+        for section in (
+            await session.execute(
+                select(Section)
+                .where(Section.grade_id == grade_id)
+                .order_by(Section.section)
+            )
+        ).scalars()
+    }
+
+    placed = (
+        select(
+            StudentSectionLink.section_id,
+            Student.gender,
+            _grade_stream(grade_id).label("stream_id"),
+        )
+        .join(Student, Student.id == StudentSectionLink.student_id)
+        .where(StudentSectionLink.section_id.in_(sections))
+        .subquery()
+    )
+    counts = await session.execute(select(placed, func.count()).group_by(*placed.c))
+    for section_id, gender, stream_id, count in counts:
+        sections[section_id].add(gender, stream_id, count)
+
+    return list(sections.values())
+
+
+async def unplaced_students(
+    session: AsyncSession,
+    grade_id: uuid.UUID,
+    status: StudentApplicationStatusEnum,
+) -> List[Candidate]:
+    """Students registered for the grade who are in none of its sections."""
+    in_grade_section = exists().where(
+        StudentSectionLink.student_id == Student.id,
+        StudentSectionLink.section_id == Section.id,
+        Section.grade_id == grade_id,
+    )
+    rows = await session.execute(
+        select(Student.id, Student.gender, _grade_stream(grade_id))
+        .where(
+            Student.registered_for_grade_id == grade_id,
+            Student.status == status,
+            ~in_grade_section,
+        )
+        .order_by(Student.first_name, Student.father_name, Student.id)
+    )
+    return [Candidate(id, gender, stream_id) for id, gender, stream_id in rows]
+
+
+async def save_placement(
+    session: AsyncSession, year_id: uuid.UUID, sections: Sequence[SectionLoad]
+) -> None:
+    """Write every planned link in one INSERT ... SELECT over two arrays."""
+    student_ids = [student for s in sections for student in s.added]
+    section_ids = [s.id for s in sections for _ in s.added]
+    if not student_ids:
+        return
+
+    ids = ARRAY(UUID())
+    await session.execute(
+        insert(StudentSectionLink).from_select(
+            ["student_id", "section_id"],
+            select(
+                func.unnest(bindparam("student_ids", type_=ids)),
+                func.unnest(bindparam("section_ids", type_=ids)),
+            ),
+        ),
+        {"student_ids": student_ids, "section_ids": section_ids},
+    )
+    await apply_stat_changes(
+        session, [], [(year_id, SECTION, str(section_id)) for section_id in section_ids]
+    )
@@ -0,0 +1,87 @@
+import uuid
+from typing import Dict, List
+
+from fastapi import APIRouter, HTTPException
+
+from project.api.v1.routers.dependencies import SessionDep, admin_route
+from project.api.v1.routers.statistics.schema import StatBucket, YearStatistics
+from project.api.v1.routers.statistics.service import (
+    GENDER,
+    GRADE,
+    SECTION,
+    STATUS,
+    STREAM,
+    TEACHER_STATUS,
+    bucket_labels,
+    read_year_stats,
+    rebuild_year_stats,
+)
+from project.models.year import Year
+from project.schema.schema import SuccessResponseSchema
+from project.utils.enum import (
+    EmployeeApplicationStatusEnum,
+    StudentApplicationStatusEnum,
+)
+
+router = APIRouter(prefix="/statistics", tags=["Statistics"])
+
+
+async def _get_year(session: SessionDep, year_id: uuid.UUID) -> Year:
+    year = await session.get(Year, year_id)
+    if not year:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Year with ID {year_id} not found.",
+        )
+    return year
+
+
+def _buckets(counts: Dict[str, int], labels: Dict[str, str]) -> List[StatBucket]:
+    return [
+        StatBucket(id=uuid.UUID(key), label=labels.get(key, key), count=count)
+        for key, count in counts.items()
+    ]
+
+
+@router.get("/years/{year_id}", response_model=YearStatistics)
+async def get_year_statistics(
+    session: SessionDep,
+    year_id: uuid.UUID,
+    user_in: admin_route,
+) -> YearStatistics:
+    """
+    This endpoint will return the dashboard counts of a year. They are kept
+    up to date as students and employees change, so this is a single read.
+    """
+    await _get_year(session, year_id)
+    stats = await read_year_stats(session, year_id)
+    labels = await bucket_labels(session, year_id)
+
+    by_status = stats.get(STATUS, {})
+    teachers_by_status = stats.get(TEACHER_STATUS, {})
+    return YearStatistics(
+        year_id=year_id,
+        students=sum(by_status.values()),
+        pending_registrations=by_status.get(StudentApplicationStatusEnum.PENDING, 0),
+        by_grade=_buckets(stats.get(GRADE, {}), labels),
+        by_section=_buckets(stats.get(SECTION, {}), labels),
+        by_stream=_buckets(stats.get(STREAM, {}), labels),
+        by_gender=stats.get(GENDER, {}),
+        by_status=by_status,
+        teachers=teachers_by_status.get(EmployeeApplicationStatusEnum.ACTIVE, 0),
+        teachers_by_status=teachers_by_status,
+    )
+
+
+@router.post("/years/{year_id}/rebuild", response_model=SuccessResponseSchema)
+async def rebuild_year_statistics(
+    session: SessionDep,
+    year_id: uuid.UUID,
+    user_in: admin_route,
+) -> SuccessResponseSchema:
+    """This endpoint will recount a year's statistics from the source tables."""
+    await _get_year(session, year_id)
+    await rebuild_year_stats(session, year_id)
+    await session.commit()
+
+    return SuccessResponseSchema(message="Statistics rebuilt successfully.")
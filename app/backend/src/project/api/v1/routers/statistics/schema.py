@@ -0,0 +1,37 @@
+import uuid
+from typing import Dict, List
+
+from pydantic import BaseModel, ConfigDict
+
+from project.utils.utils import to_camel
+
+
+class StatBucket(BaseModel):
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+    id: uuid.UUID
+    label: str
+    count: int
+
+
+class YearStatistics(BaseModel):
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+    year_id: uuid.UUID
+    students: int
+    pending_registrations: int
+    by_grade: List[StatBucket]
+    by_section: List[StatBucket]
+    by_stream: List[StatBucket]
+    by_gender: Dict[str, int]
+    by_status: Dict[str, int]
+    teachers: int
+    teachers_by_status: Dict[str, int]
@@ -0,0 +1,214 @@
+import uuid
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from sqlalchemy import (
+    ColumnElement,
+    CompoundSelect,
+    Select,
+    String,
+    cast,
+    delete,
+    func,
+    literal,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from project.models import (
+    Employee,
+    EmployeeYearLink,
+    Grade,
+    Section,
+    Stream,
+    Student,
+    StudentSectionLink,
+    StudentStreamLink,
+    YearStatCounter,
+)
+from project.utils.enum import EmployeePositionEnum
+
+# (year, dimension, bucket) of one counter
+StatKey = Tuple[uuid.UUID, str, str]
+
+GRADE = "grade"
+SECTION = "section"
+STREAM = "stream"
+GENDER = "gender"
+STATUS = "status"
+TEACHER_STATUS = "teacher_status"
+
+
+def _bucket(dimension: str, key: Any) -> Tuple[Any, ...]:
+    return (
+        Grade.year_id.label("year_id"),
+        literal(dimension, String).label("dimension"),
+        cast(key, String).label("key"),
+    )
+
+
+def _student_buckets(*where: ColumnElement[bool]) -> CompoundSelect:
+    """One `(year_id, dimension, key)` row per counter each student is in."""
+    registered = (
+        select()
+        .select_from(Student)
+        .join(Grade, Grade.id == Student.registered_for_grade_id)
+        .where(*where)
+    )
+    return union_all(
+        registered.add_columns(*_bucket(GRADE, Grade.id)),
+        registered.add_columns(*_bucket(GENDER, Student.gender)),
+        registered.add_columns(*_bucket(STATUS, Student.status)),
+        # Placements count towards the year of the section or stream
+        select(*_bucket(SECTION, Section.id))
+        .join(StudentSectionLink, StudentSectionLink.section_id == Section.id)
+        .join(Student, Student.id == StudentSectionLink.student_id)
+        .join(Grade, Grade.id == Section.grade_id)
+        .where(*where),
+        select(*_bucket(STREAM, Stream.id))
+        .join(StudentStreamLink, StudentStreamLink.stream_id == Stream.id)
+        .join(Student, Student.id == StudentStreamLink.student_id)
+        .join(Grade, Grade.id == Stream.grade_id)
+        .where(*where),
+    )
+
+
+def _teacher_buckets(*where: ColumnElement[bool]) -> Select[Any]:
+    return (
+        select(
+            EmployeeYearLink.year_id.label("year_id"),
+            literal(TEACHER_STATUS, String).label("dimension"),
+            cast(Employee.status, String).label("key"),
+        )
+        .join(Employee, Employee.id == EmployeeYearLink.employee_id)
+        .where(Employee.position == EmployeePositionEnum.TEACHING_STAFF, *where)
+    )
+
+
+async def _lock_rows(
+    session: AsyncSession,
+    model: type[Student] | type[Employee],
+    ids: Sequence[uuid.UUID],
+) -> None:
+    # In id order, so two transactions locking overlapping sets cannot deadlock
+    await session.execute(
+        select(model.id).where(model.id.in_(ids)).order_by(model.id).with_for_update()
+    )
+
+
+async def student_stat_keys(
+    session: AsyncSession, student_ids: Sequence[uuid.UUID], *, lock: bool = False
+) -> List[StatKey]:
+    """
+    Every counter the given students currently add one to. With `lock`, their
+    rows are locked first, so a concurrent change to the same students waits
+    for this transaction and then reads the keys it left behind.
+    """
+    if not student_ids:
+        return []
+    if lock:
+        await _lock_rows(session, Student, student_ids)
+    rows = await session.execute(_student_buckets(Student.id.in_(student_ids)))
+    return [(year_id, dimension, key) for year_id, dimension, key in rows]
+
+
+async def employee_stat_keys(
+    session: AsyncSession, employee_ids: Sequence[uuid.UUID], *, lock: bool = False
+) -> List[StatKey]:
+    """
+    Every counter the given employees currently add one to. With `lock`, their
+    rows are locked first, so a concurrent change to the same employees waits
+    for this transaction and then reads the keys it left behind.
+    """
+    if not employee_ids:
+        return []
+    if lock:
+        await _lock_rows(session, Employee, employee_ids)
+    rows = await session.execute(_teacher_buckets(Employee.id.in_(employee_ids)))
+    return [(year_id, dimension, key) for year_id, dimension, key in rows]
+
+
+async def apply_stat_changes(
+    session: AsyncSession,
+    before: Iterable[StatKey],
+    after: Iterable[StatKey],
+) -> None:
+    """
+    Move counters from the `before` keys to the `after` keys in one upsert.
+
+    Rows are written in key order, so concurrent transactions touching the
+    same counters queue up behind each other instead of deadlocking.
+    """
+    deltas: Counter[StatKey] = Counter(after)
+    deltas.subtract(before)
+    rows = [
+        {"year_id": year_id, "dimension": dimension, "key": key, "count": delta}
+        for (year_id, dimension, key), delta in sorted(deltas.items())
+        if delta
+    ]
+    if not rows:
+        return
+
+    stmt = insert(YearStatCounter).values(rows)
+    await session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[
+                YearStatCounter.year_id,
+                YearStatCounter.dimension,
+                YearStatCounter.key,
+            ],
+            set_={"count": YearStatCounter.count + stmt.excluded.count},
+        )
+    )
+
+
+async def rebuild_year_stats(session: AsyncSession, year_id: uuid.UUID) -> None:
+    """Recount a year from scratch in SQL, for backfills and repairs."""
+    buckets = union_all(
+        _student_buckets(Grade.year_id == year_id),
+        _teacher_buckets(EmployeeYearLink.year_id == year_id),
+    ).subquery()
+
+    await session.execute(
+        delete(YearStatCounter).where(YearStatCounter.year_id == year_id)
+    )
+    await session.execute(
+        insert(YearStatCounter).from_select(
+            ["year_id", "dimension", "key", "count"],
+            select(
+                buckets.c.year_id, buckets.c.dimension, buckets.c.key, func.count()
+            ).group_by(buckets.c.year_id, buckets.c.dimension, buckets.c.key),
+        )
+    )
+
+
+async def read_year_stats(
+    session: AsyncSession, year_id: uuid.UUID
+) -> Dict[str, Dict[str, int]]:
+    """All counters of a year as `{dimension: {bucket: count}}`."""
+    stats: Dict[str, Dict[str, int]] = {}
+    rows = await session.execute(
+        select(YearStatCounter.dimension, YearStatCounter.key, YearStatCounter.count)
+        .where(YearStatCounter.year_id == year_id, YearStatCounter.count != 0)
+        .order_by(YearStatCounter.dimension, YearStatCounter.key)
+    )
+    for dimension, key, count in rows:
+        stats.setdefault(dimension, {})[key] = count
+    return stats
+
+
+async def bucket_labels(session: AsyncSession, year_id: uuid.UUID) -> Dict[str, str]:
+    """Display names for the grade, section and stream buckets of a year."""
+    grade = cast(Grade.grade, String)
+    labels = union_all(
+        select(Grade.id, grade).where(Grade.year_id == year_id),
+        select(Section.id, func.concat(grade, Section.section))
+        .join(Grade, Grade.id == Section.grade_id)
+        .where(Grade.year_id == year_id),
+        select(Stream.id, func.concat(grade, " ", Stream.name))
+        .join(Grade, Grade.id == Stream.grade_id)
+        .where(Grade.year_id == year_id),
+    )
+    return {str(bucket_id): label for bucket_id, label in await session.execute(labels)}
@@ -1,20 +1,29 @@
 import uuid
 from typing import Annotated, List, Sequence
 
-from fastapi import APIRouter, HTTPException, Query
-from sqlalchemy import select, update
-
-from project.api.v1.routers.dependencies import SessionDep, admin_route
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response
+from sqlalchemy import select
+from starlette import status
+
+from project.api.v1.routers.dependencies import RedisDep, SessionDep, admin_route
+from project.api.v1.routers.filtering import StudentFilters
+from project.api.v1.routers.jobs.schema import JobAccepted
+from project.api.v1.routers.media.route import IMAGE_BODY
+from project.api.v1.routers.media.schema import ImageUploadResponse
+from project.api.v1.routers.media.service import store_image
 from project.api.v1.routers.schema import FilterParams
+from project.api.v1.routers.statistics.service import (
+    apply_stat_changes,
+    student_stat_keys,
+)
 from project.api.v1.routers.students.schema import StudentBasicInfo, UpdateStudentStatus
-from project.core.security import get_password_hash
+from project.api.v1.routers.students.service import STATUS_JOB, set_student_status
+from project.core.config import settings
 from project.models.grade import Grade
 from project.models.student import Student
-from project.models.user import User
 from project.models.year import Year
 from project.schema.schema import SuccessResponseSchema
-from project.utils.enum import RoleEnum, StudentApplicationStatusEnum
-from project.utils.utils import generate_id
+from project.workers.jobs import enqueue_job
 
 router = APIRouter(prefix="/students", tags=["Students"])
 
@@ -23,9 +32,16 @@ router = APIRouter(prefix="/students", tags=["Students"])
 async def get_students(
     session: SessionDep,
     query: Annotated[FilterParams, Query()],
+    filters: StudentFilters,
     user_in: admin_route,
 ) -> Sequence[Student]:
-    """This endpoint will return students based on the provided filters."""
+    """
+    This endpoint will return students based on the provided filters.
+
+    Besides `q`, students can be filtered and sorted on grade, section,
+    status, gender, date of birth and name, e.g.
+    `filter=status:eq:active&filter=sectionId:eq:<id>&sort=firstName`.
+    """
     year = await session.get(Year, query.year_id)
     if not year:
         raise HTTPException(
@@ -42,6 +58,8 @@ async def get_students(
     if query.q:
         stm = stm.where(Student.first_name.ilike(f"%{query.q}%"))
 
+    stm = filters.apply(stm)
+
     students = (await session.execute(stm)).scalars().all()
 
     return students
@@ -63,6 +81,32 @@ async def get_student(
     return student
 
 
+@router.put(
+    "/{student_id}/photo",
+    response_model=ImageUploadResponse,
+    openapi_extra=IMAGE_BODY,
+)
+async def upload_student_photo(
+    request: Request,
+    session: SessionDep,
+    student_id: uuid.UUID,
+    user_in: admin_route,
+) -> ImageUploadResponse:
+    """This endpoint will store an image and set it as the student's photo."""
+    student = await session.get(Student, student_id)
+    if not student:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Student with ID {student_id} not found.",
+        )
+
+    image = await store_image(request)
+    student.student_photo = image.ref
+    await session.commit()
+
+    return image
+
+
 @router.delete("", response_model=SuccessResponseSchema)
 async def delete_students(
     session: SessionDep,
@@ -70,6 +114,7 @@ async def delete_students(
     user_in: admin_route,
 ) -> SuccessResponseSchema:
     """This endpoint will delete students based on the provided IDs."""
+    counted = await student_stat_keys(session, student_ids, lock=True)
     for student_id in student_ids:
         student = await session.get(Student, student_id)
         if not student:
@@ -78,61 +123,44 @@ async def delete_students(
                 detail=f"Student with ID {student_id} not found.",
             )
         await session.delete(student)
+    await session.flush()
+    await apply_stat_changes(session, counted, [])
     await session.commit()
     return SuccessResponseSchema(message="Students deleted successfully.")
 
 
-@router.patch("/status", response_model=SuccessResponseSchema)
+@router.patch(
+    "/status",
+    response_model=SuccessResponseSchema | JobAccepted,
+    responses={status.HTTP_202_ACCEPTED: {"model": JobAccepted}},
+)
 async def update_student_status(
     session: SessionDep,
+    redis: RedisDep,
     students: UpdateStudentStatus,
     user_in: admin_route,
-) -> SuccessResponseSchema:
-    """This endpoint will patch students based on the provided IDs."""
-    year = (
-        await session.execute(
-            select(Year)
-            .join(Grade, Grade.year_id == Year.id)
-            .join(Student, Student.registered_for_grade_id == Grade.id)
+    response: Response,
+    idempotency_key: Annotated[str | None, Header()] = None,
+) -> SuccessResponseSchema | JobAccepted:
+    """
+    This endpoint will patch students based on the provided IDs.
+
+    Cohorts larger than `JOB_INLINE_STUDENT_LIMIT` are handed to the job
+    worker, since activating each student hashes a new password; the
+    answer is then 202 with the job to poll.
+    """
+    if len(students.student_ids) > settings.JOB_INLINE_STUDENT_LIMIT:
+        job_id, _ = await enqueue_job(
+            redis,
+            STATUS_JOB,
+            students.model_dump(mode="json"),
+            user_id=user_in.id,
+            idempotency_key=idempotency_key,
         )
-    ).scalar_one_or_none()
-
-    if not year:
-        raise HTTPException(
-            status_code=404,
-            detail="No academic year found for the students.",
-        )
-
-    for student_id in students.student_ids:
-        student = await session.get(Student, student_id)
-        if not student:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Student with ID {student_id} not found.",
-            )
-
-        stmt = (
-            update(Student)
-            .where(Student.id == student_id)
-            .values(status=students.status)
-        )
-
-        if (
-            students.status == StudentApplicationStatusEnum.ACTIVE
-            and student.user_id is None
-        ):
-            username = generate_id(session=session, role=RoleEnum.STUDENT, year=year)
-            new_user = User(
-                role=RoleEnum.STUDENT,
-                username=generate_id(session=session, role=RoleEnum.STUDENT, year=year),
-                password=get_password_hash(username),
-            )
-            session.add(new_user)
-            await session.commit()
-
-            stmt.values(user_id=new_user.id)
+        response.status_code = status.HTTP_202_ACCEPTED
+        return JobAccepted(job_id=job_id)
 
-    await session.execute(stmt)
+    await set_student_status(session, students.student_ids, students.status)
     await session.commit()
 
     return SuccessResponseSchema(
@@ -2,9 +2,10 @@ import uuid
 from datetime import date
 from typing import Optional
 
-from pydantic import AwareDatetime, BaseModel, ConfigDict, EmailStr
+from pydantic import AwareDatetime, BaseModel, ConfigDict, EmailStr, computed_field
 from pydantic_extra_types.phone_numbers import PhoneNumber
 
+from project.core.media import thumbnail_url
 from project.utils.enum import (
     BloodTypeEnum,
     GenderEnum,
@@ -80,6 +81,12 @@ class StudentBasicInfo(BaseModel):
     created_at: AwareDatetime
     grade: StudentRegisteredGrade
 
+    @computed_field
+    @property
+    def photo_thumbnail_url(self) -> Optional[str]:
+        """Small thumbnail for rosters, instead of the full-size photo."""
+        return thumbnail_url(self.student_photo)
+
 
 class UpdateStudentStatus(BaseModel):
     model_config = ConfigDict(
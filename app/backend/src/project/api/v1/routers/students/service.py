@@ -0,0 +1,98 @@
+import uuid
+from typing import Any, Dict, Sequence
+
+from fastapi import HTTPException
+from pydantic import SecretStr
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from project.api.v1.routers.statistics.service import (
+    apply_stat_changes,
+    student_stat_keys,
+)
+from project.core.security import get_password_hash_async
+from project.models.grade import Grade
+from project.models.student import Student
+from project.models.user import User
+from project.models.year import Year
+from project.utils.enum import RoleEnum, StudentApplicationStatusEnum
+from project.utils.utils import generate_id
+from project.workers.jobs import JobContext, job_handler
+
+STATUS_JOB = "students.status"
+
+
+async def set_student_status(
+    session: AsyncSession,
+    student_ids: Sequence[uuid.UUID],
+    status: StudentApplicationStatusEnum,
+    context: JobContext | None = None,
+) -> int:
+    """
+    Set the status of the given students, creating a login for each one
+    activated for the first time. The caller commits.
+    """
+    years = dict(
+        (
+            await session.execute(
+                select(Student.id, Year)
+                .join(Grade, Grade.id == Student.registered_for_grade_id)
+                .join(Year, Year.id == Grade.year_id)
+                .where(Student.id.in_(student_ids))
+            )
+        ).all()
+    )
+    missing = [student_id for student_id in student_ids if student_id not in years]
+    if missing:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Student with ID {missing[0]} not found.",
+        )
+
+    counted = await student_stat_keys(session, student_ids, lock=True)
+    for done, student_id in enumerate(student_ids, start=1):
+        student = await session.get(Student, student_id)
+        stmt = update(Student).where(Student.id == student_id).values(status=status)
+
+        if (
+            status == StudentApplicationStatusEnum.ACTIVE
+            and student is not None
+            and student.user_id is None
+        ):
+            username = await generate_id(
+                session=session, role=RoleEnum.STUDENT, year=years[student_id]
+            )
+            new_user = User(
+                role=RoleEnum.STUDENT,
+                username=username,
+                password=await get_password_hash_async(SecretStr(username)),
+            )
+            session.add(new_user)
+            await session.flush()
+
+            stmt = stmt.values(user_id=new_user.id)
+
+        await session.execute(stmt)
+        if context is not None and done % 50 == 0:
+            await context.progress(done, len(student_ids))
+
+    await apply_stat_changes(
+        session, counted, await student_stat_keys(session, student_ids)
+    )
+    return len(student_ids)
+
+
+@job_handler(STATUS_JOB)
+async def run_status_job(
+    context: JobContext, payload: Dict[str, Any]
+) -> Dict[str, Any]:
+    student_ids = [uuid.UUID(student_id) for student_id in payload["student_ids"]]
+    updated = await set_student_status(
+        context.session,
+        student_ids,
+        StudentApplicationStatusEnum(payload["status"]),
+        context,
+    )
+    await context.session.commit()
+    await context.progress(updated, updated)
+    return {"updated": updated}
@@ -6,6 +6,7 @@ from fastapi.logger import logger
 from sqlalchemy import select
 
 from project.api.v1.routers.dependencies import SessionDep, admin_route, shared_route
+from project.api.v1.routers.filtering import SubjectFilters
 from project.api.v1.routers.schema import FilterParams
 from project.api.v1.routers.subjects.schema import (
     NewSubject,
@@ -31,6 +32,7 @@ router = APIRouter(prefix="/subjects", tags=["Subjects"])
 async def get_subjects(
     session: SessionDep,
     query: Annotated[FilterParams, Query()],
+    filters: SubjectFilters,
     user_in: shared_route,
 ) -> Sequence[Subject]:
     """
@@ -46,8 +48,8 @@ async def get_subjects(
     subjects = (
         (
             await session.execute(
-                select(Subject)
-                .where(Subject.year_id == query.year_id)
+                filters.apply(select(Subject).where(Subject.year_id == query.year_id))
+                # Explicit sorts come first, name breaks their ties
                 .order_by(Subject.name)
             )
         )
@@ -8,6 +8,7 @@ from sqlalchemy.orm import (
 )
 
 from project.api.v1.routers.dependencies import SessionDep, admin_route
+from project.api.v1.routers.filtering import EmployeeFilters
 from project.api.v1.routers.teachers.schema import (
     AssignTeacher,
     TeacherBasicInfo,
@@ -33,6 +34,7 @@ async def get_teachers(
     session: SessionDep,
     user_in: admin_route,
     q: Annotated[TeachersQuery, Query()],
+    filters: EmployeeFilters,
 ) -> Sequence[Employee]:
     """This endpoint will return employees based on the provided filters."""
     if (
@@ -67,7 +69,7 @@ async def get_teachers(
         .scalar_subquery()
     )
 
-    teachers = select(Employee).options(
+    teachers = filters.apply(select(Employee)).options(
         with_loader_criteria(Section, Section.id == TeacherRecordLink.section_id),
         with_loader_criteria(
             GradeStreamSubject, GradeStreamSubject.id.in_(filtered_gss_subquery)
@@ -1,23 +1,26 @@
 import uuid
-from typing import Any, Dict, List, Sequence
+from typing import List, Sequence
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from fastapi.logger import logger
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from starlette import status
 
-from project.api.v1.routers.dependencies import SessionDep, admin_route, shared_route
+from project.api.v1.routers.dependencies import (
+    RedisDep,
+    SessionDep,
+    admin_route,
+    shared_route,
+)
+from project.api.v1.routers.idempotency import IdempotentRoute
 from project.api.v1.routers.year.schema import (
     DeleteYearSuccess,
     NewYear,
     NewYearSuccess,
     YearSummary,
 )
-from project.api.v1.routers.year.service import (
-    create_academic_term,
-    handle_setup_methods,
-)
+from project.api.v1.routers.year.service import SETUP_JOB, create_academic_term
 from project.models.grade import Grade
 from project.models.subject import Subject
 from project.models.year import Year
@@ -25,8 +28,9 @@ from project.schema.models import YearWithRelatedSchema
 from project.schema.models.grade_schema import GradeNestedSchema
 from project.schema.models.subject_schema import SubjectNestedSchema
 from project.schema.models.year_schema import YearSchema
+from project.workers.jobs import enqueue_job
 
-router = APIRouter(prefix="/years", tags=["Years"])
+router = APIRouter(prefix="/years", tags=["Years"], route_class=IdempotentRoute)
 
 
 @router.get(
@@ -125,14 +129,25 @@ async def get_year_by_id(
     return year
 
 
-@router.post("", response_model=NewYearSuccess, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "",
+    response_model=NewYearSuccess,
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_202_ACCEPTED: {"model": NewYearSuccess}},
+)
 async def post_year(
     session: SessionDep,
+    redis: RedisDep,
     new_year: NewYear,
     user_in: admin_route,
-) -> Dict[str, Any]:
+    response: Response,
+) -> NewYearSuccess:
     """
     Creates a new Year
+
+    The year and its terms exist once this returns. Grades and subjects
+    from a template or an earlier year are set up by a background job,
+    in which case the answer is 202 with the job to poll.
     """
     errors = {}
 
@@ -143,6 +158,11 @@ async def post_year(
     if existing_year_name:
         errors["name"] = "Name already exists."
 
+    if new_year.copy_from_year_id is not None and not await session.get(
+        Year, new_year.copy_from_year_id
+    ):
+        errors["setupMethods"] = "Year not found for copying."
+
     if errors:
         raise HTTPException(status_code=400, detail=errors)
 
@@ -163,25 +183,29 @@ async def post_year(
             session=session,
         )
 
-        await handle_setup_methods(
-            old_year_id=new_year.copy_from_year_id,
-            year_id=year.id,
-            session=session,
-            setup_methods=new_year.setup_methods,
-        )
-
+        year_id = year.id
         await session.commit()
-        await session.refresh(year)
-
-        return {"message": "Year created Successfully", "id": year.id}
-    except HTTPException:
-        session.rollback()
-        raise
     except Exception as e:
         logger.error(f"Error creating year: {e}")
-        session.rollback()
+        await session.rollback()
         raise HTTPException(status_code=500, detail=f"Creation failed: {str(e)}")
 
+    if new_year.setup_methods == "Manual":
+        return NewYearSuccess(id=year_id)
+
+    job_id, _ = await enqueue_job(
+        redis,
+        SETUP_JOB,
+        {
+            "year_id": year_id,
+            "old_year_id": new_year.copy_from_year_id,
+            "setup_methods": new_year.setup_methods,
+        },
+        user_id=user_in.id,
+    )
+    response.status_code = status.HTTP_202_ACCEPTED
+    return NewYearSuccess(id=year_id, job_id=job_id)
+
 
 @router.delete(
     "/{year_id}",
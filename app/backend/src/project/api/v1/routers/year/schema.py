@@ -58,8 +58,15 @@ class NewYear(BaseModel):
 
 
 class NewYearSuccess(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
     id: uuid.UUID
     message: str = Field(default="Year created Successfully")
+    # Set while grades and subjects are still being set up in the background
+    job_id: Optional[uuid.UUID] = None
 
 
 class DeleteYearSuccess(BaseModel):
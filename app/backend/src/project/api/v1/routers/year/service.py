@@ -1,7 +1,7 @@
 import logging
 import uuid
 from datetime import date
-from typing import Dict, List, Union
+from typing import Any, Dict, List, Union
 
 from fastapi import HTTPException
 from sqlalchemy import select
@@ -19,6 +19,9 @@ from project.models.year import Year
 from project.templates import TEM_DATA
 from project.utils.enum import AcademicTermEnum, AcademicTermTypeEnum
 from project.utils.type import SetupMethodType
+from project.workers.jobs import JobContext, job_handler
+
+SETUP_JOB = "year.setup"
 
 
 def create_academic_term(
@@ -89,6 +92,30 @@ async def handle_setup_methods(
         raise ValueError("Invalid setup method")
 
 
+@job_handler(SETUP_JOB)
+async def run_setup_job(context: JobContext, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill a freshly created year from its template or the year it copies."""
+    year_id = uuid.UUID(payload["year_id"])
+    old_year_id = payload["old_year_id"]
+
+    # Setup commits in one go, so any grade means an earlier run finished
+    done = (
+        await context.session.execute(
+            select(Grade.id).where(Grade.year_id == year_id).limit(1)
+        )
+    ).first()
+    if done is None:
+        await handle_setup_methods(
+            old_year_id=uuid.UUID(old_year_id) if old_year_id else None,
+            year_id=year_id,
+            session=context.session,
+            setup_methods=payload["setup_methods"],
+        )
+        await context.session.commit()
+
+    return {"yearId": str(year_id)}
+
+
 async def _handle_default_template_setup(
     *,
     year_id: uuid.UUID,
@@ -0,0 +1,117 @@
+"""
+Gzip for responses worth compressing.
+
+:class:`CompressionMiddleware` compresses bodies of at least
+``COMPRESSION_MIN_BYTES`` for clients that accept gzip. Streamed bodies
+are compressed chunk by chunk, so they still reach the client as they are
+produced; formats that are compressed already (``EXCLUDED_CONTENT_TYPES``)
+pass through.
+Bytes before and after compression are counted per route, so the savings
+can be read off the metrics endpoint.
+
+Bodies that only change with their ETag, like the calendar feed, can be
+compressed once with :func:`gzip_body` and sent with
+``Content-Encoding: gzip``; the middleware leaves those alone.
+"""
+
+import gzip
+from functools import lru_cache
+
+from prometheus_client import Counter
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from project.core.config import settings
+from project.core.query_stats import route_template
+
+# Bodies of these types are compressed already, gzip would only cost CPU.
+# Starlette's own list varies by version, so the check is done here
+EXCLUDED_CONTENT_TYPES = (
+    "application/gzip",
+    "application/x-gzip",
+    "application/zip",
+    "audio/*",
+    "font/woff2",
+    "image/*",
+    "text/event-stream",
+    "video/*",
+)
+
+COMPRESSION_BYTES = Counter(
+    "http_response_compression_bytes",
+    "Response body bytes before (identity) and after (gzip) compression.",
+    ["route", "encoding"],
+)
+
+
+def accepts_gzip(headers: Headers) -> bool:
+    return "gzip" in headers.get("accept-encoding", "")
+
+
+def excluded_content_type(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return any(
+        media_type.startswith(excluded[:-1])
+        if excluded.endswith("/*")
+        else media_type == excluded
+        for excluded in EXCLUDED_CONTENT_TYPES
+    )
+
+
+@lru_cache(maxsize=settings.COMPRESSION_CACHE_SIZE)
+def gzip_body(body: bytes) -> bytes:
+    """Compress a body once per distinct content."""
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_LEVEL, mtime=0)
+
+
+class CompressionMiddleware:
+    """Gzip bodies of at least COMPRESSION_MIN_BYTES, counting the savings."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not accepts_gzip(Headers(scope=scope)):
+            await self.app(scope, receive, send)
+            return
+
+        identity = 0
+        wire = 0
+        encoded_by_app = False
+        encoded = False
+        excluded = False
+
+        async def counted_app(scope: Scope, receive: Receive, gzip_send: Send) -> None:
+            async def count_identity(message: Message) -> None:
+                nonlocal identity, encoded_by_app, excluded
+                if message["type"] == "http.response.start":
+                    headers = Headers(raw=message["headers"])
+                    encoded_by_app = "content-encoding" in headers
+                    excluded = excluded_content_type(headers.get("content-type", ""))
+                elif message["type"] == "http.response.body":
+                    identity += len(message.get("body", b""))
+                # Excluded types go around GZipMiddleware, which never
+                # sees the response
+                await (send if excluded else gzip_send)(message)
+
+            await self.app(scope, receive, count_identity)
+
+        async def count_wire(message: Message) -> None:
+            nonlocal wire, encoded
+            if message["type"] == "http.response.start":
+                encoded = "content-encoding" in Headers(raw=message["headers"])
+            elif message["type"] == "http.response.body":
+                wire += len(message.get("body", b""))
+            await send(message)
+
+        await GZipMiddleware(
+            counted_app,
+            minimum_size=settings.COMPRESSION_MIN_BYTES,
+            compresslevel=settings.COMPRESSION_LEVEL,
+        )(scope, receive, count_wire)
+
+        if encoded and not encoded_by_app:
+            route = route_template(scope) or "unmatched"
+            COMPRESSION_BYTES.labels(route, "identity").inc(identity)
+            COMPRESSION_BYTES.labels(route, "gzip").inc(wire)
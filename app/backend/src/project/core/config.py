@@ -1,11 +1,11 @@
 import os
+import tempfile
 import warnings
 from datetime import date
 from functools import lru_cache
 from pathlib import Path
 from typing import Annotated, Any, Literal, Union
 
-from fastapi_mail import ConnectionConfig
 from pydantic import (
     AnyUrl,
     BeforeValidator,
@@ -71,10 +71,50 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: SecretStr
     POSTGRES_DB: str
 
+    # Optional streaming replica for read-only requests, see project.core.db.
+    # It shares the primary's user, password and database name.
+    POSTGRES_REPLICA_SERVER: str | None = None
+    POSTGRES_REPLICA_PORT: int | None = None
+    # Reads go back to the primary while the replica is further behind
+    REPLICA_MAX_LAG_SECONDS: float = 5
+    # How long a client reads from the primary after writing
+    REPLICA_STICKY_SECONDS: int = 5
+
+    # Host many schools, one Postgres schema each, see project.core.tenancy
+    MULTI_TENANT: bool = False
+    # Schools are told apart by subdomain of this, e.g. "classease.app"
+    TENANT_BASE_DOMAIN: str | None = None
+
     REDIS_SERVER: str
     REDIS_PORT: int
     REDIS_USER: str
     REDIS_PASSWORD: SecretStr | None = None
+    REDIS_MAX_CONNECTIONS: int = 50
+
+    # Bearer token Prometheus scrapes /metrics with; unset turns the
+    # endpoint off
+    METRICS_TOKEN: SecretStr | None = None
+
+    # Threads that run bcrypt off the event loop
+    BCRYPT_WORKERS: int = 4
+
+    # Processes for CPU-bound rendering, see project.core.executors.
+    # None means one per CPU.
+    PROCESS_POOL_WORKERS: int | None = None
+    REPORT_CARD_CACHE_DIR: Path = Path(tempfile.gettempdir()) / "report_cards"
+
+    # Uploaded images, see project.core.media
+    MEDIA_ROOT: Path = Path(tempfile.gettempdir()) / "media"
+    MEDIA_MAX_UPLOAD_BYTES: int = 10 * 1024 * 1024
+    MEDIA_MAX_PIXELS: int = 40_000_000
+    MEDIA_THUMBNAIL_SIZES: tuple[int, ...] = (64, 256)
+
+    # Compiled saved-view queries kept per process
+    SAVED_VIEW_CACHE_SIZE: int = 256
+
+    # Rendered iCal feeds are dropped when an event changes; the TTL only
+    # clears out feeds nobody asks for any more
+    EVENT_CALENDAR_CACHE_TTL: int = 60 * 60 * 24
 
     @computed_field
     @property
@@ -88,6 +128,20 @@ class Settings(BaseSettings):
             path=self.POSTGRES_DB,
         )
 
+    @computed_field
+    @property
+    def SQLALCHEMY_REPLICA_DATABASE_URI(self) -> PostgresDsn | None:
+        if not self.POSTGRES_REPLICA_SERVER:
+            return None
+        return PostgresDsn.build(
+            scheme="postgresql+asyncpg",
+            username=self.POSTGRES_USER,
+            password=self.POSTGRES_PASSWORD.get_secret_value(),
+            host=self.POSTGRES_REPLICA_SERVER,
+            port=self.POSTGRES_REPLICA_PORT or self.POSTGRES_PORT,
+            path=self.POSTGRES_DB,
+        )
+
     @computed_field
     @property
     def REDIS_URL(self) -> RedisDsn:
@@ -100,6 +154,22 @@ class Settings(BaseSettings):
             port=self.REDIS_PORT,
         )
 
+    # Response compression, see project.core.compression. Smaller bodies
+    # are not worth the CPU or the gzip header.
+    COMPRESSION_MIN_BYTES: int = 1024
+    COMPRESSION_LEVEL: int = 6
+    # Distinct precompressed bodies (calendar feeds) kept per process
+    COMPRESSION_CACHE_SIZE: int = 128
+
+    # OpenAPI schema written at build time by `python -m project.openapi`;
+    # without it the schema is generated on the first request for it
+    OPENAPI_SCHEMA_FILE: Path | None = None
+
+    # Per-request query accounting, see project.core.query_stats
+    QUERY_BUDGET_MODE: Literal["off", "warn", "raise"] = "warn"
+    QUERY_BUDGET: int = 50
+    QUERY_REPEAT_THRESHOLD: int = 10
+
     BACKEND_CORS_ORIGINS: Annotated[
         list[AnyUrl] | str, BeforeValidator(parse_cors)
     ] = []
@@ -121,6 +191,35 @@ class Settings(BaseSettings):
     EMAILS_FROM_NAME: EmailStr
     EMAIL_RESET_TOKEN_EXPIRE_HOURS: int = 48
 
+    # Wrong guesses allowed before a password-recovery OTP is discarded
+    OTP_MAX_ATTEMPTS: int = 5
+
+    # Outbound mail worker (see project.workers.mail)
+    MAIL_BATCH_SIZE: int = 50
+    MAIL_SMTP_POOL_SIZE: int = 2
+    MAIL_MAX_ATTEMPTS: int = 5
+    MAIL_RETRY_BASE_SECONDS: float = 30
+    # A worker silent for this long is presumed dead and its mail requeued
+    MAIL_WORKER_TIMEOUT_SECONDS: float = 120
+
+    # Unfinished registration wizards are dropped after this long
+    REGISTRATION_DRAFT_TTL_SECONDS: int = 60 * 60 * 24
+
+    # Replayed responses for retried POSTs (see routers.idempotency)
+    IDEMPOTENCY_TTL_SECONDS: int = 60 * 60 * 24
+    # How long a duplicate waits for the first request to finish
+    IDEMPOTENCY_LOCK_SECONDS: int = 30
+
+    # Background job worker (see project.workers.jobs)
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_TIMEOUT_SECONDS: float = 15 * 60
+    # A worker silent for this long is presumed dead and its jobs requeued
+    JOB_WORKER_TIMEOUT_SECONDS: float = 30
+    JOB_RESULT_TTL_SECONDS: int = 60 * 60 * 24 * 7
+    JOB_IDEMPOTENCY_TTL_SECONDS: int = 60 * 60 * 24
+    # Status changes for up to this many students run inside the request
+    JOB_INLINE_STUDENT_LIMIT: int = 200
+
     @model_validator(mode="after")
     def _set_default_emails_from(self) -> Self:
         if not self.EMAILS_FROM_NAME:
@@ -198,17 +297,3 @@ def get_settings() -> Union[DevSettings, TestSettings, ProdSettings]:
 
 
 settings = get_settings()
-
-EmailConf = ConnectionConfig(
-    MAIL_USERNAME=settings.SMTP_USER,
-    MAIL_PASSWORD=settings.SMTP_PASSWORD,
-    MAIL_FROM=settings.EMAILS_FROM_EMAIL,
-    MAIL_PORT=settings.SMTP_PORT,
-    MAIL_SERVER=settings.SMTP_HOST,
-    MAIL_FROM_NAME=settings.EMAILS_FROM_NAME,
-    MAIL_STARTTLS=settings.SMTP_TLS,
-    MAIL_SSL_TLS=settings.SMTP_SSL,
-    USE_CREDENTIALS=True,
-    VALIDATE_CERTS=True,
-    TEMPLATE_FOLDER=Path(__file__).parent.parent / "templates",
-)
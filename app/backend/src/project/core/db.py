@@ -1,17 +1,127 @@
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+import logging
+import time
+from typing import Any, Optional
+
+from sqlalchemy import Engine, Select, select, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
 
 from project.core.config import settings
+from project.core.query_stats import install_query_listeners
 from project.core.security import get_password_hash
+from project.core.tenancy import install_search_path
 from project.models import AuthIdentity
 from project.models.admin import Admin
 from project.models.user import User
 from project.utils.enum import AuthProviderEnum, RoleEnum
 
+logger = logging.getLogger(__name__)
+
+# A connection may serve another school's schema on its next checkout,
+# where the same SQL would hit tables and enum types with other OIDs, so
+# statements cannot be kept prepared across checkouts
+_connect_args = (
+    {"prepared_statement_cache_size": 0, "statement_cache_size": 0}
+    if settings.MULTI_TENANT
+    else {}
+)
+
 # Create the engine
 engine = create_async_engine(
-    str(settings.SQLALCHEMY_POSTGRES_DATABASE_URI), future=True
+    str(settings.SQLALCHEMY_POSTGRES_DATABASE_URI),
+    future=True,
+    connect_args=_connect_args,
 )
+install_query_listeners(engine.sync_engine)
+install_search_path(engine.sync_engine)
+
+replica_engine: Optional[AsyncEngine] = None
+if settings.SQLALCHEMY_REPLICA_DATABASE_URI:
+    replica_engine = create_async_engine(
+        str(settings.SQLALCHEMY_REPLICA_DATABASE_URI),
+        future=True,
+        connect_args=_connect_args,
+    )
+    install_query_listeners(replica_engine.sync_engine)
+    install_search_path(replica_engine.sync_engine)
+
+# Keys of Session.info
+READ_REPLICA = "read_replica"
+WROTE = "wrote"
+
+
+class RoutingSession(Session):
+    """
+    Sends plain SELECTs to the engine in ``info[READ_REPLICA]``, when set,
+    and everything else to the primary. Sessions note in ``info[WROTE]``
+    whether they wrote anything, so the caller can pin the client to the
+    primary until the replica has caught up.
+    """
+
+    def get_bind(self, mapper: Any = None, *, clause: Any = None, **kw: Any) -> Engine:
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info[WROTE] = True
+        elif isinstance(clause, Select) and READ_REPLICA in self.info:
+            return self.info[READ_REPLICA]
+        return engine.sync_engine
+
+
+# Sessions for request handlers and background jobs alike
+AsyncSessionLocal = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    expire_on_commit=False,
+)
+
+# How often the replica's lag is measured, at most
+_LAG_CHECK_INTERVAL = 1.0
+_lag_checked_at = 0.0
+_replica_usable = False
+
+
+async def replica_usable() -> bool:
+    """
+    Whether a replica is configured and no more than
+    REPLICA_MAX_LAG_SECONDS behind. Measured at most once a second per
+    process; a replica that cannot be reached counts as unusable.
+    """
+    global _lag_checked_at, _replica_usable
+    if replica_engine is None:
+        return False
+
+    now = time.monotonic()
+    if now - _lag_checked_at < _LAG_CHECK_INTERVAL:
+        return _replica_usable
+    _lag_checked_at = now
+
+    try:
+        async with replica_engine.connect() as conn:
+            # An idle primary sends nothing new, so a replica that has
+            # replayed all it received is current however old the last
+            # replayed transaction is
+            lag = await conn.scalar(
+                text(
+                    "SELECT CASE"
+                    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()"
+                    " THEN 0"
+                    " ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())"
+                    " END"
+                )
+            )
+    except Exception as e:
+        logger.warning(f"Read replica unavailable: {e}")
+        _replica_usable = False
+        return False
+
+    _replica_usable = lag is not None and lag <= settings.REPLICA_MAX_LAG_SECONDS
+    return _replica_usable
 
 
 async def init_db(session: AsyncSession) -> None:
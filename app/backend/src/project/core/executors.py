@@ -0,0 +1,31 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from project.core.config import settings
+
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Return the shared pool for CPU-bound work such as rendering images.
+
+    Workers are spawned rather than forked so they never inherit the event
+    loop, open sockets or the bcrypt threads of the API process. The pool is
+    created on first use to keep startup and the tests that never need it
+    cheap.
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=settings.PROCESS_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(cancel_futures=True)
+        _process_pool = None
@@ -0,0 +1,138 @@
+"""
+Google ID-token verification without blocking the event loop.
+
+Google signs ID tokens with a small, slowly rotating RSA key set published
+as JWKS. The keys are kept in process and in Redis for as long as Google's
+``Cache-Control: max-age`` allows, so verifying a token is normally a pure
+CPU operation. The network is only touched when the cache has expired or a
+token names a key we have not seen yet.
+"""
+
+import asyncio
+import json
+import re
+import time
+from typing import Any, Dict
+
+import httpx
+import jwt
+from redis.asyncio import Redis
+
+from project.core.config import settings
+
+GOOGLE_JWKS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
+# Used when Google omits max-age, and as a floor between forced refetches
+# so tokens with made-up key ids cannot make us hammer the endpoint.
+DEFAULT_MAX_AGE = 3600
+MIN_REFRESH_INTERVAL = 60
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+def parse_max_age(cache_control: str | None) -> int:
+    """Return the max-age directive of a Cache-Control header, in seconds."""
+    match = _MAX_AGE.search(cache_control or "")
+    return int(match.group(1)) if match else DEFAULT_MAX_AGE
+
+
+class GoogleTokenVerifier:
+    """Verify Google ID tokens against a cached copy of Google's JWKS."""
+
+    def __init__(
+        self,
+        client_id: str,
+        *,
+        jwks_url: str = GOOGLE_JWKS_URL,
+        http_client: httpx.AsyncClient | None = None,
+        redis_key: str = "google:jwks",
+    ) -> None:
+        self.client_id = client_id
+        self.jwks_url = jwks_url
+        self.redis_key = redis_key
+        self._http_client = http_client
+
+        self._keys: Dict[str, jwt.PyJWK] = {}
+        self._expires_at = 0.0
+        self._refreshed_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def verify(self, token: str, redis_client: Redis) -> Dict[str, Any]:
+        """
+        Return the claims of `token` if Google signed it for this client.
+
+        Raises ``jwt.PyJWTError`` for anything that does not verify.
+        """
+        kid = jwt.get_unverified_header(token).get("kid")
+        if not kid:
+            raise jwt.InvalidTokenError("Token has no key id")
+
+        key = await self._signing_key(kid, redis_client)
+        return jwt.decode(
+            token,
+            key,
+            algorithms=["RS256"],
+            audience=self.client_id,
+            issuer=GOOGLE_ISSUERS,
+        )
+
+    async def _signing_key(self, kid: str, redis_client: Redis) -> jwt.PyJWK:
+        if time.monotonic() < self._expires_at and kid in self._keys:
+            return self._keys[kid]
+
+        async with self._lock:
+            # Another coroutine may have refreshed while we waited
+            if time.monotonic() >= self._expires_at:
+                await self._load(redis_client, force=False)
+            if kid not in self._keys:
+                await self._load(redis_client, force=True)
+
+        if kid not in self._keys:
+            raise jwt.InvalidKeyError(f"Unknown signing key {kid!r}")
+        return self._keys[kid]
+
+    async def _load(self, redis_client: Redis, *, force: bool) -> None:
+        if not force:
+            cached, ttl = await self._from_redis(redis_client)
+            if cached is not None:
+                self._store(cached, ttl)
+                return
+        elif time.monotonic() - self._refreshed_at < MIN_REFRESH_INTERVAL:
+            return
+
+        jwks, max_age = await self._fetch()
+        self._refreshed_at = time.monotonic()
+        self._store(jwks, max_age)
+        await redis_client.set(self.redis_key, json.dumps(jwks), ex=max(max_age, 1))
+
+    async def _from_redis(
+        self, redis_client: Redis
+    ) -> tuple[Dict[str, Any] | None, int]:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.get(self.redis_key)
+            pipe.ttl(self.redis_key)
+            raw, ttl = await pipe.execute()
+
+        if raw is None or ttl <= 0:
+            return None, 0
+        return json.loads(raw), ttl
+
+    async def _fetch(self) -> tuple[Dict[str, Any], int]:
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(timeout=5)
+
+        response = await self._http_client.get(self.jwks_url)
+        response.raise_for_status()
+        return response.json(), parse_max_age(response.headers.get("cache-control"))
+
+    def _store(self, jwks: Dict[str, Any], max_age: int) -> None:
+        self._keys = {
+            key.key_id: key
+            for key in jwt.PyJWKSet.from_dict(jwks).keys
+            if key.key_id is not None
+        }
+        self._expires_at = time.monotonic() + max_age
+
+
+google_verifier = GoogleTokenVerifier(settings.GOOGLE_CLIENT_ID)
@@ -0,0 +1,56 @@
+"""
+Content-addressed image storage.
+
+An upload is stored once under the SHA-256 of its bytes, so the same photo
+uploaded twice costs nothing. Rows reference it as ``<sha256>.<ext>``, which
+never changes meaning and can therefore be served with an immutable cache
+lifetime.
+
+    MEDIA_ROOT/originals/ab/<sha256>.<ext>
+    MEDIA_ROOT/thumbnails/<size>/ab/<sha256>.jpg
+"""
+
+import re
+from pathlib import Path
+from typing import Optional
+
+from project.core.config import settings
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_IMAGE_REF = re.compile(r"^(?P<digest>[0-9a-f]{64})\.(?P<ext>jpg|png|webp|gif)$")
+
+
+def parse_image_ref(ref: Optional[str]) -> Optional[re.Match[str]]:
+    """Match a stored ``<sha256>.<ext>`` reference; legacy values do not match."""
+    return _IMAGE_REF.match(ref) if ref else None
+
+
+def original_path(digest: str, ext: str) -> Path:
+    return settings.MEDIA_ROOT / "originals" / digest[:2] / f"{digest}.{ext}"
+
+
+def thumbnail_path(digest: str, size: int) -> Path:
+    return settings.MEDIA_ROOT / "thumbnails" / str(size) / digest[:2] / f"{digest}.jpg"
+
+
+def upload_dir() -> Path:
+    # Inside MEDIA_ROOT so finished uploads can be renamed into place
+    return settings.MEDIA_ROOT / "uploads"
+
+
+def image_url(ref: str) -> str:
+    return f"{settings.API_V1_STR}/media/images/{ref}"
+
+
+def thumbnail_url(ref: Optional[str], size: Optional[int] = None) -> Optional[str]:
+    """
+    URL of the thumbnail for a stored image reference.
+
+    Defaults to the smallest configured size, which is what rosters show.
+    """
+    match = parse_image_ref(ref)
+    if match is None:
+        return None
+    size = size or min(settings.MEDIA_THUMBNAIL_SIZES)
+    return f"{settings.API_V1_STR}/media/images/{match['digest']}/thumbnails/{size}"
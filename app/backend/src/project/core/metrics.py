@@ -0,0 +1,136 @@
+"""
+Prometheus metrics for the API.
+
+When ``PROMETHEUS_MULTIPROC_DIR`` is set (see ``gunicorn.conf.py``) every
+worker writes its samples to that directory and the scrape endpoint merges
+them, so the numbers cover all workers and not just the one serving it.
+"""
+
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy.pool import QueuePool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from project.core.db import engine
+from project.core.query_stats import route_template
+from project.core.redis import redis_pool
+from project.core.security import password_executor
+
+METRICS_CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time spent serving a request, by route template.",
+    ["method", "route", "status"],
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "Size of response bodies, by route template.",
+    ["method", "route"],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "Requests currently being served.",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Database pool connections by state.",
+    ["state"],
+    multiprocess_mode="livesum",
+)
+REDIS_POOL_CONNECTIONS = Gauge(
+    "redis_pool_connections",
+    "Redis pool connections by state.",
+    ["state"],
+    multiprocess_mode="livesum",
+)
+BCRYPT_QUEUE_DEPTH = Gauge(
+    "bcrypt_executor_queue_depth",
+    "Password hashing jobs waiting for a bcrypt thread.",
+    multiprocess_mode="livesum",
+)
+
+
+def sample_pools() -> None:
+    """Copy the current pool and executor occupancy into their gauges."""
+    pool = engine.sync_engine.pool
+    if isinstance(pool, QueuePool):
+        DB_POOL_CONNECTIONS.labels("checked_out").set(pool.checkedout())
+        DB_POOL_CONNECTIONS.labels("idle").set(pool.checkedin())
+        DB_POOL_CONNECTIONS.labels("overflow").set(max(pool.overflow(), 0))
+
+    REDIS_POOL_CONNECTIONS.labels("in_use").set(len(redis_pool._in_use_connections))
+    REDIS_POOL_CONNECTIONS.labels("available").set(
+        len(redis_pool._available_connections)
+    )
+
+    BCRYPT_QUEUE_DEPTH.set(password_executor._work_queue.qsize())
+
+
+def render_metrics() -> bytes:
+    """
+    Serialise all metrics in the Prometheus text format.
+
+    Reading the multiprocess directory touches one file per worker, so call
+    this from a thread rather than the event loop.
+    """
+    sample_pools()
+
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+
+    return generate_latest(REGISTRY)
+
+
+class MetricsMiddleware:
+    """Record latency, response size and in-flight count for HTTP requests."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        size = 0
+        started = time.perf_counter()
+
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.labels(method).inc()
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            REQUESTS_IN_FLIGHT.labels(method).dec()
+
+            # Label by template, not raw path, to keep cardinality bounded
+            route = route_template(scope) or "unmatched"
+            REQUEST_LATENCY.labels(method, route, str(status)).observe(
+                time.perf_counter() - started
+            )
+            RESPONSE_SIZE.labels(method, route).observe(size)
+            sample_pools()
@@ -0,0 +1,162 @@
+"""Per-request SQL query accounting and N+1 detection."""
+
+import json
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from project.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\$\d+|%\(\w+\)s|\b\d+(?:\.\d+)?\b")
+_IN_LISTS = re.compile(r"\((?:\s*\?\s*,)*\s*\?\s*\)")
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Raised in ``raise`` mode when a request breaks its query budget."""
+
+
+@dataclass
+class QueryStats:
+    """Queries issued while serving a single request."""
+
+    count: int = 0
+    duration: float = 0.0
+    fingerprints: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.fingerprints[fingerprint(statement)] += 1
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """Statements executed at least `threshold` times, the N+1 suspects."""
+        return {
+            statement: count
+            for statement, count in self.fingerprints.most_common()
+            if count >= threshold
+        }
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> QueryStats | None:
+    """Return the stats of the request being served, if any."""
+    return _current_stats.get()
+
+
+def fingerprint(statement: str) -> str:
+    """Normalise a statement so calls differing only in parameters compare equal."""
+    statement = _LITERALS.sub("?", statement)
+    statement = _IN_LISTS.sub("(...)", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+def route_template(scope: Scope) -> str | None:
+    """Return the full path template of the route that matched `scope`."""
+    # Newer FastAPI resolves included routers lazily and keeps the prefixed
+    # path on the effective route context rather than on the route itself.
+    context = scope.get("fastapi", {}).get("effective_route_context")
+    if context is not None:
+        return context.path
+    return getattr(scope.get("route"), "path", None)
+
+
+def install_query_listeners(engine: Engine) -> None:
+    """Feed cursor executions on `engine` into the current request's stats."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(
+        conn: Any, cursor: Any, statement: str, *args: Any
+    ) -> None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(
+        conn: Any, cursor: Any, statement: str, *args: Any
+    ) -> None:
+        started = conn.info["query_start_time"].pop()
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(statement, time.perf_counter() - started)
+
+
+class QueryStatsMiddleware:
+    """
+    Count the queries behind each HTTP request.
+
+    Adds a ``Server-Timing`` header, logs one JSON line per request and,
+    depending on ``QUERY_BUDGET_MODE``, warns or raises when a route goes
+    over ``QUERY_BUDGET`` or repeats a statement ``QUERY_REPEAT_THRESHOLD``
+    times.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or settings.QUERY_BUDGET_MODE == "off":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+
+        async def send_with_stats(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                self._check_budget(scope, stats, message["status"])
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries"',
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            _current_stats.reset(token)
+
+    def _check_budget(self, scope: Scope, stats: QueryStats, status: int) -> None:
+        path = route_template(scope) or scope["path"]
+        repeated = stats.repeated(settings.QUERY_REPEAT_THRESHOLD)
+        over_budget = stats.count > settings.QUERY_BUDGET
+
+        logger.info(
+            json.dumps(
+                {
+                    "event": "query_stats",
+                    "method": scope["method"],
+                    "route": path,
+                    "status": status,
+                    "queries": stats.count,
+                    "db_ms": round(stats.duration * 1000, 2),
+                    "repeated": repeated,
+                }
+            )
+        )
+
+        if not over_budget and not repeated:
+            return
+
+        message = (
+            f"{scope['method']} {path} issued {stats.count} queries "
+            f"(budget {settings.QUERY_BUDGET}), "
+            f"{len(repeated)} statement(s) repeated "
+            f">= {settings.QUERY_REPEAT_THRESHOLD} times"
+        )
+        if settings.QUERY_BUDGET_MODE == "raise":
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
@@ -0,0 +1,15 @@
+from redis.asyncio import ConnectionPool, Redis
+
+from project.core.config import settings
+
+# Shared by every request so connections are reused instead of reopened
+redis_pool = ConnectionPool.from_url(
+    str(settings.REDIS_URL),
+    decode_responses=True,
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+)
+
+
+def get_redis_client() -> Redis:
+    """Return a client backed by the process-wide connection pool."""
+    return Redis(connection_pool=redis_pool)
@@ -1,4 +1,6 @@
+import asyncio
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -14,6 +16,11 @@ from project.utils.enum import RoleEnum
 
 ALGORITHM = "HS256"
 
+# bcrypt is deliberately slow; hashing on the event loop stalls every request
+password_executor = ThreadPoolExecutor(
+    max_workers=settings.BCRYPT_WORKERS, thread_name_prefix="bcrypt"
+)
+
 
 def check_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
@@ -33,11 +40,26 @@ def get_password_hash(password: SecretStr) -> str:
     return hashed_bytes.decode("utf-8")
 
 
+async def check_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash on the bcrypt executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        password_executor, check_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: SecretStr) -> str:
+    """Hash a password on the bcrypt executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, get_password_hash, password)
+
+
 def create_access_token(
     *,
     subject: str,
     role: RoleEnum,
     expires_delta: timedelta | None = None,
+    tenant: str | None = None,
 ) -> str:
     if expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
@@ -53,6 +75,9 @@ def create_access_token(
         "jti": str(uuid.uuid4()),  # Unique identifier for token
         "iat": datetime.now(timezone.utc),  # Issued at time
     }
+    # Tokens only work for the school they were issued by
+    if tenant is not None:
+        to_encode["tenant"] = tenant
     return jwt.encode(
         to_encode,
         settings.SECRET_KEY.get_secret_value(),
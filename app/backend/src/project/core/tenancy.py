@@ -0,0 +1,172 @@
+"""
+One deployment serving many schools, each in its own Postgres schema.
+
+With ``MULTI_TENANT`` on, :class:`TenantMiddleware` works out the school of
+every request, from its subdomain under ``TENANT_BASE_DOMAIN`` or else from
+the ``tenant`` claim of its access token, and keeps it in a context
+variable. Connections from the shared pool get their ``search_path``
+pointed at that school's schema when checked out, so models and raw SQL
+need no schema of their own. Shared objects (extensions) live in
+``public``, which stays on the path.
+
+Redis keys go through :func:`tenant_key`. In-process caches are keyed on
+content (compiled saved views, report cards, media) and need no prefix.
+"""
+
+import re
+import time
+from contextvars import ContextVar
+from typing import Any, Optional, Set
+
+import jwt
+from jwt.exceptions import InvalidTokenError
+from sqlalchemy import Connection, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from project.core.config import settings
+from project.core.security import ALGORITHM
+
+TENANT_SCHEMA_PREFIX = "school_"
+_SLUG = re.compile(r"^[a-z][a-z0-9_]{0,39}$")
+
+_current_tenant: ContextVar[Optional[str]] = ContextVar("tenant", default=None)
+
+
+def current_tenant() -> Optional[str]:
+    """The school being served, if any."""
+    return _current_tenant.get()
+
+
+def set_tenant(tenant: Optional[str]) -> Any:
+    """Switch tenants, e.g. in a job worker; returns a token for `reset_tenant`."""
+    return _current_tenant.set(tenant)
+
+
+def reset_tenant(token: Any) -> None:
+    _current_tenant.reset(token)
+
+
+def valid_tenant(tenant: str) -> bool:
+    return bool(_SLUG.match(tenant))
+
+
+def tenant_schema(tenant: str) -> str:
+    if not valid_tenant(tenant):
+        raise ValueError(f"Invalid tenant {tenant!r}")
+    return f"{TENANT_SCHEMA_PREFIX}{tenant}"
+
+
+def tenant_key(key: str) -> str:
+    """Prefix a Redis key with the current school, if there is one."""
+    tenant = current_tenant()
+    return f"t:{tenant}:{key}" if tenant else key
+
+
+def _tenant_from_host(host: str) -> Optional[str]:
+    base = settings.TENANT_BASE_DOMAIN
+    host = host.split(":", 1)[0].lower()
+    if base and host.endswith(f".{base}"):
+        subdomain = host[: -len(base) - 1]
+        if "." not in subdomain:
+            return subdomain
+    return None
+
+
+def _tenant_from_token(authorization: str) -> Optional[str]:
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        payload = jwt.decode(
+            token,
+            settings.SECRET_KEY.get_secret_value(),
+            algorithms=[ALGORITHM],
+        )
+    except InvalidTokenError:
+        return None
+    return payload.get("tenant")
+
+
+class TenantMiddleware:
+    """Resolve the school of each request; unknown slugs get a 404."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.MULTI_TENANT:
+            await self.app(scope, receive, send)
+            return
+
+        headers = {
+            name.decode("latin-1"): value.decode("latin-1")
+            for name, value in scope["headers"]
+            if name in (b"host", b"authorization")
+        }
+        tenant = _tenant_from_host(headers.get("host", "")) or _tenant_from_token(
+            headers.get("authorization", "")
+        )
+        if tenant is not None and not valid_tenant(tenant):
+            response = JSONResponse({"detail": "School not found."}, status_code=404)
+            await response(scope, receive, send)
+            return
+
+        token = set_tenant(tenant)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            reset_tenant(token)
+
+
+def install_search_path(engine: Engine) -> None:
+    """Point each connection checked out of `engine` at the current school."""
+    if not settings.MULTI_TENANT:
+        return
+
+    @event.listens_for(engine, "checkout")
+    def _set_search_path(
+        dbapi_connection: Any, connection_record: Any, connection_proxy: Any
+    ) -> None:
+        tenant = current_tenant()
+        schema = tenant_schema(tenant) if tenant else "public"
+        # Connections are mostly handed to the same school again, so only
+        # switch when it changed
+        if connection_record.info.get("search_path") == schema:
+            return
+        dbapi_connection.run_async(
+            lambda conn: conn.execute(f'SET search_path TO "{schema}", public')
+        )
+        connection_record.info["search_path"] = schema
+
+
+# Known schools per process: reloaded every _TENANTS_TTL seconds, or
+# sooner when asked about one not seen yet, e.g. a freshly migrated school
+_TENANTS_TTL = 30.0
+_TENANTS_MISS_TTL = 3.0
+_tenants: Set[str] = set()
+_tenants_loaded_at = 0.0
+
+
+def list_tenants(connection: Connection) -> Set[str]:
+    rows = connection.execute(
+        text(
+            "SELECT substr(schema_name, :start) FROM information_schema.schemata"
+            " WHERE starts_with(schema_name, :prefix)"
+        ),
+        {"start": len(TENANT_SCHEMA_PREFIX) + 1, "prefix": TENANT_SCHEMA_PREFIX},
+    )
+    return set(rows.scalars())
+
+
+async def tenant_exists(tenant: str, engine: AsyncEngine) -> bool:
+    """Whether `tenant` has a schema in the database behind `engine`."""
+    global _tenants, _tenants_loaded_at
+    age = time.monotonic() - _tenants_loaded_at
+    if age > _TENANTS_TTL or (tenant not in _tenants and age > _TENANTS_MISS_TTL):
+        async with engine.connect() as conn:
+            _tenants = await conn.run_sync(list_tenants)
+        _tenants_loaded_at = time.monotonic()
+    return tenant in _tenants
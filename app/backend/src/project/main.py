@@ -1,6 +1,10 @@
 #!/usr/bin/python3
 """Main module for the API"""
 
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.exceptions import ResponseValidationError
 from fastapi.responses import JSONResponse
@@ -8,10 +12,32 @@ from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
 
 from project.api.v1 import api_router
+from project.core.compression import CompressionMiddleware
 from project.core.config import settings
+from project.core.db import AsyncSessionLocal, engine, init_db
+from project.core.executors import shutdown_process_pool
+from project.core.metrics import MetricsMiddleware
+from project.core.query_stats import QueryStatsMiddleware
+from project.core.tenancy import TenantMiddleware
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Seed the first superuser once per process, not on every request.
+    # Schools get theirs from migrate_tenants.py, as no school is current here
+    if not settings.MULTI_TENANT:
+        async with AsyncSessionLocal() as session:
+            await init_db(session)
+
+    yield
+
+    shutdown_process_pool()
+    await engine.dispose()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
+    lifespan=lifespan,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     redirect_slashes=False,
     docs_url=None
@@ -24,6 +50,12 @@ app = FastAPI(
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+app.add_middleware(QueryStatsMiddleware)  # ty:ignore[invalid-argument-type]
+app.add_middleware(MetricsMiddleware)  # ty:ignore[invalid-argument-type]
+app.add_middleware(TenantMiddleware)  # ty:ignore[invalid-argument-type]
+# Outside MetricsMiddleware, so response sizes there stay uncompressed
+app.add_middleware(CompressionMiddleware)  # ty:ignore[invalid-argument-type]
+
 
 # Set all CORS enabled origins
 if settings.all_cors_origins:
@@ -50,6 +82,12 @@ def use_route_names_as_operation_ids(app: FastAPI) -> None:
 
 use_route_names_as_operation_ids(app)
 
+# Serve the schema written at build time instead of generating it from
+# every route on the first request to each worker
+if settings.OPENAPI_SCHEMA_FILE and settings.OPENAPI_SCHEMA_FILE.is_file():
+    openapi_schema = json.loads(settings.OPENAPI_SCHEMA_FILE.read_text())
+    app.openapi = lambda: openapi_schema  # ty:ignore[invalid-assignment]
+
 
 @app.exception_handler(ResponseValidationError)
 async def validation_exception_handler(
@@ -36,6 +36,7 @@ from project.models.teacher_record import TeacherRecord
 from project.models.teacher_record_link import TeacherRecordLink
 from project.models.user import User
 from project.models.year import Year
+from project.models.year_stat_counter import YearStatCounter
 from project.models.yearly_subject import YearlySubject
 
 __all__ = [
@@ -74,5 +75,6 @@ __all__ = [
     "TeacherRecordLink",
     "User",
     "Year",
+    "YearStatCounter",
     "YearlySubject",
 ]
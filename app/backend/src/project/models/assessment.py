@@ -21,15 +21,22 @@ class Assessment(BaseModel):
 
     __tablename__ = "assessments"
     student_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(), ForeignKey("students.id", ondelete="CASCADE"), nullable=False
+        UUID(),
+        ForeignKey("students.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     student_term_record_id: Mapped[uuid.UUID] = mapped_column(
         UUID(),
         ForeignKey("student_term_records.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
     yearly_subject_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(), ForeignKey("yearly_subjects.id", ondelete="CASCADE"), nullable=False
+        UUID(),
+        ForeignKey("yearly_subjects.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     # The subject sum score of the student for each assessment
     total: Mapped[float] = mapped_column(Float, nullable=True, default=None)
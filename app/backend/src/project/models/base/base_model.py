@@ -4,8 +4,9 @@
 import uuid
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import UUID, DateTime, MetaData
+from sqlalchemy import UUID, Connection, DateTime, Index, MetaData, event, text
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
@@ -39,6 +40,27 @@ class Base(DeclarativeBase):
     metadata = MetaData(naming_convention=POSTGRES_CONVENTION)
 
 
+# Extensions that indexes depend on. Migrations create them explicitly, this
+# covers schemas built straight from the metadata (tests, benchmarks).
+POSTGRES_EXTENSIONS = ("pg_trgm", "btree_gist")
+
+
+@event.listens_for(Base.metadata, "before_create")
+def _create_extensions(target: MetaData, connection: Connection, **kw: Any) -> None:
+    for extension in POSTGRES_EXTENSIONS:
+        connection.execute(text(f"CREATE EXTENSION IF NOT EXISTS {extension}"))
+
+
+def trigram_index(table: str, column: str) -> Index:
+    """GIN trigram index, which lets `ILIKE '%term%'` avoid a full scan."""
+    return Index(
+        f"ix_{table}_{column}_trgm",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    )
+
+
 @dataclass
 class AssociationBase(Base):
     __abstract__ = True
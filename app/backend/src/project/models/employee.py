@@ -9,6 +9,7 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -17,7 +18,7 @@ from sqlalchemy.ext.associationproxy import AssociationProxy, association_proxy
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from project.models.base.base_model import BaseModel
+from project.models.base.base_model import BaseModel, trigram_index
 from project.models.grade import Grade
 from project.models.teacher_record import TeacherRecord
 from project.utils.enum import (
@@ -216,4 +217,15 @@ class Employee(BaseModel):
 
     __table_args__ = (
         CheckConstraint("gpa >= 0.0 AND gpa <= 4.0", name="check_employee_gpa_range"),
+        # What the employee and teacher lists filter and sort on,
+        # see project.api.v1.routers.filtering
+        Index("ix_employees_first_name", "first_name"),
+        Index("ix_employees_father_name", "father_name"),
+        Index("ix_employees_gender", "gender"),
+        Index("ix_employees_position", "position"),
+        Index("ix_employees_status", "status"),
+        Index("ix_employees_subject_id", "subject_id"),
+        Index("ix_employees_created_at", "created_at"),
+        trigram_index("employees", "first_name"),
+        trigram_index("employees", "father_name"),
     )
@@ -2,7 +2,8 @@
 """Module for Section class"""
 
 import uuid
-from typing import TYPE_CHECKING
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy import (
     UUID,
@@ -12,9 +13,11 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -62,8 +65,13 @@ class Event(BaseModel):
 
     start_date: Mapped[Date] = mapped_column(Date, nullable=False)
     end_date: Mapped[Date] = mapped_column(Date, nullable=False)
-    start_time: Mapped[DateTime] = mapped_column(DateTime)
-    end_time: Mapped[DateTime] = mapped_column(DateTime)
+    # None for all-day events
+    start_time: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True, default=None
+    )
+    end_time: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True, default=None
+    )
 
     location: Mapped[str] = mapped_column(
         String(50),
@@ -74,6 +82,7 @@ class Event(BaseModel):
             native_enum=False,
         ),
         nullable=True,
+        default=None,
     )
     is_hybrid: Mapped[bool] = mapped_column(Boolean, default=False)
     online_link: Mapped[str] = mapped_column(Text, nullable=True, default=None)
@@ -106,4 +115,13 @@ class Event(BaseModel):
     __table_args__ = (
         CheckConstraint("start_date <= end_date", name="check_event_dates"),
         CheckConstraint("start_time <= end_time", name="check_event_times"),
+        # Answers "events of this year overlapping these dates", see
+        # project.api.v1.routers.events.service.overlapping, which has to
+        # spell the range exactly like this for the index to apply
+        Index(
+            "ix_events_year_id_dates",
+            "year_id",
+            text("daterange(start_date, end_date, '[]')"),
+            postgresql_using="gist",
+        ),
     )
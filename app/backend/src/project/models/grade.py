@@ -4,9 +4,9 @@
 import uuid
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import UUID, Enum, ForeignKey
+from sqlalchemy import UUID, Enum, ForeignKey, Index, SmallInteger
 from sqlalchemy.ext.associationproxy import AssociationProxy, association_proxy
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from project.models.base.base_model import BaseModel
 from project.utils.enum import GradeEnum, GradeLevelEnum
@@ -52,6 +52,16 @@ class Grade(BaseModel):
         nullable=False,
     )
     has_stream: Mapped[bool] = mapped_column(nullable=False, default=False)
+    # Derived from `grade`, so ordering and range scans happen in SQL
+    ordinal: Mapped[int] = mapped_column(SmallInteger, nullable=False, init=False)
+
+    __table_args__ = (Index("ix_grades_year_id_ordinal", "year_id", "ordinal"),)
+
+    @validates("grade")
+    def _sync_ordinal(self, key: str, value: GradeEnum) -> GradeEnum:
+        """Keep `ordinal` in step with `grade` on insert and update."""
+        self.ordinal = GradeEnum(value).ordinal
+        return value
 
     # Many-To-One Relationships
     year: Mapped["Year"] = relationship(
@@ -4,7 +4,7 @@
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import UUID, Enum, Float, ForeignKey, Integer
+from sqlalchemy import UUID, Enum, Float, ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from project.models.base.base_model import BaseModel
@@ -27,7 +27,10 @@ class MarkList(BaseModel):
     __tablename__ = "mark_lists"
 
     student_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(), ForeignKey("students.id", ondelete="CASCADE"), nullable=False
+        UUID(),
+        ForeignKey("students.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     student_term_record_id: Mapped[uuid.UUID] = mapped_column(
         UUID(),
@@ -35,7 +38,10 @@ class MarkList(BaseModel):
         nullable=False,
     )
     subject_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(), ForeignKey("subjects.id", ondelete="CASCADE"), nullable=False
+        UUID(),
+        ForeignKey("subjects.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     type: Mapped[MarkListTypeEnum] = mapped_column(
         Enum(
@@ -49,6 +55,14 @@ class MarkList(BaseModel):
     percentage: Mapped[int] = mapped_column(Integer, nullable=False)
     score: Mapped[float] = mapped_column(Float, nullable=True, default=None)
 
+    __table_args__ = (
+        Index(
+            "ix_mark_lists_student_term_record_id_subject_id",
+            "student_term_record_id",
+            "subject_id",
+        ),
+    )
+
     # Relationships
     student: Mapped["Student"] = relationship(
         "Student",
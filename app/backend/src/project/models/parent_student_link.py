@@ -22,6 +22,7 @@ class ParentStudentLink(BaseModel):
         UUID(),
         ForeignKey("students.id", ondelete="CASCADE"),
         primary_key=True,
+        index=True,
     )
 
     __table_args__ = (
@@ -11,13 +11,14 @@ from sqlalchemy import (
     Date,
     Enum,
     ForeignKey,
+    Index,
     String,
     Text,
 )
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from project.models.base.base_model import BaseModel
+from project.models.base.base_model import BaseModel, trigram_index
 from project.utils.enum import BloodTypeEnum, GenderEnum, StudentApplicationStatusEnum
 
 if TYPE_CHECKING:
@@ -45,6 +46,7 @@ class Student(BaseModel):
     registered_for_grade_id: Mapped[uuid.UUID] = mapped_column(
         UUID(),
         ForeignKey("grades.id"),
+        index=True,
     )
     # Personal Information
     first_name: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -112,6 +114,19 @@ class Student(BaseModel):
         default=StudentApplicationStatusEnum.PENDING,
     )
 
+    # What the students list filters and sorts on,
+    # see project.api.v1.routers.filtering
+    __table_args__ = (
+        Index("ix_students_first_name", "first_name"),
+        Index("ix_students_father_name", "father_name"),
+        Index("ix_students_date_of_birth", "date_of_birth"),
+        Index("ix_students_gender", "gender"),
+        Index("ix_students_status", "status"),
+        Index("ix_students_created_at", "created_at"),
+        trigram_index("students", "first_name"),
+        trigram_index("students", "father_name"),
+    )
+
     @hybrid_property
     def full_name(self):
         return f"{self.first_name} {self.father_name} {self.grand_father_name}"
@@ -22,4 +22,5 @@ class StudentGradeLink(Base):
         UUID(),
         ForeignKey("grades.id", ondelete="CASCADE"),
         primary_key=True,
+        index=True,
     )
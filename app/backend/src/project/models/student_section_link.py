@@ -22,4 +22,5 @@ class StudentSectionLink(Base):
         UUID(),
         ForeignKey("sections.id", ondelete="CASCADE"),
         primary_key=True,
+        index=True,
     )
@@ -22,4 +22,5 @@ class StudentStreamLink(Base):
         UUID(),
         ForeignKey("streams.id", ondelete="CASCADE"),
         primary_key=True,
+        index=True,
     )
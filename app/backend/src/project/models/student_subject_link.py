@@ -22,6 +22,7 @@ class StudentSubjectLink(Base):
         UUID(),
         ForeignKey("subjects.id", ondelete="CASCADE"),
         primary_key=True,
+        index=True,
     )
 
     average: Mapped[float] = mapped_column(Float, nullable=True, default=None)
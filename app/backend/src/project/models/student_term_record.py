@@ -4,7 +4,7 @@
 import uuid
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import UUID, Float, ForeignKey, Integer
+from sqlalchemy import UUID, Float, ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from project.models.base.base_model import BaseModel
@@ -32,7 +32,10 @@ class StudentTermRecord(BaseModel):
         UUID(), ForeignKey("academic_terms.id", ondelete="CASCADE"), nullable=False
     )
     grade_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(), ForeignKey("grades.id", ondelete="CASCADE"), nullable=False
+        UUID(),
+        ForeignKey("grades.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     section_id: Mapped[uuid.UUID] = mapped_column(
         UUID(), ForeignKey("sections.id", ondelete="CASCADE"), nullable=False
@@ -47,6 +50,19 @@ class StudentTermRecord(BaseModel):
     average: Mapped[float] = mapped_column(Float, nullable=True, default=None)
     rank: Mapped[int] = mapped_column(Integer, nullable=True, default=None)
 
+    __table_args__ = (
+        Index(
+            "ix_student_term_records_academic_term_id_section_id",
+            "academic_term_id",
+            "section_id",
+        ),
+        Index(
+            "ix_student_term_records_student_id_academic_term_id",
+            "student_id",
+            "academic_term_id",
+        ),
+    )
+
     # One-To-Many Relationships
     student: Mapped["Student"] = relationship(
         "Student",
@@ -4,7 +4,7 @@
 import uuid
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import UUID, Float, ForeignKey, Integer
+from sqlalchemy import UUID, Float, ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column
 
 from project.models.base.base_model import BaseModel
@@ -20,7 +20,10 @@ class StudentYearRecord(BaseModel):
 
     __tablename__ = "student_year_records"
     student_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(), ForeignKey("students.id", ondelete="CASCADE"), nullable=False
+        UUID(),
+        ForeignKey("students.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     grade_id: Mapped[uuid.UUID] = mapped_column(
         UUID(), ForeignKey("grades.id", ondelete="CASCADE"), nullable=False
@@ -38,3 +41,7 @@ class StudentYearRecord(BaseModel):
         Float, nullable=True, default=None
     )  # year-end score
     rank: Mapped[int] = mapped_column(Integer, nullable=True, default=None)
+
+    __table_args__ = (
+        Index("ix_student_year_records_year_id_grade_id", "year_id", "grade_id"),
+    )
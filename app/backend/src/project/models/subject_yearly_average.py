@@ -17,15 +17,22 @@ if TYPE_CHECKING:
 class SubjectYearlyAverage(BaseModel):
     __tablename__ = "subject_yearly_averages"
     student_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(), ForeignKey("students.id", ondelete="CASCADE"), nullable=False
+        UUID(),
+        ForeignKey("students.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     yearly_subject_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(), ForeignKey("yearly_subjects.id", ondelete="CASCADE"), nullable=False
+        UUID(),
+        ForeignKey("yearly_subjects.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     student_year_record_id: Mapped[uuid.UUID] = mapped_column(
         UUID(),
         ForeignKey("student_year_records.id", ondelete="CASCADE"),
         nullable=True,
+        index=True,
     )
     # The actual average score of the student in this for all subject
     average: Mapped[float] = mapped_column(Float, nullable=True, default=None)
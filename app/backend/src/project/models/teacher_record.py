@@ -30,12 +30,14 @@ class TeacherRecord(BaseModel):
         UUID(),
         ForeignKey("academic_terms.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
     grade_stream_subject_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(),
         ForeignKey("grade_stream_subjects.id", ondelete="SET NULL"),
         nullable=True,
         default=None,
+        index=True,
     )
 
     __table_args__ = (
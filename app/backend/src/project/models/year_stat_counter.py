@@ -0,0 +1,33 @@
+#!/usr/bin/python3
+"""Module for YearStatCounter class"""
+
+import uuid
+from dataclasses import dataclass
+
+from sqlalchemy import UUID, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from project.models.base.base_model import Base
+
+
+@dataclass
+class YearStatCounter(Base):
+    """
+    One running count behind the admin dashboard, e.g. the number of
+    students in a grade or of pending registrations in a year.
+
+    Rows are adjusted in the same transaction as the change they count,
+    see project.api.v1.routers.statistics.service.
+    """
+
+    __tablename__ = "year_stat_counters"
+
+    year_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(),
+        ForeignKey("years.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # What is counted, e.g. "grade", and which bucket, e.g. a grade ID
+    dimension: Mapped[str] = mapped_column(String(20), primary_key=True)
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
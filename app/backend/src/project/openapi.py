@@ -0,0 +1,29 @@
+"""
+Write the API's OpenAPI schema to a file.
+
+    python -m project.openapi openapi.json
+
+The image serves the written file (see ``OPENAPI_SCHEMA_FILE``), so no
+worker spends its first request on generating the schema.
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from fastapi import FastAPI
+
+from project.main import app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write the OpenAPI schema.")
+    parser.add_argument("path", type=Path, help="file to write the schema to")
+    args = parser.parse_args()
+
+    # Generate from the routes, not from a previously written file
+    args.path.write_text(json.dumps(FastAPI.openapi(app)))
+
+
+if __name__ == "__main__":
+    main()
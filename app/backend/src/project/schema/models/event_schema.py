@@ -36,8 +36,8 @@ class EventSchema(BaseModel):
     organizer: EventOrganizerEnum
     start_date: date
     end_date: date
-    start_time: datetime
-    end_time: datetime
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
     location: Optional[EventLocationEnum] = None
     is_hybrid: bool = False
     online_link: Optional[str] = None
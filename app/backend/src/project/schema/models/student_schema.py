@@ -4,8 +4,9 @@ import uuid
 from datetime import date
 from typing import TYPE_CHECKING, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
+from project.core.media import thumbnail_url
 from project.utils.enum import BloodTypeEnum, GenderEnum, StudentApplicationStatusEnum
 from project.utils.utils import to_camel
 
@@ -68,6 +69,12 @@ class StudentSchema(BaseModel):
         """
         return {"id", "first_name", "father_name", "date_of_birth"}
 
+    @computed_field
+    @property
+    def photo_thumbnail_url(self) -> Optional[str]:
+        """Small thumbnail for rosters, instead of the full-size photo."""
+        return thumbnail_url(self.student_photo)
+
 
 class StudentRelatedSchema(BaseModel):
     """This model represents the relationships of a StudentSchema."""
@@ -3,8 +3,9 @@ from __future__ import annotations
 import uuid
 from typing import TYPE_CHECKING, List, Optional
 
-from pydantic import AwareDatetime, BaseModel, ConfigDict
+from pydantic import AwareDatetime, BaseModel, ConfigDict, computed_field
 
+from project.core.media import thumbnail_url
 from project.utils.enum import RoleEnum
 from project.utils.utils import to_camel
 
@@ -37,6 +38,12 @@ class UserSchema(BaseModel):
             "imagePath",
         }
 
+    @computed_field
+    @property
+    def image_thumbnail_url(self) -> Optional[str]:
+        """Small thumbnail of the profile image."""
+        return thumbnail_url(self.image_path)
+
 
 class UserRelatedSchema(BaseModel):
     """This model represents the relationships of a UserSchema.
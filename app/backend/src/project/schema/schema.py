@@ -46,3 +46,4 @@ class TokenPayload(BaseModel):
     role: RoleEnum
     jti: uuid.UUID
     iat: datetime
+    tenant: str | None = None
@@ -343,6 +343,14 @@ class GradeEnum(str, Enum):
     GRADE_ELEVEN = "11"
     GRADE_TWELVE = "12"
 
+    @property
+    def ordinal(self) -> int:
+        """Position of the grade in promotion order, GRADE_ONE being 1."""
+        return _GRADE_ORDINALS[self]
+
+
+_GRADE_ORDINALS = {grade: index for index, grade in enumerate(GradeEnum, start=1)}
+
 
 class SectionEnum(str, Enum):
     SECTION_A = "A"
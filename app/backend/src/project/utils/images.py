@@ -0,0 +1,64 @@
+"""
+Image decoding and thumbnailing.
+
+Like ``project.utils.report_card`` this runs inside worker processes and
+imports nothing from the rest of the project.
+"""
+
+import os
+import warnings
+from typing import Dict, Tuple
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+# Pillow format name -> extension originals are stored under
+FORMATS = {"JPEG": "jpg", "PNG": "png", "WEBP": "webp", "GIF": "gif"}
+
+
+class UnsupportedImage(ValueError):
+    """The upload is not an image we accept, or is too large to decode."""
+
+
+def _save_atomically(image: Image.Image, path: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    image.save(tmp, format="JPEG", quality=85, optimize=True)
+    os.replace(tmp, path)
+
+
+def make_thumbnails(
+    source: str, targets: Dict[int, str], max_pixels: int
+) -> Tuple[str, int, int]:
+    """
+    Decode `source` and write a JPEG thumbnail to each path in `targets`,
+    keyed by the longest edge in pixels.
+
+    Returns the extension of the source format and its dimensions.
+    """
+    try:
+        with warnings.catch_warnings():
+            # Turn Pillow's decompression-bomb warning into a hard failure
+            warnings.simplefilter("error", Image.DecompressionBombWarning)
+            with Image.open(source) as image:
+                if image.format not in FORMATS:
+                    raise UnsupportedImage(f"Unsupported format {image.format}")
+                if image.width * image.height > max_pixels:
+                    raise UnsupportedImage("Image has too many pixels")
+
+                extension = FORMATS[image.format]
+                width, height = image.size
+
+                # Let the JPEG decoder downscale by powers of two for us
+                image.draft("RGB", (max(targets), max(targets)))
+                image = ImageOps.exif_transpose(image).convert("RGB")
+
+                for size, path in sorted(targets.items(), reverse=True):
+                    image.thumbnail((size, size), Image.Resampling.LANCZOS)
+                    _save_atomically(image, path)
+    except (UnidentifiedImageError, OSError) as exc:
+        # Pillow's messages name the temporary file, keep them out of the API
+        raise UnsupportedImage("Not a readable image") from exc
+    except (Image.DecompressionBombError, Image.DecompressionBombWarning) as exc:
+        raise UnsupportedImage("Image has too many pixels") from exc
+
+    return extension, width, height
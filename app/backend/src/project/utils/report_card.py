@@ -0,0 +1,130 @@
+"""
+Report-card rendering.
+
+Everything here runs inside worker processes, so the module deliberately
+imports nothing from the rest of the project: cards arrive as plain frozen
+dataclasses and leave as encoded PNG or PDF bytes.
+"""
+
+import io
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Literal, Optional, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+CardFormat = Literal["pdf", "png"]
+
+# Bump when the layout changes so cached cards are rendered again
+RENDER_VERSION = 1
+
+# A4 at 150 dpi
+PAGE_SIZE = (1240, 1754)
+DPI = 150
+MARGIN = 90
+ROW_HEIGHT = 44
+
+_UNSAFE_FILENAME = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+@dataclass(frozen=True)
+class SubjectRow:
+    name: str
+    scores: Tuple[Optional[float], ...]
+
+
+@dataclass(frozen=True)
+class ReportCard:
+    """Everything printed on one student's card, one column per term."""
+
+    key: str
+    school: str
+    year: str
+    student_name: str
+    grade: str
+    section: str
+    terms: Tuple[str, ...]
+    subjects: Tuple[SubjectRow, ...]
+    averages: Tuple[Optional[float], ...]
+    ranks: Tuple[Optional[int], ...]
+    final_score: Optional[float]
+    final_rank: Optional[int]
+    updated_at: datetime
+
+    def filename(self, fmt: CardFormat) -> str:
+        stem = f"grade-{self.grade}{self.section}-{self.student_name}-{self.key[:8]}"
+        return f"{_UNSAFE_FILENAME.sub('_', stem)}.{fmt}"
+
+
+@lru_cache(maxsize=None)
+def _font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    return ImageFont.load_default(size=size)
+
+
+def _fmt(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:g}"
+
+
+def render_card(card: ReportCard, fmt: CardFormat) -> bytes:
+    """Draw `card` on an A4 page and encode it as `fmt`."""
+    page = Image.new("RGB", PAGE_SIZE, "white")
+    draw = ImageDraw.Draw(page)
+    width = PAGE_SIZE[0] - 2 * MARGIN
+
+    y = MARGIN
+    draw.text((MARGIN, y), card.school, fill="black", font=_font(48))
+    y += 70
+    draw.text((MARGIN, y), f"Report card - {card.year}", fill="#444444", font=_font(32))
+    y += 70
+
+    for label, value in (
+        ("Student", card.student_name),
+        ("Grade", f"{card.grade} {card.section}"),
+    ):
+        draw.text((MARGIN, y), f"{label}: {value}", fill="black", font=_font(28))
+        y += 42
+    y += 30
+
+    # Subject column takes what the term columns leave over
+    term_width = min(180, width // (len(card.terms) + 2))
+    subject_width = width - term_width * len(card.terms)
+    columns = [MARGIN + subject_width + i * term_width for i in range(len(card.terms))]
+
+    table_top = y
+    draw.rectangle((MARGIN, y, MARGIN + width, y + ROW_HEIGHT), fill="#e8edf3")
+    draw.text((MARGIN + 12, y + 8), "Subject", fill="black", font=_font(26))
+    for x, term in zip(columns, card.terms):
+        draw.text((x + 12, y + 8), f"Term {term}", fill="black", font=_font(26))
+    y += ROW_HEIGHT
+
+    rows = [(row.name, tuple(map(_fmt, row.scores))) for row in card.subjects]
+    rows.append(("Average", tuple(map(_fmt, card.averages))))
+    rows.append(("Rank", tuple(map(_fmt, card.ranks))))
+
+    for i, (name, cells) in enumerate(rows):
+        if i % 2:
+            draw.rectangle((MARGIN, y, MARGIN + width, y + ROW_HEIGHT), fill="#f7f9fb")
+        draw.text((MARGIN + 12, y + 8), name, fill="black", font=_font(24))
+        for x, cell in zip(columns, cells):
+            draw.text((x + 12, y + 8), cell, fill="black", font=_font(24))
+        y += ROW_HEIGHT
+
+    draw.rectangle((MARGIN, table_top, MARGIN + width, y), outline="#c0c8d2")
+    y += 40
+
+    if card.final_score is not None or card.final_rank is not None:
+        draw.text(
+            (MARGIN, y),
+            f"Year result: {_fmt(card.final_score)}  Rank: {_fmt(card.final_rank)}",
+            fill="black",
+            font=_font(28),
+        )
+
+    buffer = io.BytesIO()
+    if fmt == "pdf":
+        page.save(buffer, format="PDF", resolution=DPI)
+    else:
+        page.save(buffer, format="PNG", dpi=(DPI, DPI), optimize=False)
+    return buffer.getvalue()
@@ -71,12 +71,9 @@ def generate_subject_code(subject: str) -> str:
     return code
 
 
-def sort_grade_key(grade: Grade) -> tuple[int, int | str]:
-    grade_value = grade.grade.value  # Get the actual enum value
-    if grade_value.isdigit():
-        return (1, int(grade_value))  # Numbers: type=1, numeric value
-    else:
-        return (0, grade_value)  # Strings: type=0, string value
+def sort_grade_key(grade: Grade) -> int:
+    """Sort grades by the ordinal persisted alongside the GradeEnum value."""
+    return grade.ordinal
 
 
 def to_camel(string: str) -> str:
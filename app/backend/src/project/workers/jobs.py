@@ -0,0 +1,393 @@
+"""
+Background jobs for admin operations that outlive an HTTP request.
+
+Request handlers call :func:`enqueue_job` and answer 202 with the job id;
+clients poll ``GET /jobs/{id}`` for status, progress and the result. A
+:class:`JobWorker` process takes jobs with BLMOVE, which parks each id on
+the worker's own processing list until the job is finished. Should the
+worker die mid-job, another worker notices its heartbeat has stopped and
+puts the id back on the queue, and a restarted worker does the same with
+its own list, so every job runs at least once. Handlers must therefore be
+safe to run twice. One transaction keeps a half-done run from sticking, but
+a second delivery can follow a run that already committed, so a handler
+either checks for its own earlier work (year setup looks for the year's
+grades) or writes values that are the same the second time (a status
+change).
+
+Handlers register with :func:`job_handler` in the service module that owns
+the operation, listed in ``HANDLER_MODULES``.
+
+Run the worker with ``python -m project.workers.jobs``.
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncContextManager,
+    Awaitable,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+)
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    multiprocess,
+    start_http_server,
+)
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from project.core.config import settings
+from project.core.tenancy import current_tenant, reset_tenant, set_tenant, tenant_key
+
+logger = logging.getLogger(__name__)
+
+QUEUE_KEY = "jobs:queue"
+WORKERS_KEY = "jobs:workers"
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+# Modules whose handlers the worker loads
+HANDLER_MODULES = (
+    "project.api.v1.routers.year.service",
+    "project.api.v1.routers.students.service",
+)
+
+JOB_RUNS = Counter(
+    "job_runs_total",
+    "Background job attempts, by job name and outcome.",
+    ["name", "outcome"],
+)
+JOB_DURATION = Histogram(
+    "job_duration_seconds",
+    "Time a background job attempt spent running.",
+    ["name"],
+)
+JOB_WAIT = Histogram(
+    "job_wait_seconds",
+    "Time between enqueueing a job and a worker starting it.",
+    ["name"],
+)
+
+
+def job_key(job_id: str) -> str:
+    return f"jobs:job:{job_id}"
+
+
+def _processing_key(worker_id: str) -> str:
+    return f"jobs:processing:{worker_id}"
+
+
+@dataclass
+class JobContext:
+    """What a handler gets besides its payload."""
+
+    job_id: str
+    session: AsyncSession
+    redis: Redis
+
+    async def progress(
+        self, done: int, total: int, message: Optional[str] = None
+    ) -> None:
+        """Record how far the job got, for clients polling its status."""
+        mapping: Dict[str, Any] = {"done": done, "total": total}
+        if message is not None:
+            mapping["message"] = message
+        await self.redis.hset(job_key(self.job_id), mapping=mapping)  # ty:ignore[invalid-await]
+
+
+JobHandler = Callable[[JobContext, Dict[str, Any]], Awaitable[Any]]
+JOB_HANDLERS: Dict[str, JobHandler] = {}
+
+
+def job_handler(name: str) -> Callable[[JobHandler], JobHandler]:
+    """Register a coroutine as the handler of jobs called `name`."""
+
+    def register(handler: JobHandler) -> JobHandler:
+        JOB_HANDLERS[name] = handler
+        return handler
+
+    return register
+
+
+# Creates the job and queues it, unless the idempotency key already names
+# a job, in which case that job's id is returned instead.
+# KEYS: job hash, queue, idempotency key ("" for none)
+# ARGV: job id, idempotency ttl, then the job's fields and values
+ENQUEUE_SCRIPT = """
+if KEYS[3] ~= '' then
+    local existing = redis.call('GET', KEYS[3])
+    if existing then
+        return existing
+    end
+    redis.call('SET', KEYS[3], ARGV[1], 'EX', ARGV[2])
+end
+redis.call('HSET', KEYS[1], unpack(ARGV, 3))
+redis.call('RPUSH', KEYS[2], ARGV[1])
+return ARGV[1]
+"""
+
+
+async def enqueue_job(
+    redis_client: Redis,
+    name: str,
+    payload: Dict[str, Any],
+    *,
+    user_id: uuid.UUID,
+    idempotency_key: Optional[str] = None,
+) -> Tuple[str, bool]:
+    """
+    Queue a job and return its id and whether it is new. Enqueueing again
+    with the same user, name and idempotency key returns the first job.
+    """
+    job_id = str(uuid.uuid4())
+    fields = {
+        "id": job_id,
+        "name": name,
+        "user_id": str(user_id),
+        "payload": json.dumps(payload, default=str),
+        "status": QUEUED,
+        "attempts": 0,
+        "enqueued_at": time.time(),
+        "tenant": current_tenant() or "",
+    }
+    idempotency = (
+        tenant_key(f"jobs:idempotency:{user_id}:{name}:{idempotency_key}")
+        if idempotency_key
+        else ""
+    )
+
+    queued = await redis_client.eval(  # ty:ignore[invalid-await]
+        ENQUEUE_SCRIPT,
+        3,
+        job_key(job_id),
+        QUEUE_KEY,
+        idempotency,
+        job_id,
+        settings.JOB_IDEMPOTENCY_TTL_SECONDS,
+        *(item for pair in fields.items() for item in pair),
+    )
+    return queued, queued == job_id
+
+
+async def get_job(redis_client: Redis, job_id: str) -> Optional[Dict[str, str]]:
+    job = await redis_client.hgetall(job_key(job_id))  # ty:ignore[invalid-await]
+    return job or None
+
+
+SessionFactory = Callable[[], AsyncContextManager[AsyncSession]]
+
+
+class JobWorker:
+    """Run queued jobs one at a time, each in its own database session."""
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        session_factory: SessionFactory,
+        *,
+        worker_id: Optional[str] = None,
+        max_attempts: int = settings.JOB_MAX_ATTEMPTS,
+        timeout: float = settings.JOB_TIMEOUT_SECONDS,
+        worker_timeout: float = settings.JOB_WORKER_TIMEOUT_SECONDS,
+    ) -> None:
+        self.redis = redis_client
+        self.session_factory = session_factory
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.processing_key = _processing_key(self.worker_id)
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+        self.worker_timeout = worker_timeout
+
+    async def run_once(self, wait: float = 0) -> bool:
+        """
+        Run the next job, waiting up to `wait` seconds for one (0 returns
+        at once). Returns whether there was a job.
+        """
+        await self.heartbeat()
+        if wait:
+            job_id = await self.redis.blmove(
+                QUEUE_KEY,
+                self.processing_key,
+                wait,  # ty:ignore[invalid-argument-type]
+                "LEFT",
+                "RIGHT",
+            )
+        else:
+            job_id = await self.redis.lmove(
+                QUEUE_KEY, self.processing_key, "LEFT", "RIGHT"
+            )
+        if job_id is None:
+            return False
+
+        await self._run(job_id)
+        await self.redis.lrem(self.processing_key, 1, job_id)  # ty:ignore[invalid-await]
+        return True
+
+    async def run_forever(self, poll_interval: float = 1.0) -> None:
+        """Run jobs until cancelled, beating and reaping in the background."""
+        # Under a fixed id (PID 1 in a container) this is the list the
+        # previous run of this worker left behind
+        await self._requeue(self.worker_id)
+        await self.requeue_orphans()
+        beats = asyncio.create_task(self._beat_forever())
+        try:
+            while True:
+                await self.run_once(wait=poll_interval)
+        finally:
+            beats.cancel()
+            await self.redis.hdel(WORKERS_KEY, self.worker_id)
+
+    async def heartbeat(self) -> None:
+        await self.redis.hset(WORKERS_KEY, self.worker_id, str(time.time()))  # ty:ignore[invalid-await]
+
+    async def requeue_orphans(self) -> int:
+        """Put back the jobs of workers whose heartbeat has stopped."""
+        requeued = 0
+        now = time.time()
+        beats = await self.redis.hgetall(WORKERS_KEY)  # ty:ignore[invalid-await]
+        for worker_id, beat in beats.items():
+            if worker_id == self.worker_id or now - float(beat) < self.worker_timeout:
+                continue
+            requeued += await self._requeue(worker_id)
+            await self.redis.hdel(WORKERS_KEY, worker_id)  # ty:ignore[invalid-await]
+        return requeued
+
+    async def _requeue(self, worker_id: str) -> int:
+        requeued = 0
+        # Moved one by one, so a crash here loses nothing either
+        while await self.redis.lmove(
+            _processing_key(worker_id), QUEUE_KEY, "RIGHT", "LEFT"
+        ):
+            requeued += 1
+        if requeued:
+            logger.warning("Requeued %s jobs of worker %s", requeued, worker_id)
+        return requeued
+
+    async def _beat_forever(self) -> None:
+        while True:
+            await self.heartbeat()
+            await self.requeue_orphans()
+            await asyncio.sleep(self.worker_timeout / 3)
+
+    async def _run(self, job_id: str) -> None:
+        key = job_key(job_id)
+        job = await get_job(self.redis, job_id)
+        if job is None or job["status"] in (SUCCEEDED, FAILED):
+            # Expired, or delivered again after it already finished
+            return
+
+        name = job["name"]
+        started = time.time()
+        attempts = await self.redis.hincrby(key, "attempts", 1)  # ty:ignore[invalid-await]
+        await self.redis.hset(  # ty:ignore[invalid-await]
+            key,
+            mapping={
+                "status": RUNNING,
+                "started_at": started,
+                "worker": self.worker_id,
+            },
+        )
+        JOB_WAIT.labels(name).observe(started - float(job["enqueued_at"]))
+
+        handler = JOB_HANDLERS.get(name)
+        # Run in the school that queued the job, so sessions and keys match
+        tenant = set_tenant(job.get("tenant") or None)
+        try:
+            if handler is None:
+                raise LookupError(f"No handler for job {name!r}")
+            async with self.session_factory() as session:
+                context = JobContext(job_id=job_id, session=session, redis=self.redis)
+                result = await asyncio.wait_for(
+                    handler(context, json.loads(job["payload"])), self.timeout
+                )
+        except Exception as exc:
+            elapsed = time.time() - started
+            JOB_DURATION.labels(name).observe(elapsed)
+            logger.warning("Job %s (%s) failed: %r", job_id, name, exc)
+            if handler is not None and attempts < self.max_attempts:
+                JOB_RUNS.labels(name, "retried").inc()
+                async with self.redis.pipeline(transaction=True) as pipe:
+                    pipe.hset(key, mapping={"status": QUEUED, "error": repr(exc)})
+                    pipe.rpush(QUEUE_KEY, job_id)
+                    await pipe.execute()
+                return
+            JOB_RUNS.labels(name, FAILED).inc()
+            await self._finish(key, FAILED, started, error=repr(exc))
+            return
+        finally:
+            reset_tenant(tenant)
+
+        JOB_DURATION.labels(name).observe(time.time() - started)
+        JOB_RUNS.labels(name, SUCCEEDED).inc()
+        await self._finish(
+            key, SUCCEEDED, started, result=json.dumps(result, default=str)
+        )
+
+    async def _finish(
+        self, key: str, status: str, started: float, **fields: str
+    ) -> None:
+        finished = time.time()
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(
+                key,
+                mapping={
+                    "status": status,
+                    "finished_at": finished,
+                    "run_seconds": finished - started,
+                    **fields,
+                },
+            )
+            pipe.expire(key, settings.JOB_RESULT_TTL_SECONDS)
+            await pipe.execute()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run queued background jobs.")
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    parser.add_argument("--metrics-port", type=int, default=9103)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    registry = REGISTRY
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    start_http_server(args.metrics_port, registry=registry)
+
+    for module in HANDLER_MODULES:
+        importlib.import_module(module)
+
+    async def run() -> None:
+        from project.core.db import AsyncSessionLocal
+
+        redis_client = Redis.from_url(str(settings.REDIS_URL), decode_responses=True)
+        worker = JobWorker(redis_client, AsyncSessionLocal)
+        try:
+            await worker.run_forever(args.poll_interval)
+        finally:
+            await redis_client.aclose()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+"""
+Outbound mail queue.
+
+Request handlers call :func:`enqueue_mail`, which only pushes a JSON job onto
+a Redis list. A separate :class:`MailWorker` process drains the list in
+batches over a small pool of SMTP connections that stay open between
+batches, so sending a few hundred registration mails costs a few handshakes
+rather than one per message. Failed sends are retried with exponential
+backoff and parked on a dead-letter list once they run out of attempts.
+
+A worker moves each job onto its own processing list before sending it and
+removes it only once it was sent, scheduled for a retry or dead-lettered.
+Jobs left there by a worker that stopped are put back on the queue, when it
+starts again or once its heartbeat has gone quiet.
+
+Run the worker with ``python -m project.workers.mail``.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from dataclasses import dataclass
+from email.message import EmailMessage
+from email.utils import formataddr
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    multiprocess,
+    start_http_server,
+)
+from pydantic import NameEmail
+from redis.asyncio import Redis
+
+from project.core.config import Settings, settings
+
+# The API imports this module only to enqueue mail, so the SMTP client and
+# Jinja are loaded by the worker when it starts
+if TYPE_CHECKING:
+    import aiosmtplib
+    from jinja2 import Template
+
+logger = logging.getLogger(__name__)
+
+QUEUE_KEY = "mail:queue"
+RETRY_KEY = "mail:retry"
+DEAD_KEY = "mail:dead"
+STATS_KEY = "mail:stats"
+WORKERS_KEY = "mail:workers"
+
+TEMPLATE_FOLDER = Path(__file__).parent.parent / "templates"
+
+MAIL_MESSAGES = Counter(
+    "mail_messages_total",
+    "Outbound mail processed by the worker, by outcome.",
+    ["outcome"],
+)
+MAIL_BATCH_DURATION = Histogram(
+    "mail_batch_duration_seconds",
+    "Time spent rendering and sending one batch of mail.",
+)
+MAIL_QUEUE_DEPTH = Gauge(
+    "mail_queue_depth",
+    "Mail jobs waiting in Redis, by list.",
+    ["queue"],
+    multiprocess_mode="livesum",
+)
+
+
+def _processing_key(worker_id: str) -> str:
+    return f"mail:processing:{worker_id}"
+
+
+async def enqueue_mail(
+    redis_client: Redis,
+    *,
+    template: str,
+    subject: str,
+    recipients: List[NameEmail],
+    context: Dict[str, Any],
+) -> str:
+    """Queue a templated message for the mail worker and return its job id."""
+    job_id = str(uuid.uuid4())
+    job = {
+        "id": job_id,
+        "template": template,
+        "subject": subject,
+        "to": [{"name": r.name, "email": r.email} for r in recipients],
+        "context": context,
+        "attempts": 0,
+    }
+
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.rpush(QUEUE_KEY, json.dumps(job))
+        pipe.hincrby(STATS_KEY, "enqueued", 1)
+        await pipe.execute()
+
+    return job_id
+
+
+async def mail_stats(redis_client: Redis) -> Dict[str, int]:
+    """Return lifetime counters and current queue lengths."""
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.hgetall(STATS_KEY)
+        pipe.llen(QUEUE_KEY)
+        pipe.zcard(RETRY_KEY)
+        pipe.llen(DEAD_KEY)
+        counters, queued, retrying, dead = await pipe.execute()
+
+    stats = {key: int(value) for key, value in counters.items()}
+    stats.update(queued=queued, retrying=retrying, dead=dead)
+    return stats
+
+
+@dataclass
+class SMTPSettings:
+    """Where and as whom the worker sends mail."""
+
+    hostname: str
+    port: int
+    sender: str
+    username: str | None = None
+    password: str | None = None
+    use_tls: bool = False
+    start_tls: bool | None = None
+    validate_certs: bool = True
+
+    @classmethod
+    def from_settings(cls, config: Settings) -> "SMTPSettings":
+        return cls(
+            hostname=config.SMTP_HOST,
+            port=config.SMTP_PORT,
+            sender=formataddr((config.EMAILS_FROM_NAME, config.EMAILS_FROM_EMAIL)),
+            username=config.SMTP_USER,
+            password=config.SMTP_PASSWORD.get_secret_value(),
+            use_tls=config.SMTP_SSL,
+            start_tls=config.SMTP_TLS,
+        )
+
+    def connection(self) -> "aiosmtplib.SMTP":
+        import aiosmtplib
+
+        return aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            use_tls=self.use_tls,
+            start_tls=self.start_tls,
+            validate_certs=self.validate_certs,
+        )
+
+
+class MailWorker:
+    """Drain the mail queue over a pool of persistent SMTP connections."""
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        smtp: SMTPSettings,
+        *,
+        batch_size: int = settings.MAIL_BATCH_SIZE,
+        pool_size: int = settings.MAIL_SMTP_POOL_SIZE,
+        max_attempts: int = settings.MAIL_MAX_ATTEMPTS,
+        retry_base_seconds: float = settings.MAIL_RETRY_BASE_SECONDS,
+        worker_id: str | None = None,
+        worker_timeout: float = settings.MAIL_WORKER_TIMEOUT_SECONDS,
+    ) -> None:
+        self.redis = redis_client
+        self.smtp = smtp
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.processing_key = _processing_key(self.worker_id)
+        self.worker_timeout = worker_timeout
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+
+        from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+        self.templates = Environment(
+            loader=FileSystemLoader(TEMPLATE_FOLDER),
+            autoescape=select_autoescape(["html"]),
+        )
+
+        self._connections: asyncio.Queue["aiosmtplib.SMTP"] = asyncio.Queue()
+        for _ in range(pool_size):
+            self._connections.put_nowait(smtp.connection())
+
+    async def run_once(self) -> int:
+        """Send one batch and return how many jobs it contained."""
+        await self.heartbeat()
+        await self._promote_due_retries()
+
+        # Moved one at a time, so a job is always on exactly one list
+        raw_jobs: List[str] = []
+        while len(raw_jobs) < self.batch_size:
+            raw = await self.redis.lmove(
+                QUEUE_KEY, self.processing_key, "LEFT", "RIGHT"
+            )
+            if raw is None:
+                break
+            raw_jobs.append(raw)
+        if not raw_jobs:
+            await self._sample_depth()
+            return 0
+
+        started = time.perf_counter()
+        # Each template is parsed once per batch, not once per message
+        templates: Dict[str, "Template"] = {}
+        await asyncio.gather(*(self._deliver(raw, templates) for raw in raw_jobs))
+
+        MAIL_BATCH_DURATION.observe(time.perf_counter() - started)
+        await self._sample_depth()
+        return len(raw_jobs)
+
+    async def run_forever(self, poll_interval: float = 1.0) -> None:
+        """Process batches until cancelled, sleeping while the queue is empty."""
+        await self.requeue_orphans()
+        try:
+            while True:
+                if not await self.run_once():
+                    await self.requeue_orphans()
+                    await asyncio.sleep(poll_interval)
+        finally:
+            await self.redis.hdel(WORKERS_KEY, self.worker_id)
+            await self.close()
+
+    async def heartbeat(self) -> None:
+        await self.redis.hset(WORKERS_KEY, self.worker_id, str(time.time()))  # ty:ignore[invalid-await]
+
+    async def requeue_orphans(self) -> int:
+        """
+        Put back the jobs this worker left unfinished in an earlier life, and
+        those of workers whose heartbeat has stopped.
+        """
+        requeued = 0
+        now = time.time()
+        beats = await self.redis.hgetall(WORKERS_KEY)  # ty:ignore[invalid-await]
+        stopped = [
+            worker_id
+            for worker_id, beat in beats.items()
+            if worker_id != self.worker_id and now - float(beat) >= self.worker_timeout
+        ]
+        for worker_id in [self.worker_id, *stopped]:
+            while await self.redis.lmove(
+                _processing_key(worker_id), QUEUE_KEY, "RIGHT", "LEFT"
+            ):
+                requeued += 1
+        if stopped:
+            await self.redis.hdel(WORKERS_KEY, *stopped)  # ty:ignore[invalid-await]
+        if requeued:
+            logger.warning("Requeued %s mail jobs of stopped workers", requeued)
+        return requeued
+
+    async def close(self) -> None:
+        """Say goodbye on every open connection."""
+        import aiosmtplib
+
+        while not self._connections.empty():
+            connection = self._connections.get_nowait()
+            if connection.is_connected:
+                try:
+                    await connection.quit()
+                except aiosmtplib.SMTPException:
+                    connection.close()
+
+    async def _deliver(self, raw: str, templates: Dict[str, "Template"]) -> None:
+        import aiosmtplib
+
+        try:
+            job = json.loads(raw)
+            if job["template"] not in templates:
+                templates[job["template"]] = self.templates.get_template(
+                    job["template"]
+                )
+            message = self._build_message(job, templates[job["template"]])
+        except Exception as exc:
+            # Retrying cannot fix a missing template or a broken job
+            logger.error("Mail job could not be rendered: %r", exc)
+            await self._dead_letter(raw)
+            return
+
+        connection = await self._connections.get()
+        try:
+            if not connection.is_connected:
+                await connection.connect()
+            await connection.send_message(message)
+        except (aiosmtplib.SMTPException, OSError) as exc:
+            # Drop the socket so the next job on this slot reconnects
+            connection.close()
+            await self._fail(raw, job, exc)
+        else:
+            MAIL_MESSAGES.labels("sent").inc()
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.lrem(self.processing_key, 1, raw)
+                pipe.hincrby(STATS_KEY, "sent", 1)
+                await pipe.execute()
+        finally:
+            self._connections.put_nowait(connection)
+
+    def _build_message(self, job: Dict[str, Any], template: "Template") -> EmailMessage:
+        message = EmailMessage()
+        message["From"] = self.smtp.sender
+        message["To"] = ", ".join(
+            formataddr((r["name"], r["email"])) for r in job["to"]
+        )
+        message["Subject"] = job["subject"]
+        message.set_content(template.render(**job["context"]), subtype="html")
+        return message
+
+    async def _fail(self, raw: str, job: Dict[str, Any], exc: Exception) -> None:
+        job["attempts"] += 1
+        logger.warning(
+            "Mail job %s failed (attempt %s): %s", job["id"], job["attempts"], exc
+        )
+
+        if job["attempts"] >= self.max_attempts:
+            await self._dead_letter(raw, json.dumps(job))
+            return
+
+        MAIL_MESSAGES.labels("retried").inc()
+        due = time.time() + self.retry_base_seconds * 2 ** (job["attempts"] - 1)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zadd(RETRY_KEY, {json.dumps(job): due})
+            pipe.lrem(self.processing_key, 1, raw)
+            pipe.hincrby(STATS_KEY, "retried", 1)
+            await pipe.execute()
+
+    async def _dead_letter(self, raw: str, dead: str | None = None) -> None:
+        MAIL_MESSAGES.labels("dead").inc()
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.rpush(DEAD_KEY, dead or raw)
+            pipe.lrem(self.processing_key, 1, raw)
+            pipe.hincrby(STATS_KEY, "dead", 1)
+            await pipe.execute()
+
+    async def _promote_due_retries(self) -> None:
+        due = await self.redis.zrangebyscore(RETRY_KEY, "-inf", time.time())
+        for raw in due:
+            # Only the worker that removes the entry gets to requeue it
+            if await self.redis.zrem(RETRY_KEY, raw):
+                await self.redis.rpush(QUEUE_KEY, raw)  # ty:ignore[invalid-await]
+
+    async def _sample_depth(self) -> None:
+        stats = await mail_stats(self.redis)
+        for queue in ("queued", "retrying", "dead"):
+            MAIL_QUEUE_DEPTH.labels(queue).set(stats[queue])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Send queued outbound mail.")
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    parser.add_argument("--metrics-port", type=int, default=9102)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    registry = REGISTRY
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    start_http_server(args.metrics_port, registry=registry)
+
+    async def run() -> None:
+        redis_client = Redis.from_url(str(settings.REDIS_URL), decode_responses=True)
+        worker = MailWorker(redis_client, SMTPSettings.from_settings(settings))
+        try:
+            await worker.run_forever(args.poll_interval)
+        finally:
+            await redis_client.aclose()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import random
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Dict, List
 
 import pytest
@@ -25,6 +26,7 @@ from project.schema.models import (
     YearWithRelatedSchema,
 )
 from project.schema.models.stream_schema import StreamWithRelatedSchema
+from project.workers.jobs import QUEUE_KEY, JobWorker
 from tests.factories.api_data import NewYearFactory, ParentRegistrationFactory
 from tests.utils.utils import get_auth_header
 
@@ -89,6 +91,19 @@ async def client(db_session: AsyncSession, test_redis: Redis):
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(scope="session")
+async def job_worker(db_session: AsyncSession, test_redis: Redis) -> JobWorker:
+    """A job worker that runs jobs in the shared test session."""
+
+    @asynccontextmanager
+    async def session_factory() -> AsyncIterator[AsyncSession]:
+        yield db_session
+
+    # Jobs left over from an earlier run point at rolled back rows
+    await test_redis.delete(QUEUE_KEY)
+    return JobWorker(test_redis, session_factory, worker_id="tests")
+
+
 @pytest.fixture(scope="session")
 async def admin_token_headers(client: AsyncClient) -> dict[str, str]:
     login_data = {
@@ -113,6 +128,7 @@ async def new_academic_year(
     client: AsyncClient,
     admin_token_headers: Dict[str, str],
     db_session: AsyncSession,
+    job_worker: JobWorker,
 ) -> NewYearSuccess:
     data = NewYearFactory.create(setup_methods="Default Template")
 
@@ -122,10 +138,14 @@ async def new_academic_year(
         headers=admin_token_headers,
     )
 
-    assert r.status_code == 201
+    assert r.status_code == 202
 
     result = NewYearSuccess.model_validate_json(r.text)
 
+    # The template is set up in the background
+    while await job_worker.run_once():
+        pass
+
     return result
 
 
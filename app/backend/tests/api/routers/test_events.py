@@ -0,0 +1,153 @@
+import uuid
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Dict
+
+import pytest
+from httpx import AsyncClient
+
+from project.api.v1.routers.events.service import render_calendar
+from project.core.config import settings
+from project.schema.models import YearSchema
+
+
+def test_render_calendar_escapes_and_folds() -> None:
+    """Test that text is escaped and long lines are folded at 75 octets."""
+    event = SimpleNamespace(
+        id=uuid.uuid4(),
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        updated_at=None,
+        title="Sports day, field; A",
+        purpose="sports",
+        start_date=date(2026, 3, 1),
+        end_date=date(2026, 3, 2),
+        start_time=None,
+        end_time=None,
+        location=None,
+        online_link=None,
+        description="ü" * 60,
+    )
+
+    feed = render_calendar(SimpleNamespace(name="2026/27"), [event])
+    lines = feed.split("\r\n")
+
+    assert r"SUMMARY:Sports day\, field\; A" in lines
+    # All-day events end the day after their last day
+    assert "DTEND;VALUE=DATE:20260303" in lines
+    assert all(len(line.encode()) <= 75 for line in lines)
+
+
+@pytest.fixture(scope="session")
+async def event(
+    client: AsyncClient,
+    admin_token_headers: Dict[str, str],
+    year: YearSchema,
+) -> Dict[str, Any]:
+    """A two-day event in the middle of March."""
+    r = await client.post(
+        f"{settings.API_V1_STR}/events",
+        json={
+            "yearId": str(year.id),
+            "title": "Sports Day",
+            "purpose": "sports",
+            "organizer": "school",
+            "startDate": "2026-03-10",
+            "endDate": "2026-03-11",
+        },
+        headers=admin_token_headers,
+    )
+    assert r.status_code == 201
+    return r.json()
+
+
+class TestEventsApi:
+    @pytest.mark.parametrize(
+        "start, end, found",
+        [
+            ("2026-03-09", "2026-03-15", True),
+            ("2026-03-11", "2026-03-11", True),
+            ("2026-03-12", "2026-03-18", False),
+        ],
+    )
+    async def test_get_events_in_range(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        year: YearSchema,
+        event: Dict[str, Any],
+        start: str,
+        end: str,
+        found: bool,
+    ) -> None:
+        """Test that only events overlapping the range are returned."""
+        r = await client.get(
+            f"{settings.API_V1_STR}/events",
+            params={"yearId": str(year.id), "start": start, "end": end},
+            headers=admin_token_headers,
+        )
+
+        assert r.status_code == 200
+        assert (event["id"] in [e["id"] for e in r.json()]) is found
+
+    async def test_calendar_feed_is_cached_until_an_event_changes(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        year: YearSchema,
+        event: Dict[str, Any],
+    ) -> None:
+        url = f"{settings.API_V1_STR}/events/years/{year.id}/calendar.ics"
+
+        r = await client.get(url, headers=admin_token_headers)
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("text/calendar")
+        assert "SUMMARY:Sports Day" in r.text
+        etag = r.headers["etag"]
+
+        r = await client.get(
+            url, headers={**admin_token_headers, "If-None-Match": etag}
+        )
+        assert r.status_code == 304
+
+        r = await client.patch(
+            f"{settings.API_V1_STR}/events/{event['id']}",
+            json={"title": "Sports Week"},
+            headers=admin_token_headers,
+        )
+        assert r.status_code == 200
+
+        r = await client.get(
+            url, headers={**admin_token_headers, "If-None-Match": etag}
+        )
+        assert r.status_code == 200
+        assert r.headers["etag"] != etag
+        assert "SUMMARY:Sports Week" in r.text
+
+    @pytest.mark.parametrize(
+        "field",
+        [
+            "title",
+            "purpose",
+            "organizer",
+            "startDate",
+            "endDate",
+            "isHybrid",
+            "hasFee",
+            "feeAmount",
+        ],
+    )
+    async def test_update_rejects_null_for_required_fields(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        event: Dict[str, Any],
+        field: str,
+    ) -> None:
+        """Test that clearing a required field is a 422, not a server error."""
+        r = await client.patch(
+            f"{settings.API_V1_STR}/events/{event['id']}",
+            json={field: None},
+            headers=admin_token_headers,
+        )
+
+        assert r.status_code == 422
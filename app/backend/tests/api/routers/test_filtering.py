@@ -0,0 +1,142 @@
+from typing import Dict, List
+
+import pytest
+from fastapi import HTTPException
+from httpx import AsyncClient
+
+from project.api.v1.routers.filtering import (
+    STUDENT_FIELDS,
+    SUBJECT_FIELDS,
+    compile_condition,
+    parse_filter,
+    parse_sort,
+)
+from project.api.v1.routers.schema import FilterCondition, SortKey
+from project.core.config import settings
+from project.models import Parent
+from project.schema.models import SectionSchema, YearWithRelatedSchema
+from tests.factories.api_data import StudentRegistrationFactory
+
+
+def test_parse_filter() -> None:
+    """Test that the value keeps everything after the second colon."""
+    assert parse_filter("createdAt:gte:2026-01-01T08:00:00") == FilterCondition(
+        field="createdAt", op="gte", value="2026-01-01T08:00:00"
+    )
+    assert parse_filter("status:in:active,pending").value == ["active", "pending"]
+    assert parse_filter("nationality:isNull").value is True
+    assert parse_filter("nationality:isNull:false").value is False
+
+
+def test_parse_sort() -> None:
+    assert parse_sort("-dateOfBirth, firstName") == [
+        SortKey(field="dateOfBirth", direction="desc"),
+        SortKey(field="firstName", direction="asc"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "city:eq:Addis Ababa",  # no index
+        "status:ne:active",  # matches almost every row
+        "dateOfBirth:contains:2012",  # no trigram index
+    ],
+)
+def test_large_tables_reject_unindexed_predicates(raw: str) -> None:
+    """Test that students only accept predicates an index can answer."""
+    with pytest.raises(HTTPException) as exc:
+        compile_condition(STUDENT_FIELDS, parse_filter(raw), "f0")
+    assert exc.value.status_code == 400
+
+
+def test_small_tables_accept_any_predicate() -> None:
+    _, value = compile_condition(SUBJECT_FIELDS, parse_filter("code:ne:MATH"), "f0")
+    assert value == "MATH"
+
+
+def test_contains_escapes_wildcards() -> None:
+    _, value = compile_condition(
+        STUDENT_FIELDS, parse_filter("firstName:contains:50%_off"), "f0"
+    )
+    assert value == r"%50\%\_off%"
+
+
+@pytest.fixture(scope="session")
+async def first_names(
+    client: AsyncClient,
+    admin_token_headers: Dict[str, str],
+    sections: List[SectionSchema],
+    parent: Parent,
+) -> List[str]:
+    """Three students with known first names in the first section's grade."""
+    names = []
+    for name in ("Zelalem", "Abel", "Meron"):
+        student = StudentRegistrationFactory.build(
+            first_name=name,
+            registered_for_grade_id=sections[0].grade_id,
+            parent_id=parent.id,
+        )
+        r = await client.post(
+            f"{settings.API_V1_STR}/register/students",
+            json=student.model_dump(mode="json", by_alias=True),
+            headers=admin_token_headers,
+        )
+        assert r.status_code == 201
+        names.append(name)
+    return names
+
+
+class TestFilterSortApi:
+    async def test_filter_and_sort_students(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        year_relation: YearWithRelatedSchema,
+        sections: List[SectionSchema],
+        first_names: List[str],
+    ) -> None:
+        """Test that students come back filtered by grade and sorted by name."""
+        r = await client.get(
+            f"{settings.API_V1_STR}/students",
+            params=[
+                ("yearId", str(year_relation.id)),
+                ("filter", f"gradeId:eq:{sections[0].grade_id}"),
+                ("filter", "firstName:in:" + ",".join(first_names)),
+                ("sort", "-firstName"),
+            ],
+            headers=admin_token_headers,
+        )
+
+        assert r.status_code == 200
+        names = [student["firstName"] for student in r.json()]
+        assert names == sorted(first_names, reverse=True)
+
+    async def test_rejects_unindexed_filter(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        year_relation: YearWithRelatedSchema,
+    ) -> None:
+        r = await client.get(
+            f"{settings.API_V1_STR}/students",
+            params={"yearId": str(year_relation.id), "filter": "city:eq:Adama"},
+            headers=admin_token_headers,
+        )
+
+        assert r.status_code == 400
+
+    async def test_filter_employees(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+    ) -> None:
+        """Test that employees accept the same language."""
+        r = await client.get(
+            f"{settings.API_V1_STR}/employees",
+            params={"filter": "status:eq:active", "sort": "firstName"},
+            headers=admin_token_headers,
+        )
+
+        assert r.status_code == 200
+        assert all(employee["status"] == "active" for employee in r.json())
@@ -23,6 +23,55 @@ class TestGradesApi:
 
         assert r.status_code == 200
 
+    async def test_get_grades_ordered_by_ordinal(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        year: YearSchema,
+    ) -> None:
+        """Test that grades come back in promotion order, not insertion order."""
+        r = await client.get(
+            f"{settings.API_V1_STR}/grades",
+            params={"yearId": str(year.id)},
+            headers=admin_token_headers,
+        )
+
+        assert r.status_code == 200
+        grades = [int(grade["grade"]) for grade in r.json()]
+        assert grades == sorted(grades)
+
+    async def test_get_grades_paginated(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        year: YearSchema,
+    ) -> None:
+        """Test offset/limit paging over the ordered grade listing."""
+        r = await client.get(
+            f"{settings.API_V1_STR}/grades",
+            params={"yearId": str(year.id), "offset": 2, "limit": 3},
+            headers=admin_token_headers,
+        )
+
+        assert r.status_code == 200
+        assert [grade["grade"] for grade in r.json()] == ["3", "4", "5"]
+
+    async def test_get_grades_range(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        year: YearSchema,
+    ) -> None:
+        """Test the minGrade/maxGrade filter compares ordinals, not strings."""
+        r = await client.get(
+            f"{settings.API_V1_STR}/grades",
+            params={"yearId": str(year.id), "minGrade": "9", "maxGrade": "11"},
+            headers=admin_token_headers,
+        )
+
+        assert r.status_code == 200
+        assert [grade["grade"] for grade in r.json()] == ["9", "10", "11"]
+
     async def test_get_grade_by_id(
         self,
         client: AsyncClient,
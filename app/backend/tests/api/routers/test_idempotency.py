@@ -0,0 +1,79 @@
+import asyncio
+import uuid
+from typing import Dict
+
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from project.api.v1.routers.idempotency import IDEMPOTENCY_HEADER, REPLAYED_HEADER
+from project.core.config import settings
+from project.models import Parent
+from tests.factories.api_data import ParentRegistrationFactory
+
+
+class TestIdempotencyApi:
+    async def test_retry_replays_the_first_response(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        db_session: AsyncSession,
+    ) -> None:
+        """Test that a retried registration creates nothing new."""
+        parent = ParentRegistrationFactory.build()
+        body = parent.model_dump(mode="json", by_alias=True)
+        headers = {**admin_token_headers, IDEMPOTENCY_HEADER: uuid.uuid4().hex}
+
+        first = await client.post(
+            f"{settings.API_V1_STR}/register/parents", json=body, headers=headers
+        )
+        retry = await client.post(
+            f"{settings.API_V1_STR}/register/parents", json=body, headers=headers
+        )
+
+        assert first.status_code == retry.status_code == 201
+        assert retry.json() == first.json()
+        assert retry.headers[REPLAYED_HEADER] == "true"
+        assert REPLAYED_HEADER not in first.headers
+
+        count = await db_session.scalar(
+            select(func.count()).where(Parent.email == parent.email)
+        )
+        assert count == 1
+
+    async def test_concurrent_duplicates_run_once(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+    ) -> None:
+        body = ParentRegistrationFactory.build().model_dump(mode="json", by_alias=True)
+        headers = {**admin_token_headers, IDEMPOTENCY_HEADER: uuid.uuid4().hex}
+
+        responses = await asyncio.gather(
+            *(
+                client.post(
+                    f"{settings.API_V1_STR}/register/parents",
+                    json=body,
+                    headers=headers,
+                )
+                for _ in range(3)
+            )
+        )
+
+        assert {r.json()["id"] for r in responses} == {responses[0].json()["id"]}
+        assert sum(REPLAYED_HEADER in r.headers for r in responses) == 2
+
+    async def test_reused_key_with_another_body_is_rejected(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+    ) -> None:
+        headers = {**admin_token_headers, IDEMPOTENCY_HEADER: uuid.uuid4().hex}
+        for expected in (201, 422):
+            parent = ParentRegistrationFactory.build()
+            r = await client.post(
+                f"{settings.API_V1_STR}/register/parents",
+                json=parent.model_dump(mode="json", by_alias=True),
+                headers=headers,
+            )
+            assert r.status_code == expected
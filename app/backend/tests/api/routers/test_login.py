@@ -7,6 +7,7 @@ from project.api.v1.routers.auth.service import (
     generate_and_store_otp_secret,
     generate_email_verification_token,
     verify_otp_and_generate_token,
+    verify_password_reset_token,
 )
 from project.core.config import settings
 
@@ -197,6 +198,58 @@ async def test_verify_otp_invalid_email(client: AsyncClient) -> None:
     assert r.status_code == 422
 
 
+async def test_verify_otp_attempts_are_capped(
+    client: AsyncClient, test_redis: Redis
+) -> None:
+    """Test that the OTP is discarded once the wrong-guess budget is spent."""
+    otp = await generate_and_store_otp_secret(
+        settings.FIRST_SUPERUSER_EMAIL, test_redis
+    )
+    wrong = f"{(int(otp) + 1) % 10**6:06d}"
+
+    for _ in range(settings.OTP_MAX_ATTEMPTS):
+        r = await client.post(
+            f"{settings.API_V1_STR}/auth/verify-otp",
+            json={"email": settings.FIRST_SUPERUSER_EMAIL, "otp": wrong},
+        )
+        assert r.status_code == 400
+
+    r = await client.post(
+        f"{settings.API_V1_STR}/auth/verify-otp",
+        json={"email": settings.FIRST_SUPERUSER_EMAIL, "otp": otp},
+    )
+    assert r.status_code == 400
+
+
+async def test_verify_otp_is_single_use(test_redis: Redis) -> None:
+    """Test that an OTP and the reset token it yields each redeem only once."""
+    otp = await generate_and_store_otp_secret(
+        settings.FIRST_SUPERUSER_EMAIL, test_redis
+    )
+
+    token = await verify_otp_and_generate_token(
+        email=settings.FIRST_SUPERUSER_EMAIL,
+        user_submitted_code=otp,
+        redis_client=test_redis,
+    )
+    assert token is not None
+    assert (
+        await verify_otp_and_generate_token(
+            email=settings.FIRST_SUPERUSER_EMAIL,
+            user_submitted_code=otp,
+            redis_client=test_redis,
+        )
+        is None
+    )
+
+    assert await verify_password_reset_token(
+        settings.FIRST_SUPERUSER_EMAIL, token, test_redis
+    )
+    assert not await verify_password_reset_token(
+        settings.FIRST_SUPERUSER_EMAIL, token, test_redis
+    )
+
+
 async def test_password_reset(
     client: AsyncClient,
     db_session: AsyncSession,
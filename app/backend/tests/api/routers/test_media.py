@@ -0,0 +1,126 @@
+import io
+from pathlib import Path
+from typing import Dict
+
+import pytest
+from httpx import AsyncClient
+from PIL import Image
+
+from project.api.v1.routers.media.schema import ImageUploadResponse
+from project.core.config import settings
+from project.utils.images import UnsupportedImage, make_thumbnails
+
+
+def _png(width: int = 800, height: int = 600) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), "teal").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def media_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(settings, "MEDIA_ROOT", tmp_path)
+    return tmp_path
+
+
+def test_make_thumbnails(tmp_path: Path) -> None:
+    """Test that every target gets a JPEG no larger than its size."""
+    source = tmp_path / "upload"
+    source.write_bytes(_png())
+    targets = {64: str(tmp_path / "64.jpg"), 256: str(tmp_path / "256.jpg")}
+
+    assert make_thumbnails(str(source), targets, 10_000_000) == ("png", 800, 600)
+    for size, path in targets.items():
+        with Image.open(path) as thumbnail:
+            assert thumbnail.format == "JPEG"
+            assert max(thumbnail.size) == size
+
+
+def test_make_thumbnails_rejects_large_images(tmp_path: Path) -> None:
+    """Test that images over the pixel budget are refused before decoding."""
+    source = tmp_path / "upload"
+    source.write_bytes(_png())
+
+    with pytest.raises(UnsupportedImage):
+        make_thumbnails(str(source), {64: str(tmp_path / "64.jpg")}, 1000)
+
+
+class TestMediaApi:
+    async def test_upload_image(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        media_root: Path,
+    ) -> None:
+        """Test that uploading the same image twice stores it once."""
+        headers = {**admin_token_headers, "Content-Type": "image/png"}
+        data = _png()
+
+        r = await client.post(
+            f"{settings.API_V1_STR}/media/images", content=data, headers=headers
+        )
+        assert r.status_code == 201
+        image = ImageUploadResponse.model_validate_json(r.text)
+        assert image.ref.endswith(".png")
+        assert (image.width, image.height) == (800, 600)
+        assert set(image.thumbnails) == set(settings.MEDIA_THUMBNAIL_SIZES)
+
+        r = await client.post(
+            f"{settings.API_V1_STR}/media/images", content=data, headers=headers
+        )
+        assert r.status_code == 201
+        assert ImageUploadResponse.model_validate_json(r.text).ref == image.ref
+        assert len(list((media_root / "originals").rglob("*.png"))) == 1
+
+    async def test_thumbnails_are_cached_forever(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        media_root: Path,
+    ) -> None:
+        """Test that thumbnails are immutable and revalidate with a 304."""
+        r = await client.post(
+            f"{settings.API_V1_STR}/media/images",
+            content=_png(),
+            headers={**admin_token_headers, "Content-Type": "image/png"},
+        )
+        image = ImageUploadResponse.model_validate_json(r.text)
+        url = image.thumbnails[min(settings.MEDIA_THUMBNAIL_SIZES)]
+
+        r = await client.get(url)
+        assert r.status_code == 200
+        assert r.headers["content-type"] == "image/jpeg"
+        assert "immutable" in r.headers["cache-control"]
+
+        r = await client.get(url, headers={"If-None-Match": r.headers["etag"]})
+        assert r.status_code == 304
+
+    async def test_upload_rejects_non_images(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        media_root: Path,
+    ) -> None:
+        """Test that bodies which are not images are refused."""
+        r = await client.post(
+            f"{settings.API_V1_STR}/media/images",
+            content=b"not an image",
+            headers={**admin_token_headers, "Content-Type": "image/png"},
+        )
+        assert r.status_code == 415
+
+        r = await client.post(
+            f"{settings.API_V1_STR}/media/images",
+            content=b"{}",
+            headers={**admin_token_headers, "Content-Type": "application/json"},
+        )
+        assert r.status_code == 415
+        assert not list((media_root / "uploads").iterdir())
+
+    async def test_unknown_image(self, client: AsyncClient) -> None:
+        """Test that malformed and missing references are 404s."""
+        r = await client.get(f"{settings.API_V1_STR}/media/images/../etc.png")
+        assert r.status_code == 404
+
+        r = await client.get(f"{settings.API_V1_STR}/media/images/{'0' * 64}.png")
+        assert r.status_code == 404
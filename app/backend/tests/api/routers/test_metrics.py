@@ -0,0 +1,43 @@
+import pytest
+from httpx import AsyncClient
+from pydantic import SecretStr
+
+from project.core.config import settings
+
+URL = f"{settings.API_V1_STR}/metrics"
+
+
+@pytest.fixture
+def scrape_token(monkeypatch: pytest.MonkeyPatch) -> str:
+    monkeypatch.setattr(settings, "METRICS_TOKEN", SecretStr("scrape-me"))
+    return "scrape-me"
+
+
+async def test_metrics(client: AsyncClient, scrape_token: str) -> None:
+    await client.get(f"{settings.API_V1_STR}/health")
+
+    r = await client.get(URL, headers={"Authorization": f"Bearer {scrape_token}"})
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/plain")
+
+    route = f"{settings.API_V1_STR}/health"
+    assert f'route="{route}"' in r.text
+    assert "http_requests_in_flight" in r.text
+    assert "db_pool_connections" in r.text
+    assert "bcrypt_executor_queue_depth" in r.text
+
+
+@pytest.mark.usefixtures("scrape_token")
+async def test_metrics_need_the_scrape_token(client: AsyncClient) -> None:
+    assert (await client.get(URL)).status_code == 401
+
+    r = await client.get(URL, headers={"Authorization": "Bearer wrong"})
+    assert r.status_code == 401
+
+
+async def test_metrics_are_off_without_a_token(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "METRICS_TOKEN", None)
+
+    assert (await client.get(URL)).status_code == 404
@@ -0,0 +1,136 @@
+import uuid
+from typing import Dict, List
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from project.core.config import settings
+from project.models import Parent, StudentYearRecord
+from project.schema.models import SectionSchema, YearSchema
+from project.workers.jobs import JobWorker
+from tests.factories.api_data import NewYearFactory, StudentRegistrationFactory
+
+
+@pytest.fixture(scope="session")
+async def next_year(
+    client: AsyncClient,
+    admin_token_headers: Dict[str, str],
+    job_worker: JobWorker,
+) -> uuid.UUID:
+    data = NewYearFactory.create(setup_methods="Default Template")
+    r = await client.post(
+        f"{settings.API_V1_STR}/years",
+        json=data.model_dump(mode="json", by_alias=True),
+        headers=admin_token_headers,
+    )
+    assert r.status_code == 202
+    while await job_worker.run_once():
+        pass
+    return uuid.UUID(r.json()["id"])
+
+
+@pytest.fixture(scope="session")
+async def passing_student(
+    client: AsyncClient,
+    admin_token_headers: Dict[str, str],
+    db_session: AsyncSession,
+    year: YearSchema,
+    sections: List[SectionSchema],
+    parent: Parent,
+) -> uuid.UUID:
+    """An active student with a passing final score this year."""
+    student = StudentRegistrationFactory.build(
+        registered_for_grade_id=sections[0].grade_id, parent_id=parent.id
+    )
+    r = await client.post(
+        f"{settings.API_V1_STR}/register/students",
+        json=student.model_dump(mode="json", by_alias=True),
+        headers=admin_token_headers,
+    )
+    assert r.status_code == 201
+    student_id = uuid.UUID(r.json()["id"])
+
+    r = await client.patch(
+        f"{settings.API_V1_STR}/students/status",
+        json={"status": "active", "studentIds": [str(student_id)]},
+        headers=admin_token_headers,
+    )
+    assert r.status_code == 200
+
+    db_session.add(
+        StudentYearRecord(
+            student_id=student_id,
+            grade_id=sections[0].grade_id,
+            year_id=year.id,
+            final_score=90.0,
+        )
+    )
+    await db_session.flush()
+    return student_id
+
+
+class TestPromotionsApi:
+    async def test_dry_run_then_promote(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        year: YearSchema,
+        next_year: uuid.UUID,
+        passing_student: uuid.UUID,
+    ) -> None:
+        """Test that a dry run reports the plan and a real run carries it out."""
+        url = f"{settings.API_V1_STR}/promotions"
+        body = {
+            "fromYearId": str(year.id),
+            "toYearId": str(next_year),
+            "passThreshold": 50,
+            "dryRun": True,
+        }
+
+        r = await client.post(url, json=body, headers=admin_token_headers)
+        assert r.status_code == 200
+        report = r.json()
+        assert report["promoted"] + report["graduated"] >= 1
+
+        r = await client.post(
+            url, json={**body, "dryRun": False}, headers=admin_token_headers
+        )
+        assert r.status_code == 200
+        assert r.json()["promoted"] == report["promoted"]
+
+        r = await client.get(
+            f"{settings.API_V1_STR}/students/{passing_student}",
+            headers=admin_token_headers,
+        )
+        graduated = r.json()["status"] == "graduated"
+
+        r = await client.get(
+            f"{settings.API_V1_STR}/students",
+            params={"yearId": str(next_year)},
+            headers=admin_token_headers,
+        )
+        assert r.status_code == 200
+        # Students of the last grade graduate instead of moving up
+        assert (str(passing_student) in [s["id"] for s in r.json()]) != graduated
+
+        r = await client.get(f"{url}/{next_year}/progress", headers=admin_token_headers)
+        assert r.status_code == 200
+        assert r.json()["stage"] == "done"
+
+    async def test_rejects_same_year(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        year: YearSchema,
+    ) -> None:
+        r = await client.post(
+            f"{settings.API_V1_STR}/promotions",
+            json={
+                "fromYearId": str(year.id),
+                "toYearId": str(year.id),
+                "passThreshold": 50,
+            },
+            headers=admin_token_headers,
+        )
+        assert r.status_code == 422
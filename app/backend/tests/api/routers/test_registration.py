@@ -1,10 +1,22 @@
 import random
+import uuid
 from typing import Dict
 
 import pytest
 from httpx import AsyncClient
-
-from project.api.v1.routers.registrations.schema import RegistrationResponse
+from redis.asyncio import Redis
+
+from project.api.v1.routers.registrations.route import EMPLOYEE_DRAFT
+from project.api.v1.routers.registrations.schema import (
+    EmployeeRegStep1,
+    RegistrationResponse,
+    StudRegStep1,
+    StudRegStep2,
+    StudRegStep3,
+    StudRegStep4,
+    StudRegStep5,
+)
+from project.api.v1.routers.registrations.service import claimed_key, draft_key
 from project.core.config import settings
 from project.models.parent import Parent
 from project.schema.models import YearWithRelatedSchema
@@ -126,3 +138,97 @@ class TestRegistration:
         result = RegistrationResponse.model_validate_json(r.text)
         assert "Employee Registered Successfully" == result.message
         assert result.id is not None
+
+    async def test_student_registration_wizard(
+        self,
+        client: AsyncClient,
+        year_relation: YearWithRelatedSchema,
+        parent: Parent,
+    ) -> None:
+        """Test that the steps fill a draft which is submitted at the end."""
+        grade = random.choice(year_relation.grades)
+        student = StudentRegistrationFactory.build(
+            registered_for_grade_id=grade.id, parent_id=parent.id
+        )
+        data = student.model_dump(mode="json", by_alias=True)
+
+        draft_id = None
+        for n, step in enumerate(
+            (StudRegStep1, StudRegStep2, StudRegStep3, StudRegStep4, StudRegStep5),
+            start=1,
+        ):
+            fields = {field.alias for field in step.model_fields.values()}
+            r = await client.post(
+                f"{settings.API_V1_STR}/register/students/step{n}",
+                params={"draftId": draft_id} if draft_id else {},
+                json={key: value for key, value in data.items() if key in fields},
+            )
+            assert r.status_code == 200
+            draft_id = draft_id or r.json()["draftId"]
+            assert r.json()["draftId"] == draft_id
+
+        r = await client.post(
+            f"{settings.API_V1_STR}/register/students/drafts/{draft_id}",
+            json={"parentId": str(parent.id)},
+        )
+        assert r.status_code == 201
+        assert r.json()["message"] == "Student Registered Successfully"
+
+        # The draft is gone once submitted
+        r = await client.post(
+            f"{settings.API_V1_STR}/register/students/drafts/{draft_id}",
+            json={"parentId": str(parent.id)},
+        )
+        assert r.status_code == 404
+
+    async def test_incomplete_draft_is_rejected(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+    ) -> None:
+        employee = EmployeeRegistrationFactory.build()
+        data = employee.model_dump(mode="json", by_alias=True)
+        fields = {field.alias for field in EmployeeRegStep1.model_fields.values()}
+        r = await client.post(
+            f"{settings.API_V1_STR}/register/employees/step1",
+            json={key: value for key, value in data.items() if key in fields},
+            headers=admin_token_headers,
+        )
+        assert r.status_code == 200
+
+        url = f"{settings.API_V1_STR}/register/employees/drafts/{r.json()['draftId']}"
+        r = await client.post(url, headers=admin_token_headers)
+        assert r.status_code == 400
+
+        # The failed submit gave the draft back
+        r = await client.post(url, headers=admin_token_headers)
+        assert r.status_code == 400
+
+    async def test_draft_being_submitted_is_not_submitted_again(
+        self,
+        client: AsyncClient,
+        test_redis: Redis,
+        admin_token_headers: Dict[str, str],
+    ) -> None:
+        employee = EmployeeRegistrationFactory.build()
+        data = employee.model_dump(mode="json", by_alias=True)
+        fields = {field.alias for field in EmployeeRegStep1.model_fields.values()}
+        r = await client.post(
+            f"{settings.API_V1_STR}/register/employees/step1",
+            json={key: value for key, value in data.items() if key in fields},
+            headers=admin_token_headers,
+        )
+        draft_id = uuid.UUID(r.json()["draftId"])
+
+        # As if another request had claimed it and not finished yet
+        await test_redis.rename(
+            draft_key(EMPLOYEE_DRAFT, draft_id), claimed_key(EMPLOYEE_DRAFT, draft_id)
+        )
+        try:
+            r = await client.post(
+                f"{settings.API_V1_STR}/register/employees/drafts/{draft_id}",
+                headers=admin_token_headers,
+            )
+            assert r.status_code == 409
+        finally:
+            await test_redis.delete(claimed_key(EMPLOYEE_DRAFT, draft_id))
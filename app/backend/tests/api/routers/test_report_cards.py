@@ -0,0 +1,185 @@
+import io
+import uuid
+import zipfile
+from datetime import datetime, timezone
+from typing import Dict, List
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from project.api.v1.routers.registrations.schema import RegistrationResponse
+from project.api.v1.routers.report_cards.service import cache_path
+from project.core.config import settings
+from project.models import MarkList, Parent, StudentTermRecord
+from project.schema.models import SectionSchema, YearWithRelatedSchema
+from project.utils.enum import MarkListTypeEnum
+from project.utils.report_card import ReportCard, SubjectRow, render_card
+from tests.factories.api_data import StudentRegistrationFactory
+
+
+def _card(**overrides: object) -> ReportCard:
+    fields: Dict[str, object] = {
+        "key": str(uuid.uuid4()),
+        "school": "ClassEase",
+        "year": "2026/27",
+        "student_name": "Abebe Kebede",
+        "grade": "9",
+        "section": "A",
+        "terms": ("1", "2"),
+        "subjects": (SubjectRow("Mathematics", (82.5, None)),),
+        "averages": (82.5, None),
+        "ranks": (3, None),
+        "final_score": None,
+        "final_rank": None,
+        "updated_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+    }
+    fields.update(overrides)
+    return ReportCard(**fields)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("fmt, magic", [("png", b"\x89PNG"), ("pdf", b"%PDF")])
+def test_render_card(fmt: str, magic: bytes) -> None:
+    """Test that a card renders to a file of the requested type."""
+    assert render_card(_card(), fmt).startswith(magic)  # type: ignore[arg-type]
+
+
+def test_cache_path_follows_updated_at() -> None:
+    """Test that touching a card's records moves it to a new cache entry."""
+    card = _card()
+    touched = _card(key=card.key, updated_at=datetime.now(timezone.utc))
+
+    assert cache_path(card, "pdf") == cache_path(_card(key=card.key), "pdf")
+    assert cache_path(card, "pdf") != cache_path(touched, "pdf")
+    assert cache_path(card, "pdf") != cache_path(card, "png")
+
+
+@pytest.fixture(scope="session")
+async def term_record(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    admin_token_headers: Dict[str, str],
+    year_relation: YearWithRelatedSchema,
+    sections: List[SectionSchema],
+    parent: Parent,
+) -> StudentTermRecord:
+    """A student with marks in two subjects for the first term."""
+    section = sections[0]
+    student = StudentRegistrationFactory.build(
+        registered_for_grade_id=section.grade_id, parent_id=parent.id
+    )
+    r = await client.post(
+        f"{settings.API_V1_STR}/register/students",
+        json=student.model_dump(mode="json", by_alias=True),
+        headers=admin_token_headers,
+    )
+    assert r.status_code == 201
+    student_id = RegistrationResponse.model_validate_json(r.text).id
+
+    record = StudentTermRecord(
+        student_id=student_id,
+        academic_term_id=year_relation.academic_terms[0].id,
+        grade_id=section.grade_id,
+        section_id=section.id,
+        average=78.0,
+        rank=1,
+    )
+    db_session.add(record)
+    await db_session.flush()
+
+    for subject, score in zip(year_relation.subjects[:2], (70.0, 86.0)):
+        db_session.add(
+            MarkList(
+                student_id=student_id,
+                student_term_record_id=record.id,
+                subject_id=subject.id,
+                type=list(MarkListTypeEnum)[0],
+                percentage=100,
+                score=score,
+            )
+        )
+    await db_session.commit()
+
+    return record
+
+
+class TestReportCardsApi:
+    async def test_download_term_cards(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        term_record: StudentTermRecord,
+    ) -> None:
+        """Test that a term's cards come back as a zip with one card each."""
+        r = await client.get(
+            f"{settings.API_V1_STR}/report-cards",
+            params={
+                "termId": str(term_record.academic_term_id),
+                "sectionId": str(term_record.section_id),
+                "format": "png",
+            },
+            headers=admin_token_headers,
+        )
+
+        assert r.status_code == 200
+        assert r.headers["content-type"] == "application/zip"
+        assert r.headers["x-report-card-count"] == "1"
+
+        archive = zipfile.ZipFile(io.BytesIO(r.content))
+        [name] = archive.namelist()
+        assert name.endswith(".png")
+        assert archive.read(name).startswith(b"\x89PNG")
+
+    async def test_download_year_cards(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        year_relation: YearWithRelatedSchema,
+        term_record: StudentTermRecord,
+    ) -> None:
+        """Test that a year's cards include the student with term records."""
+        r = await client.get(
+            f"{settings.API_V1_STR}/report-cards",
+            params={"yearId": str(year_relation.id)},
+            headers=admin_token_headers,
+        )
+
+        assert r.status_code == 200
+        archive = zipfile.ZipFile(io.BytesIO(r.content))
+        assert len(archive.namelist()) == int(r.headers["x-report-card-count"]) >= 1
+        assert all(name.endswith(".pdf") for name in archive.namelist())
+
+    async def test_requires_exactly_one_scope(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        year_relation: YearWithRelatedSchema,
+    ) -> None:
+        """Test that giving both or neither of yearId and termId is rejected."""
+        r = await client.get(
+            f"{settings.API_V1_STR}/report-cards", headers=admin_token_headers
+        )
+        assert r.status_code == 422
+
+        r = await client.get(
+            f"{settings.API_V1_STR}/report-cards",
+            params={
+                "yearId": str(year_relation.id),
+                "termId": str(year_relation.academic_terms[0].id),
+            },
+            headers=admin_token_headers,
+        )
+        assert r.status_code == 422
+
+    async def test_unknown_term(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+    ) -> None:
+        """Test that an unknown term is a 404."""
+        r = await client.get(
+            f"{settings.API_V1_STR}/report-cards",
+            params={"termId": str(uuid.uuid4())},
+            headers=admin_token_headers,
+        )
+        assert r.status_code == 404
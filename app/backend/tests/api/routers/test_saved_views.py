@@ -0,0 +1,196 @@
+import uuid
+from typing import Any, Dict, List
+
+import pytest
+from httpx import AsyncClient
+
+from project.api.v1.routers.saved_views.service import canonical_query, compile_view
+from project.core.config import settings
+from project.models import Parent
+from project.schema.models import SavedQueryViewSchema, SectionSchema
+from project.utils.enum import TableEnum
+from tests.factories.api_data import StudentRegistrationFactory
+
+
+def test_compile_view_is_cached() -> None:
+    """Test that equal queries share one compiled statement."""
+    query = {"columns": ["firstName"], "sort": [{"field": "firstName"}]}
+
+    first = compile_view(TableEnum.STUDENTS, canonical_query(query))
+    again = compile_view(
+        TableEnum.STUDENTS, canonical_query(dict(reversed(query.items())))
+    )
+
+    assert first is again
+    assert first.columns == ("firstName",)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        {"columns": ["password"]},
+        {"columns": ["id"], "sort": [{"field": "nationality"}]},
+        {"columns": ["id"], "filters": [{"field": "dateOfBirth", "value": "x"}]},
+    ],
+)
+async def test_create_saved_view_rejects_invalid_queries(
+    client: AsyncClient,
+    admin_token_headers: Dict[str, str],
+    query: Dict[str, Any],
+) -> None:
+    """Test that views over unknown or unsortable columns are not saved."""
+    r = await client.post(
+        f"{settings.API_V1_STR}/saved-views",
+        json={"name": "Broken", "tableName": "students", "queryJson": query},
+        headers=admin_token_headers,
+    )
+
+    assert r.status_code == 400
+
+
+@pytest.fixture(scope="session")
+async def students(
+    client: AsyncClient,
+    admin_token_headers: Dict[str, str],
+    sections: List[SectionSchema],
+    parent: Parent,
+) -> List[uuid.UUID]:
+    """Five students registered for the first section's grade."""
+    ids = []
+    for _ in range(5):
+        student = StudentRegistrationFactory.build(
+            registered_for_grade_id=sections[0].grade_id, parent_id=parent.id
+        )
+        r = await client.post(
+            f"{settings.API_V1_STR}/register/students",
+            json=student.model_dump(mode="json", by_alias=True),
+            headers=admin_token_headers,
+        )
+        assert r.status_code == 201
+        ids.append(uuid.UUID(r.json()["id"]))
+    return ids
+
+
+class TestSavedViewsApi:
+    async def test_pages_through_view(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        students: List[uuid.UUID],
+    ) -> None:
+        """Test that following cursors visits every row once, in order."""
+        r = await client.post(
+            f"{settings.API_V1_STR}/saved-views",
+            json={
+                "name": "By name",
+                "tableName": "students",
+                "queryJson": {
+                    "columns": ["id", "firstName"],
+                    "sort": [{"field": "firstName", "direction": "desc"}],
+                },
+            },
+            headers=admin_token_headers,
+        )
+        assert r.status_code == 201
+        view = SavedQueryViewSchema.model_validate_json(r.text)
+
+        rows: List[Dict[str, Any]] = []
+        cursor = None
+        while True:
+            params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+            r = await client.get(
+                f"{settings.API_V1_STR}/saved-views/{view.id}/rows",
+                params=params,
+                headers=admin_token_headers,
+            )
+            assert r.status_code == 200
+            page = r.json()
+            assert len(page["items"]) <= 2
+            rows.extend(page["items"])
+            cursor = page["nextCursor"]
+            if cursor is None:
+                break
+
+        ids = [row["id"] for row in rows]
+        assert len(ids) == len(set(ids))
+        assert {str(i) for i in students} <= set(ids)
+        names = [row["firstName"] for row in rows]
+        assert names == sorted(names, reverse=True)
+
+    async def test_filters_bind_values(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        students: List[uuid.UUID],
+    ) -> None:
+        """Test that a saved filter narrows the rows it returns."""
+        r = await client.post(
+            f"{settings.API_V1_STR}/saved-views",
+            json={
+                "name": "Two students",
+                "tableName": "students",
+                "queryJson": {
+                    "columns": ["id"],
+                    "filters": [
+                        {
+                            "field": "id",
+                            "op": "in",
+                            "value": [str(i) for i in students[:2]],
+                        }
+                    ],
+                },
+            },
+            headers=admin_token_headers,
+        )
+        view = SavedQueryViewSchema.model_validate_json(r.text)
+
+        r = await client.get(
+            f"{settings.API_V1_STR}/saved-views/{view.id}/rows",
+            headers=admin_token_headers,
+        )
+
+        assert r.status_code == 200
+        assert {row["id"] for row in r.json()["items"]} == {
+            str(i) for i in students[:2]
+        }
+
+        r = await client.get(
+            f"{settings.API_V1_STR}/saved-views", headers=admin_token_headers
+        )
+        assert str(view.id) in {v["id"] for v in r.json()}
+
+        r = await client.delete(
+            f"{settings.API_V1_STR}/saved-views/{view.id}",
+            headers=admin_token_headers,
+        )
+        assert r.status_code == 200
+
+        r = await client.get(
+            f"{settings.API_V1_STR}/saved-views/{view.id}/rows",
+            headers=admin_token_headers,
+        )
+        assert r.status_code == 404
+
+    async def test_invalid_cursor(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+    ) -> None:
+        """Test that a tampered cursor is a 400, not a server error."""
+        r = await client.post(
+            f"{settings.API_V1_STR}/saved-views",
+            json={
+                "name": "Admins",
+                "tableName": "admin",
+                "queryJson": {"columns": ["firstName"]},
+            },
+            headers=admin_token_headers,
+        )
+        view = SavedQueryViewSchema.model_validate_json(r.text)
+
+        r = await client.get(
+            f"{settings.API_V1_STR}/saved-views/{view.id}/rows",
+            params={"cursor": "not-a-cursor"},
+            headers=admin_token_headers,
+        )
+        assert r.status_code == 400
@@ -1,15 +1,58 @@
 import random
+import uuid
 from typing import Dict, List
 
 from httpx import AsyncClient
 
+from project.api.v1.routers.sections.service import (
+    Candidate,
+    SectionLoad,
+    plan_placement,
+)
 from project.core.config import settings
+from project.models import Parent
 from project.schema.models import (
     GradeWithRelatedSchema,
     SectionSchema,
     SectionWithRelatedSchema,
     YearWithRelatedSchema,
 )
+from project.utils.enum import GenderEnum
+from tests.factories.api_data import StudentRegistrationFactory
+
+
+def test_plan_placement_balances_sections() -> None:
+    """Test that size, gender and stream end up even within one student."""
+    streams = [None, uuid.uuid4()]
+    candidates = [
+        Candidate(uuid.uuid4(), gender, stream)
+        for stream in streams
+        for gender in GenderEnum
+        for _ in range(10)
+    ]
+    sections = [SectionLoad(uuid.uuid4(), name) for name in "ABC"]
+    sections[0].add(GenderEnum.MALE, None, count=4)
+
+    unplaced = plan_placement(candidates, sections)
+
+    assert unplaced == []
+    assert [s.total for s in sections] == [15, 15, 14]
+    for stream in streams:
+        counts = [s.streams[stream] for s in sections[1:]]
+        assert max(counts) - min(counts) <= 1
+    for gender in GenderEnum:
+        counts = [s.genders[gender] for s in sections[1:]]
+        assert max(counts) - min(counts) <= 1
+
+
+def test_plan_placement_respects_capacity() -> None:
+    candidates = [Candidate(uuid.uuid4(), GenderEnum.FEMALE) for _ in range(7)]
+    sections = [SectionLoad(uuid.uuid4(), name) for name in "AB"]
+
+    unplaced = plan_placement(candidates, sections, capacity=3)
+
+    assert [s.total for s in sections] == [3, 3]
+    assert len(unplaced) == 1
 
 
 class TestSectionsApi:
@@ -89,3 +132,41 @@ class TestSectionsApi:
         assert r.status_code == 200
 
         SectionWithRelatedSchema.model_validate_json(r.text)
+
+    async def test_place_students(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        sections: List[SectionSchema],
+        parent: Parent,
+    ) -> None:
+        """Test that a dry run saves nothing and a real run places everyone."""
+        grade_id = sections[0].grade_id
+        for _ in range(3):
+            student = StudentRegistrationFactory.build(
+                registered_for_grade_id=grade_id, parent_id=parent.id
+            )
+            r = await client.post(
+                f"{settings.API_V1_STR}/register/students",
+                json=student.model_dump(mode="json", by_alias=True),
+                headers=admin_token_headers,
+            )
+            assert r.status_code == 201
+
+        body = {"gradeId": str(grade_id), "status": "pending", "dryRun": True}
+        url = f"{settings.API_V1_STR}/sections/placements"
+
+        r = await client.post(url, json=body, headers=admin_token_headers)
+        assert r.status_code == 200
+        planned = r.json()["placements"]
+        assert len(planned) >= 3
+
+        r = await client.post(
+            url, json={**body, "dryRun": False}, headers=admin_token_headers
+        )
+        assert r.status_code == 200
+        assert len(r.json()["placements"]) == len(planned)
+
+        r = await client.post(url, json=body, headers=admin_token_headers)
+        assert r.status_code == 200
+        assert r.json()["placements"] == []
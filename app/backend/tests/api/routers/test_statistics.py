@@ -0,0 +1,88 @@
+from typing import Any, Dict, List
+
+from httpx import AsyncClient
+
+from project.core.config import settings
+from project.models import Parent
+from project.schema.models import SectionSchema, YearWithRelatedSchema
+from tests.factories.api_data import StudentRegistrationFactory
+
+
+async def _year_statistics(
+    client: AsyncClient, headers: Dict[str, str], year_id: Any
+) -> Dict[str, Any]:
+    r = await client.get(
+        f"{settings.API_V1_STR}/statistics/years/{year_id}", headers=headers
+    )
+    assert r.status_code == 200
+    return r.json()
+
+
+def _grade_count(stats: Dict[str, Any], grade_id: Any) -> int:
+    return sum(b["count"] for b in stats["byGrade"] if b["id"] == str(grade_id))
+
+
+class TestStatisticsApi:
+    async def test_counters_follow_registration_and_status(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        year_relation: YearWithRelatedSchema,
+        sections: List[SectionSchema],
+        parent: Parent,
+    ) -> None:
+        """Test that registering and activating a student moves the counters."""
+        grade_id = sections[0].grade_id
+        before = await _year_statistics(client, admin_token_headers, year_relation.id)
+
+        student = StudentRegistrationFactory.build(
+            registered_for_grade_id=grade_id, parent_id=parent.id
+        )
+        r = await client.post(
+            f"{settings.API_V1_STR}/register/students",
+            json=student.model_dump(mode="json", by_alias=True),
+            headers=admin_token_headers,
+        )
+        assert r.status_code == 201
+        student_id = r.json()["id"]
+
+        registered = await _year_statistics(
+            client, admin_token_headers, year_relation.id
+        )
+        assert registered["students"] == before["students"] + 1
+        assert registered["pendingRegistrations"] == before["pendingRegistrations"] + 1
+        assert _grade_count(registered, grade_id) == _grade_count(before, grade_id) + 1
+
+        r = await client.patch(
+            f"{settings.API_V1_STR}/students/status",
+            json={"status": "active", "studentIds": [student_id]},
+            headers=admin_token_headers,
+        )
+        assert r.status_code == 200
+
+        activated = await _year_statistics(
+            client, admin_token_headers, year_relation.id
+        )
+        assert activated["students"] == registered["students"]
+        assert activated["pendingRegistrations"] == before["pendingRegistrations"]
+        assert activated["byStatus"].get("active", 0) == (
+            registered["byStatus"].get("active", 0) + 1
+        )
+
+    async def test_rebuild_matches_incremental_counts(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        year_relation: YearWithRelatedSchema,
+    ) -> None:
+        """Test that recounting from scratch agrees with the running counters."""
+        before = await _year_statistics(client, admin_token_headers, year_relation.id)
+
+        r = await client.post(
+            f"{settings.API_V1_STR}/statistics/years/{year_relation.id}/rebuild",
+            headers=admin_token_headers,
+        )
+        assert r.status_code == 200
+
+        after = await _year_statistics(client, admin_token_headers, year_relation.id)
+        assert after == before
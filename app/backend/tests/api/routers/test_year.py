@@ -7,6 +7,7 @@ from project.api.v1.routers.year.schema import NewYearSuccess
 from project.core.config import settings
 from project.models.year import Year
 from project.schema.models import YearSchema
+from tests.factories.api_data import NewYearFactory
 
 
 class TestYearApi:
@@ -55,3 +56,35 @@ class TestYearApi:
         )
 
         assert r.status_code == 200
+
+    async def test_year_setup_job(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        new_academic_year: NewYearSuccess,
+    ) -> None:
+        """Test that the template setup job reports its result."""
+        r = await client.get(
+            f"{settings.API_V1_STR}/jobs/{new_academic_year.job_id}",
+            headers=admin_token_headers,
+        )
+
+        assert r.status_code == 200
+        assert r.json()["status"] == "succeeded"
+        assert r.json()["result"] == {"yearId": str(new_academic_year.id)}
+
+    async def test_manual_year_is_created_inline(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+    ) -> None:
+        data = NewYearFactory.create(setup_methods="Manual")
+
+        r = await client.post(
+            f"{settings.API_V1_STR}/years",
+            json=data.model_dump(mode="json", by_alias=True),
+            headers=admin_token_headers,
+        )
+
+        assert r.status_code == 201
+        assert r.json()["jobId"] is None
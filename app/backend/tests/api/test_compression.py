@@ -0,0 +1,139 @@
+import gzip
+import io
+import json
+import zipfile
+from typing import AsyncIterator, Dict
+
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from project.core.compression import (
+    COMPRESSION_BYTES,
+    CompressionMiddleware,
+    excluded_content_type,
+    gzip_body,
+)
+from project.core.config import settings
+
+rows = [{"id": i, "name": f"Student {i}", "grade": "Grade 1"} for i in range(500)]
+
+
+def compression_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)  # ty:ignore[invalid-argument-type]
+
+    @app.get("/rows")
+    async def get_rows() -> list[Dict[str, object]]:
+        return rows
+
+    @app.get("/small")
+    async def small() -> Dict[str, str]:
+        return {"ok": "yes"}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def lines() -> AsyncIterator[bytes]:
+            for row in rows:
+                yield (json.dumps(row) + "\n").encode()
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    @app.get("/precompressed")
+    async def precompressed() -> Response:
+        return Response(
+            gzip_body(json.dumps(rows).encode()),
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    @app.get("/export.zip")
+    async def export() -> Response:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            archive.writestr("rows.json", json.dumps(rows))
+        return Response(buffer.getvalue(), media_type="application/zip")
+
+    return app
+
+
+def sample(route: str, encoding: str) -> float:
+    return COMPRESSION_BYTES.labels(route, encoding)._value.get()
+
+
+async def test_large_bodies_are_gzipped_and_counted() -> None:
+    before = sample("/rows", "identity"), sample("/rows", "gzip")
+    async with AsyncClient(
+        transport=ASGITransport(app=compression_app()), base_url="http://test"
+    ) as client:
+        r = await client.get("/rows", headers={"Accept-Encoding": "gzip"})
+
+    assert r.headers["content-encoding"] == "gzip"
+    assert r.json() == rows
+
+    identity = sample("/rows", "identity") - before[0]
+    wire = sample("/rows", "gzip") - before[1]
+    assert identity == len(json.dumps(rows, separators=(",", ":")))
+    assert wire == int(r.headers["content-length"])
+    assert wire < identity / 5
+
+
+async def test_small_bodies_and_plain_clients_are_left_alone() -> None:
+    async with AsyncClient(
+        transport=ASGITransport(app=compression_app()), base_url="http://test"
+    ) as client:
+        small = await client.get("/small", headers={"Accept-Encoding": "gzip"})
+        plain = await client.get("/rows", headers={"Accept-Encoding": "identity"})
+
+    assert len(small.content) < settings.COMPRESSION_MIN_BYTES
+    assert "content-encoding" not in small.headers
+    assert "content-encoding" not in plain.headers
+
+
+async def test_streamed_bodies_are_gzipped_as_they_go() -> None:
+    async with AsyncClient(
+        transport=ASGITransport(app=compression_app()), base_url="http://test"
+    ) as client:
+        r = await client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+    assert r.headers["content-encoding"] == "gzip"
+    assert "content-length" not in r.headers
+    assert [json.loads(line) for line in r.text.splitlines()] == rows
+
+
+async def test_precompressed_bodies_are_not_compressed_again() -> None:
+    before = sample("/precompressed", "gzip")
+    async with AsyncClient(
+        transport=ASGITransport(app=compression_app()), base_url="http://test"
+    ) as client:
+        r = await client.get("/precompressed", headers={"Accept-Encoding": "gzip"})
+
+    assert r.json() == rows
+    assert r.headers["content-length"] == str(len(gzip_body(json.dumps(rows).encode())))
+    assert sample("/precompressed", "gzip") == before
+
+
+async def test_compressed_formats_pass_through() -> None:
+    async with AsyncClient(
+        transport=ASGITransport(app=compression_app()), base_url="http://test"
+    ) as client:
+        r = await client.get("/export.zip", headers={"Accept-Encoding": "gzip"})
+
+    assert len(r.content) >= settings.COMPRESSION_MIN_BYTES
+    assert "content-encoding" not in r.headers
+    assert zipfile.ZipFile(io.BytesIO(r.content)).read("rows.json")
+
+
+def test_excluded_content_types() -> None:
+    assert excluded_content_type("application/zip")
+    assert excluded_content_type("image/png")
+    assert excluded_content_type("Image/WebP; q=1")
+    assert not excluded_content_type("application/json")
+    assert not excluded_content_type("text/calendar; charset=utf-8")
+
+
+def test_precompressed_bodies_are_reused() -> None:
+    body = json.dumps(rows).encode()
+
+    assert gzip_body(body) is gzip_body(body)
+    assert gzip.decompress(gzip_body(body)) == body
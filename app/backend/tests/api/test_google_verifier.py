@@ -0,0 +1,165 @@
+import json
+import time
+from typing import Any, AsyncIterator, Dict, List
+
+import httpx
+import jwt
+import pytest
+import pytest_asyncio
+from cryptography.hazmat.primitives.asymmetric import rsa
+from redis.asyncio import Redis
+
+from project.core.google import (
+    DEFAULT_MAX_AGE,
+    GOOGLE_ISSUERS,
+    GoogleTokenVerifier,
+    parse_max_age,
+)
+
+CLIENT_ID = "test-client.apps.googleusercontent.com"
+REDIS_KEY = "test:google:jwks"
+
+
+class StandInGoogle:
+    """Serves a JWKS for locally generated keys and counts the fetches."""
+
+    def __init__(self, max_age: int = 600) -> None:
+        self.max_age = max_age
+        self.private_keys: Dict[str, rsa.RSAPrivateKey] = {}
+        self.requests: List[httpx.Request] = []
+        self.add_key("key-1")
+
+    def add_key(self, kid: str) -> None:
+        self.private_keys[kid] = rsa.generate_private_key(
+            public_exponent=65537, key_size=2048
+        )
+
+    def sign(self, kid: str = "key-1", **claims: Any) -> str:
+        payload = {
+            "iss": GOOGLE_ISSUERS[1],
+            "aud": CLIENT_ID,
+            "sub": "1234567890",
+            "email": "someone@example.com",
+            "email_verified": True,
+            "iat": int(time.time()),
+            "exp": int(time.time()) + 300,
+            **claims,
+        }
+        return jwt.encode(
+            payload, self.private_keys[kid], algorithm="RS256", headers={"kid": kid}
+        )
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        keys = []
+        for kid, private_key in self.private_keys.items():
+            jwk = json.loads(
+                jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key())
+            )
+            keys.append({**jwk, "kid": kid, "alg": "RS256", "use": "sig"})
+        return httpx.Response(
+            200,
+            json={"keys": keys},
+            headers={"Cache-Control": f"public, max-age={self.max_age}"},
+        )
+
+    def verifier(self) -> GoogleTokenVerifier:
+        return GoogleTokenVerifier(
+            CLIENT_ID,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(self.handler)),
+            redis_key=REDIS_KEY,
+        )
+
+
+@pytest.fixture
+def google() -> StandInGoogle:
+    return StandInGoogle()
+
+
+@pytest_asyncio.fixture
+async def jwks_redis(test_redis: Redis) -> AsyncIterator[Redis]:
+    await test_redis.delete(REDIS_KEY)
+    yield test_redis
+    await test_redis.delete(REDIS_KEY)
+
+
+def test_parse_max_age() -> None:
+    """Test that max-age is read from Cache-Control, with a fallback."""
+    assert parse_max_age("public, max-age=21496, must-revalidate") == 21496
+    assert parse_max_age("no-cache") == DEFAULT_MAX_AGE
+    assert parse_max_age(None) == DEFAULT_MAX_AGE
+
+
+class TestGoogleTokenVerifier:
+    async def test_valid_token(self, google: StandInGoogle, jwks_redis: Redis) -> None:
+        """Test that a token signed by a published key verifies."""
+        claims = await google.verifier().verify(google.sign(), jwks_redis)
+
+        assert claims["email"] == "someone@example.com"
+        assert claims["sub"] == "1234567890"
+
+    async def test_keys_are_cached_in_process(
+        self, google: StandInGoogle, jwks_redis: Redis
+    ) -> None:
+        """Test that repeated logins do not refetch the key set."""
+        verifier = google.verifier()
+        for _ in range(5):
+            await verifier.verify(google.sign(), jwks_redis)
+
+        assert len(google.requests) == 1
+
+    async def test_keys_are_shared_through_redis(
+        self, google: StandInGoogle, jwks_redis: Redis
+    ) -> None:
+        """Test that a second process picks the key set up from Redis."""
+        await google.verifier().verify(google.sign(), jwks_redis)
+        await google.verifier().verify(google.sign(), jwks_redis)
+
+        assert len(google.requests) == 1
+        ttl = await jwks_redis.ttl(REDIS_KEY)
+        assert 0 < ttl <= google.max_age
+
+    async def test_rotated_key_triggers_refetch(
+        self, google: StandInGoogle, jwks_redis: Redis
+    ) -> None:
+        """Test that a token signed with a new key refreshes the cache once."""
+        verifier = google.verifier()
+        await jwks_redis.set(
+            REDIS_KEY, json.dumps(google.handler(httpx.Request("GET", "/")).json())
+        )
+        await jwks_redis.expire(REDIS_KEY, 600)
+        google.requests.clear()
+
+        await verifier.verify(google.sign(), jwks_redis)
+        assert google.requests == []
+
+        google.add_key("key-2")
+        claims = await verifier.verify(google.sign("key-2"), jwks_redis)
+
+        assert claims["sub"] == "1234567890"
+        assert len(google.requests) == 1
+
+    @pytest.mark.parametrize(
+        "claims",
+        [
+            {"aud": "someone-else"},
+            {"iss": "https://evil.example.com"},
+            {"exp": int(time.time()) - 60},
+        ],
+    )
+    async def test_invalid_claims_are_rejected(
+        self, google: StandInGoogle, jwks_redis: Redis, claims: Dict[str, Any]
+    ) -> None:
+        """Test that audience, issuer and expiry are all enforced."""
+        with pytest.raises(jwt.PyJWTError):
+            await google.verifier().verify(google.sign(**claims), jwks_redis)
+
+    async def test_unknown_key_is_rejected(
+        self, google: StandInGoogle, jwks_redis: Redis
+    ) -> None:
+        """Test that a token signed by an unpublished key fails to verify."""
+        outsider = StandInGoogle()
+        outsider.add_key("key-9")
+
+        with pytest.raises(jwt.PyJWTError):
+            await google.verifier().verify(outsider.sign("key-9"), jwks_redis)
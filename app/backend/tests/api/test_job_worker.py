@@ -0,0 +1,142 @@
+import asyncio
+import time
+import uuid
+from typing import Any, AsyncIterator, Dict
+
+import pytest_asyncio
+from redis.asyncio import Redis
+
+from project.workers.jobs import (
+    FAILED,
+    QUEUE_KEY,
+    QUEUED,
+    SUCCEEDED,
+    WORKERS_KEY,
+    JobContext,
+    JobWorker,
+    enqueue_job,
+    get_job,
+    job_handler,
+)
+
+USER_ID = uuid.uuid4()
+calls: Dict[str, int] = {}
+
+
+@job_handler("tests.echo")
+async def echo(context: JobContext, payload: Dict[str, Any]) -> Dict[str, Any]:
+    await context.progress(1, 1)
+    return payload
+
+
+@job_handler("tests.flaky")
+async def flaky(context: JobContext, payload: Dict[str, Any]) -> None:
+    calls[context.job_id] = calls.get(context.job_id, 0) + 1
+    if calls[context.job_id] < payload["fail_times"] + 1:
+        raise RuntimeError("boom")
+
+
+@pytest_asyncio.fixture
+async def job_redis(test_redis: Redis) -> AsyncIterator[Redis]:
+    await test_redis.delete(QUEUE_KEY, WORKERS_KEY)
+    yield test_redis
+    await test_redis.delete(QUEUE_KEY, WORKERS_KEY)
+
+
+def _worker(worker: JobWorker, **kwargs: Any) -> JobWorker:
+    """A worker like the shared one, with its own processing list."""
+    return JobWorker(
+        worker.redis, worker.session_factory, worker_id="tests-unit", **kwargs
+    )
+
+
+async def test_job_runs_and_records_result(
+    job_redis: Redis, job_worker: JobWorker
+) -> None:
+    job_id, created = await enqueue_job(
+        job_redis, "tests.echo", {"answer": 42}, user_id=USER_ID
+    )
+    assert created
+
+    assert await _worker(job_worker).run_once()
+
+    job = await get_job(job_redis, job_id)
+    assert job is not None
+    assert job["status"] == SUCCEEDED
+    assert job["result"] == '{"answer": 42}'
+    assert job["done"] == job["total"] == "1"
+    assert float(job["run_seconds"]) >= 0
+    assert await job_redis.ttl(f"jobs:job:{job_id}") > 0
+
+
+async def test_idempotency_key_returns_the_first_job(job_redis: Redis) -> None:
+    key = uuid.uuid4().hex
+    first, created = await enqueue_job(
+        job_redis, "tests.echo", {}, user_id=USER_ID, idempotency_key=key
+    )
+    second, created_again = await enqueue_job(
+        job_redis, "tests.echo", {}, user_id=USER_ID, idempotency_key=key
+    )
+
+    assert created and not created_again
+    assert first == second
+    assert await job_redis.llen(QUEUE_KEY) == 1
+
+
+async def test_failed_job_is_retried_then_given_up(
+    job_redis: Redis, job_worker: JobWorker
+) -> None:
+    worker = _worker(job_worker, max_attempts=2)
+    retried, _ = await enqueue_job(
+        job_redis, "tests.flaky", {"fail_times": 1}, user_id=USER_ID
+    )
+    failed, _ = await enqueue_job(
+        job_redis, "tests.flaky", {"fail_times": 5}, user_id=USER_ID
+    )
+
+    while await worker.run_once():
+        pass
+
+    assert (await get_job(job_redis, retried))["status"] == SUCCEEDED
+    job = await get_job(job_redis, failed)
+    assert job["status"] == FAILED
+    assert job["attempts"] == "2"
+    assert "boom" in job["error"]
+
+
+async def test_jobs_of_a_stopped_worker_are_requeued(
+    job_redis: Redis, job_worker: JobWorker
+) -> None:
+    """Test that a job taken by a worker that died is run by another."""
+    job_id, _ = await enqueue_job(job_redis, "tests.echo", {}, user_id=USER_ID)
+    await job_redis.lmove(QUEUE_KEY, "jobs:processing:dead", "LEFT", "RIGHT")
+    await job_redis.hset(WORKERS_KEY, "dead", time.time() - 600)
+
+    assert await _worker(job_worker, worker_timeout=30).requeue_orphans() == 1
+
+    assert await job_redis.lrange(QUEUE_KEY, 0, -1) == [job_id]
+    assert (await get_job(job_redis, job_id))["status"] == QUEUED
+    assert not await job_redis.hexists(WORKERS_KEY, "dead")
+
+
+async def test_restarted_worker_reruns_its_own_jobs(
+    job_redis: Redis, job_worker: JobWorker
+) -> None:
+    """Test that a worker restarted under the same id picks up its old jobs."""
+    job_id, _ = await enqueue_job(job_redis, "tests.echo", {}, user_id=USER_ID)
+    # The previous run took the job and was killed; its beat is still fresh
+    await job_redis.lmove(QUEUE_KEY, "jobs:processing:tests-unit", "LEFT", "RIGHT")
+    await job_redis.hset(WORKERS_KEY, "tests-unit", time.time())
+
+    task = asyncio.create_task(_worker(job_worker).run_forever(poll_interval=0.1))
+    try:
+        for _ in range(50):
+            if (await get_job(job_redis, job_id))["status"] == SUCCEEDED:
+                break
+            await asyncio.sleep(0.1)
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    assert (await get_job(job_redis, job_id))["status"] == SUCCEEDED
+    assert await job_redis.llen("jobs:processing:tests-unit") == 0
@@ -0,0 +1,211 @@
+import socket
+from email import message_from_bytes
+from typing import Any, AsyncIterator, Iterator, List
+
+import pytest
+import pytest_asyncio
+from aiosmtpd.controller import Controller
+from httpx import AsyncClient
+from pydantic import NameEmail
+from redis.asyncio import Redis
+
+from project.core.config import settings
+from project.workers.mail import (
+    DEAD_KEY,
+    QUEUE_KEY,
+    RETRY_KEY,
+    STATS_KEY,
+    WORKERS_KEY,
+    MailWorker,
+    SMTPSettings,
+    enqueue_mail,
+    mail_stats,
+)
+
+
+class SinkHandler:
+    """Collects every message it receives, or rejects them all."""
+
+    def __init__(self, reject: bool = False) -> None:
+        self.reject = reject
+        self.port = _free_port()
+        self.messages: List[Any] = []
+
+    async def handle_DATA(self, server: Any, session: Any, envelope: Any) -> str:
+        if self.reject:
+            return "554 Transaction failed"
+        self.messages.append(envelope)
+        return "250 OK"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def sink() -> Iterator[SinkHandler]:
+    handler = SinkHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=handler.port)
+    controller.start()
+    yield handler
+    controller.stop()
+
+
+@pytest_asyncio.fixture
+async def mail_redis(test_redis: Redis) -> AsyncIterator[Redis]:
+    keys = (
+        QUEUE_KEY,
+        RETRY_KEY,
+        DEAD_KEY,
+        STATS_KEY,
+        WORKERS_KEY,
+        "mail:processing:mail-test",
+    )
+    await test_redis.delete(*keys)
+    yield test_redis
+    await test_redis.delete(*keys)
+
+
+def _worker(redis: Redis, port: int, **kwargs: Any) -> MailWorker:
+    smtp = SMTPSettings(
+        hostname="127.0.0.1",
+        port=port,
+        sender="ClassEase <noreply@classease.test>",
+        start_tls=False,
+    )
+    return MailWorker(redis, smtp, worker_id="mail-test", **kwargs)
+
+
+async def _enqueue(
+    redis: Redis, count: int, template: str = "email/verification.html"
+) -> None:
+    for i in range(count):
+        await enqueue_mail(
+            redis,
+            template=template,
+            subject="Verify your email",
+            recipients=[NameEmail(name=f"User {i}", email=f"user{i}@example.com")],
+            context={
+                "verification_link": f"http://test/verify?token={i}",
+                "app_name": "ClassEase",
+                "user_name": f"User {i}",
+                "expires_in": 24,
+                "year": 2026,
+            },
+        )
+
+
+class TestMailWorker:
+    async def test_batch_is_delivered(
+        self, mail_redis: Redis, sink: SinkHandler
+    ) -> None:
+        """Test that a batch is rendered and delivered over the pooled connections."""
+        await _enqueue(mail_redis, 5)
+        worker = _worker(mail_redis, sink.port, batch_size=10, pool_size=2)
+
+        try:
+            assert await worker.run_once() == 5
+        finally:
+            await worker.close()
+
+        assert len(sink.messages) == 5
+        body = message_from_bytes(sink.messages[0].content).get_payload(decode=True)
+        assert b"http://test/verify?token=" in body
+
+        stats = await mail_stats(mail_redis)
+        assert stats["enqueued"] == stats["sent"] == 5
+        assert stats["queued"] == 0
+
+    async def test_batch_size_is_respected(
+        self, mail_redis: Redis, sink: SinkHandler
+    ) -> None:
+        """Test that a run takes at most one batch off the queue."""
+        await _enqueue(mail_redis, 3)
+        worker = _worker(mail_redis, sink.port, batch_size=2)
+
+        try:
+            assert await worker.run_once() == 2
+            assert await worker.run_once() == 1
+            assert await worker.run_once() == 0
+        finally:
+            await worker.close()
+
+    async def test_rejected_mail_is_retried_then_dead_lettered(
+        self, mail_redis: Redis, sink: SinkHandler
+    ) -> None:
+        """Test that failures back off into the retry set and finally go dead."""
+        sink.reject = True
+        await _enqueue(mail_redis, 1)
+        worker = _worker(mail_redis, sink.port, max_attempts=2, retry_base_seconds=0)
+
+        try:
+            await worker.run_once()
+            assert await mail_redis.zcard(RETRY_KEY) == 1
+
+            # A zero backoff makes the retry due on the next run
+            await worker.run_once()
+        finally:
+            await worker.close()
+
+        stats = await mail_stats(mail_redis)
+        assert stats["retried"] == 1
+        assert stats["dead"] == 1
+        assert stats["retrying"] == 0
+        assert sink.messages == []
+
+    async def test_unrenderable_mail_does_not_sink_the_batch(
+        self, mail_redis: Redis, sink: SinkHandler
+    ) -> None:
+        """Test that a job with a missing template is dead-lettered on its own."""
+        await _enqueue(mail_redis, 1)
+        await _enqueue(mail_redis, 1, template="email/missing.html")
+        await _enqueue(mail_redis, 1)
+        worker = _worker(mail_redis, sink.port, batch_size=10)
+
+        try:
+            assert await worker.run_once() == 3
+        finally:
+            await worker.close()
+
+        assert len(sink.messages) == 2
+        dead = await mail_redis.lrange(DEAD_KEY, 0, -1)
+        assert len(dead) == 1
+        assert "email/missing.html" in dead[0]
+        assert await mail_redis.llen(worker.processing_key) == 0
+
+    async def test_restarted_worker_resends_its_unfinished_mail(
+        self, mail_redis: Redis, sink: SinkHandler
+    ) -> None:
+        """Test that jobs taken before a crash are queued again on restart."""
+        await _enqueue(mail_redis, 2)
+        worker = _worker(mail_redis, sink.port)
+        # Taken off the queue, then the process died before sending
+        for _ in range(2):
+            await mail_redis.lmove(QUEUE_KEY, worker.processing_key, "LEFT", "RIGHT")
+
+        try:
+            assert await worker.requeue_orphans() == 2
+            assert await worker.run_once() == 2
+        finally:
+            await worker.close()
+
+        assert len(sink.messages) == 2
+        assert await mail_redis.llen(worker.processing_key) == 0
+
+
+async def test_password_recovery_enqueues_mail(
+    client: AsyncClient, mail_redis: Redis
+) -> None:
+    """Test that the endpoint queues the reset mail instead of sending it inline."""
+    r = await client.post(
+        f"{settings.API_V1_STR}/auth/password-recovery",
+        json={"email": settings.FIRST_SUPERUSER_EMAIL},
+    )
+    assert r.status_code == 200
+
+    stats = await mail_stats(mail_redis)
+    assert stats["queued"] == 1
+
+    await mail_redis.delete(f"otp:{settings.FIRST_SUPERUSER_EMAIL}")
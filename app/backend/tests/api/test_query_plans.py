@@ -0,0 +1,96 @@
+import uuid
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from sqlalchemy import text
+
+from project.core.db import engine
+from project.schema.models import YearSchema
+
+# The test tables only hold a handful of rows, where a sequential scan is
+# always cheapest. Disabling it makes the planner reveal whether an index
+# can serve the predicate at all.
+ACCESS_PATHS = [
+    (
+        "SELECT * FROM mark_lists "
+        "WHERE student_term_record_id = :a AND subject_id = :b",
+        "ix_mark_lists_student_term_record_id_subject_id",
+    ),
+    (
+        "SELECT * FROM mark_lists WHERE subject_id = :a",
+        "ix_mark_lists_subject_id",
+    ),
+    (
+        "SELECT * FROM student_term_records "
+        "WHERE academic_term_id = :a AND section_id = :b",
+        "ix_student_term_records_academic_term_id_section_id",
+    ),
+    (
+        "SELECT * FROM student_term_records "
+        "WHERE student_id = :a AND academic_term_id = :b",
+        "ix_student_term_records_student_id_academic_term_id",
+    ),
+    (
+        "SELECT * FROM student_year_records WHERE year_id = :a AND grade_id = :b",
+        "ix_student_year_records_year_id_grade_id",
+    ),
+    (
+        "SELECT * FROM assessments WHERE student_term_record_id = :a",
+        "ix_assessments_student_term_record_id",
+    ),
+    (
+        "SELECT * FROM subject_yearly_averages WHERE student_year_record_id = :a",
+        "ix_subject_yearly_averages_student_year_record_id",
+    ),
+    (
+        "SELECT * FROM teacher_records WHERE academic_term_id = :a",
+        "ix_teacher_records_academic_term_id",
+    ),
+    (
+        "SELECT * FROM student_section_links WHERE section_id = :a",
+        "ix_student_section_links_section_id",
+    ),
+    (
+        "SELECT * FROM student_year_links WHERE year_id = :a",
+        "ix_student_year_links_year_id",
+    ),
+    (
+        "SELECT * FROM grades WHERE year_id = :a AND ordinal >= 3 ORDER BY ordinal",
+        "ix_grades_year_id_ordinal",
+    ),
+]
+
+
+def _plan_nodes(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+async def _explain(sql: str) -> List[Dict[str, Any]]:
+    params = {"a": uuid.uuid4(), "b": uuid.uuid4()}
+    params = {k: v for k, v in params.items() if f":{k}" in sql}
+
+    async with engine.connect() as conn:
+        async with conn.begin() as trans:
+            await conn.execute(text("SET LOCAL enable_seqscan = off"))
+            result = await conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"), params)
+            plan = result.scalar_one()
+            await trans.rollback()
+
+    return list(_plan_nodes(plan[0]["Plan"]))
+
+
+class TestQueryPlans:
+    @pytest.mark.parametrize("sql, index_name", ACCESS_PATHS)
+    async def test_access_path_uses_index(
+        self,
+        year: YearSchema,
+        sql: str,
+        index_name: str,
+    ) -> None:
+        """Test that each hot lookup is served by its dedicated index."""
+        nodes = await _explain(sql)
+
+        assert not any(node["Node Type"] == "Seq Scan" for node in nodes)
+        assert index_name in {node.get("Index Name") for node in nodes}
@@ -0,0 +1,71 @@
+from typing import Dict
+
+import pytest
+from httpx import AsyncClient
+
+from project.core.config import settings
+from project.core.query_stats import QueryBudgetExceeded, QueryStats, fingerprint
+from project.schema.models import YearSchema
+
+
+def test_fingerprint_ignores_parameters() -> None:
+    """Test that statements differing only in bound values share a fingerprint."""
+    first = fingerprint("SELECT * FROM grades\n WHERE id = $1 AND ordinal > 3")
+    second = fingerprint("SELECT * FROM grades WHERE id = $7 AND ordinal > 11")
+
+    assert first == second == "SELECT * FROM grades WHERE id = ? AND ordinal > ?"
+
+
+def test_fingerprint_collapses_in_lists() -> None:
+    """Test that IN lists of any length normalise to the same statement."""
+    assert fingerprint("SELECT 1 WHERE id IN ($1, $2)") == fingerprint(
+        "SELECT 1 WHERE id IN ($1, $2, $3, $4)"
+    )
+
+
+def test_repeated_statements() -> None:
+    """Test that only statements at or over the threshold are reported."""
+    stats = QueryStats()
+    for i in range(3):
+        stats.record(f"SELECT * FROM students WHERE id = '{i}'", 0.001)
+    stats.record("SELECT * FROM years", 0.001)
+
+    assert stats.count == 4
+    assert stats.repeated(3) == {"SELECT * FROM students WHERE id = ?": 3}
+
+
+class TestQueryStatsMiddleware:
+    async def test_server_timing_header(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        year: YearSchema,
+    ) -> None:
+        """Test that responses report their query count and DB time."""
+        r = await client.get(
+            f"{settings.API_V1_STR}/grades",
+            params={"yearId": str(year.id)},
+            headers=admin_token_headers,
+        )
+
+        assert r.status_code == 200
+        assert r.headers["Server-Timing"].startswith("db;dur=")
+        assert "queries" in r.headers["Server-Timing"]
+
+    async def test_budget_raise_mode(
+        self,
+        client: AsyncClient,
+        admin_token_headers: Dict[str, str],
+        year: YearSchema,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that raise mode fails a request that goes over its budget."""
+        monkeypatch.setattr(settings, "QUERY_BUDGET_MODE", "raise")
+        monkeypatch.setattr(settings, "QUERY_BUDGET", 0)
+
+        with pytest.raises(QueryBudgetExceeded):
+            await client.get(
+                f"{settings.API_V1_STR}/grades",
+                params={"yearId": str(year.id)},
+                headers=admin_token_headers,
+            )
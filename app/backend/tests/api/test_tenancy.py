@@ -0,0 +1,147 @@
+from typing import AsyncIterator, List, Optional
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from project.api.v1.routers import dependencies
+from project.api.v1.routers.dependencies import SessionDep
+from project.core import db, tenancy
+from project.core.config import settings
+from project.core.db import engine
+from project.core.security import create_access_token
+from project.core.tenancy import (
+    TenantMiddleware,
+    _tenant_from_host,
+    current_tenant,
+    install_search_path,
+    reset_tenant,
+    set_tenant,
+    tenant_key,
+    tenant_schema,
+)
+from project.utils.enum import RoleEnum
+
+
+@pytest.fixture
+def multi_tenant(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "MULTI_TENANT", True)
+    monkeypatch.setattr(settings, "TENANT_BASE_DOMAIN", "classease.app")
+
+
+def tenant_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(TenantMiddleware)  # ty:ignore[invalid-argument-type]
+
+    @app.get("/tenant")
+    async def tenant() -> Optional[str]:
+        return current_tenant()
+
+    @app.get("/notes")
+    async def notes(session: SessionDep) -> List[str]:
+        return list((await session.scalars(text("SELECT body FROM notes"))).all())
+
+    return app
+
+
+@pytest_asyncio.fixture
+async def school_engine(multi_tenant: None) -> AsyncIterator[AsyncEngine]:
+    """Two schools with a note each, served through a tenant-aware engine."""
+    async with engine.begin() as conn:
+        for school in ("alpha", "beta"):
+            schema = tenant_schema(school)
+            await conn.execute(text(f"CREATE SCHEMA {schema}"))
+            await conn.execute(text(f"CREATE TABLE {schema}.notes (body text)"))
+            await conn.execute(
+                text(f"INSERT INTO {schema}.notes VALUES ('{school} note')")
+            )
+
+    # A single connection, so every request reuses another school's one
+    school_engine = create_async_engine(
+        str(settings.SQLALCHEMY_POSTGRES_DATABASE_URI),
+        pool_size=1,
+        max_overflow=0,
+        connect_args={"prepared_statement_cache_size": 0, "statement_cache_size": 0},
+    )
+    install_search_path(school_engine.sync_engine)
+    tenancy._tenants_loaded_at = 0.0
+    yield school_engine
+
+    await school_engine.dispose()
+    tenancy._tenants_loaded_at = 0.0
+    async with engine.begin() as conn:
+        for school in ("alpha", "beta"):
+            await conn.execute(text(f"DROP SCHEMA {tenant_schema(school)} CASCADE"))
+
+
+def test_keys_are_prefixed_with_the_current_school() -> None:
+    assert tenant_key("otp:a@b.c") == "otp:a@b.c"
+
+    token = set_tenant("acme")
+    try:
+        assert tenant_key("otp:a@b.c") == "t:acme:otp:a@b.c"
+    finally:
+        reset_tenant(token)
+
+
+def test_schema_names_reject_unsafe_slugs() -> None:
+    assert tenant_schema("acme_high") == "school_acme_high"
+    with pytest.raises(ValueError):
+        tenant_schema('acme"; DROP SCHEMA public; --')
+
+
+@pytest.mark.usefixtures("multi_tenant")
+def test_tenant_from_subdomain() -> None:
+    assert _tenant_from_host("acme.classease.app:443") == "acme"
+    assert _tenant_from_host("ACME.classease.app") == "acme"
+    assert _tenant_from_host("classease.app") is None
+    assert _tenant_from_host("a.b.classease.app") is None
+    assert _tenant_from_host("acme.example.com") is None
+
+
+@pytest.mark.usefixtures("multi_tenant")
+async def test_middleware_resolves_the_school() -> None:
+    async with AsyncClient(
+        transport=ASGITransport(app=tenant_app()), base_url="http://classease.app"
+    ) as client:
+        by_host = await client.get("/tenant", headers={"Host": "acme.classease.app"})
+        assert by_host.json() == "acme"
+
+        token = create_access_token(
+            subject="user", role=RoleEnum.ADMIN, tenant="globex"
+        )
+        by_token = await client.get(
+            "/tenant", headers={"Authorization": f"Bearer {token}"}
+        )
+        assert by_token.json() == "globex"
+
+        invalid = await client.get(
+            "/tenant", headers={"Host": "bad-slug.classease.app"}
+        )
+        assert invalid.status_code == 404
+
+        neither = await client.get("/tenant")
+        assert neither.json() is None
+
+    assert current_tenant() is None
+
+
+async def test_schools_only_read_their_own_rows(
+    school_engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Sessions route every statement to project.core.db.engine
+    monkeypatch.setattr(db, "engine", school_engine)
+    monkeypatch.setattr(dependencies, "engine", school_engine)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=tenant_app()), base_url="http://classease.app"
+    ) as client:
+        for school in ("alpha", "beta", "alpha"):
+            r = await client.get("/notes", headers={"Host": f"{school}.classease.app"})
+            assert r.json() == [f"{school} note"]
+
+        unknown = await client.get("/notes", headers={"Host": "gamma.classease.app"})
+        assert unknown.status_code == 404
@@ -0,0 +1,106 @@
+import os
+import uuid
+from collections.abc import AsyncGenerator, Generator
+from dataclasses import asdict
+from typing import Dict
+
+import asyncpg
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from project.core.config import settings
+from project.core.db import engine, init_db
+from project.main import app
+from project.models.base.base_model import Base
+from tests.benchmarks.harness import BenchmarkReport, report_path
+from tests.factories.school_generator import SchoolSpec, asyncpg_dsn, load_school
+from tests.utils.utils import get_auth_header
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Benchmarks seed millions of rows, so they only run when asked for."""
+    if os.getenv("RUN_BENCHMARKS"):
+        return
+    skip = pytest.mark.skip(reason="set RUN_BENCHMARKS=1 to run benchmarks")
+    for item in items:
+        if "benchmarks" in item.nodeid:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def spec() -> SchoolSpec:
+    """School size, overridable through BENCH_* environment variables."""
+    return SchoolSpec(
+        seed=int(os.getenv("BENCH_SEED", SchoolSpec.seed)),
+        students=int(os.getenv("BENCH_STUDENTS", SchoolSpec.students)),
+        sections_per_grade=int(
+            os.getenv("BENCH_SECTIONS_PER_GRADE", SchoolSpec.sections_per_grade)
+        ),
+        teachers=int(os.getenv("BENCH_TEACHERS", SchoolSpec.teachers)),
+    )
+
+
+@pytest.fixture(scope="session")
+def concurrency() -> int:
+    return int(os.getenv("BENCH_CONCURRENCY", "16"))
+
+
+@pytest.fixture(scope="session")
+def requests_per_endpoint() -> int:
+    return int(os.getenv("BENCH_REQUESTS", "200"))
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def bench_db() -> AsyncGenerator[None, None]:
+    """Create the schema for the run and drop it afterwards."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(engine, class_=AsyncSession)() as session:
+        await init_db(session)
+
+    yield
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def bench_client(bench_db: None) -> AsyncGenerator[AsyncClient, None]:
+    """Client wired to the real session and Redis dependencies."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://bench", timeout=None
+    ) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def bench_admin_headers(bench_client: AsyncClient) -> Dict[str, str]:
+    login_data = {
+        "username": settings.FIRST_SUPERUSER,
+        "password": settings.FIRST_SUPERUSER_PASSWORD.get_secret_value(),
+    }
+    return await get_auth_header(bench_client, login_data)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def school(bench_db: None, spec: SchoolSpec) -> uuid.UUID:
+    """Generate the school and COPY it in; returns the seeded year's id."""
+    conn = await asyncpg.connect(asyncpg_dsn())
+    try:
+        generator = await load_school(conn, spec)
+    finally:
+        await conn.close()
+
+    return generator.year_id
+
+
+@pytest.fixture(scope="session")
+def report(spec: SchoolSpec) -> Generator[BenchmarkReport, None, None]:
+    report = BenchmarkReport(report_path(), asdict(spec))
+    yield report
+    report.write()
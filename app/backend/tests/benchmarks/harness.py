@@ -0,0 +1,235 @@
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict
+
+import httpx
+
+RequestFactory = Callable[[int], Awaitable[httpx.Response]]
+
+
+@dataclass
+class LoadResult:
+    """Latency distribution and throughput of one benchmarked endpoint."""
+
+    name: str
+    requests: int
+    concurrency: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    throughput_rps: float
+
+
+@dataclass
+class ThroughputResult:
+    """Work items completed per second, normalised by the cores doing the work."""
+
+    name: str
+    items: int
+    workers: int
+    seconds: float
+    items_per_second: float
+    items_per_second_per_core: float
+
+
+def measure_throughput(
+    name: str, items: int, workers: int, seconds: float
+) -> ThroughputResult:
+    rate = items / seconds
+    return ThroughputResult(
+        name=name,
+        items=items,
+        workers=workers,
+        seconds=round(seconds, 3),
+        items_per_second=round(rate, 2),
+        items_per_second_per_core=round(rate / workers, 2),
+    )
+
+
+@dataclass
+class StartupResult:
+    """How long a fresh worker takes to import the app and answer a request."""
+
+    import_seconds: float
+    first_request_seconds: float
+    # Import time spent in each top-level package, slowest first
+    slowest_packages_ms: Dict[str, float]
+
+
+# Run in a fresh interpreter, so nothing is imported or cached already.
+# The first request is for the OpenAPI schema, which needs no database.
+_STARTUP_SCRIPT = """
+import asyncio, json, time
+from httpx import ASGITransport, AsyncClient
+
+started = time.perf_counter()
+from project.main import app
+imported = time.perf_counter()
+
+async def first_request():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://startup") as client:
+        return (await client.get(app.openapi_url)).status_code
+
+status = asyncio.run(first_request())
+print(json.dumps({
+    "status": status,
+    "import_seconds": imported - started,
+    "first_request_seconds": time.perf_counter() - started,
+}))
+"""
+
+
+def measure_startup(env: Dict[str, str] | None = None, top: int = 15) -> StartupResult:
+    """
+    Start the app in a new interpreter under ``-X importtime`` and return
+    its time to first request along with where the import time went.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _STARTUP_SCRIPT],
+        capture_output=True,
+        check=True,
+        text=True,
+        env={**os.environ, **(env or {})},
+    )
+    timings = json.loads(process.stdout.strip().splitlines()[-1])
+    assert timings["status"] == 200
+
+    # Lines look like "import time:  self [us] | cumulative | module"
+    packages: Dict[str, int] = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, _, module = line[len("import time:") :].split("|")
+        package = module.strip().split(".")[0]
+        packages[package] = packages.get(package, 0) + int(self_us)
+
+    slowest = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+    return StartupResult(
+        import_seconds=round(timings["import_seconds"], 3),
+        first_request_seconds=round(timings["first_request_seconds"], 3),
+        slowest_packages_ms={name: round(us / 1000, 1) for name, us in slowest[:top]},
+    )
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def run_load(
+    name: str,
+    send: RequestFactory,
+    *,
+    requests: int,
+    concurrency: int,
+    expected_status: int = 200,
+) -> LoadResult:
+    """
+    Issue `requests` calls through `send` with at most `concurrency` in flight.
+
+    `send` receives the request number, so callers can vary payloads (e.g.
+    unique year names) without sharing state between workers.
+    """
+    latencies: list[float] = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for i in counter:
+            started = time.perf_counter()
+            response = await send(i)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != expected_status:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    ms = [latency * 1000 for latency in latencies]
+    return LoadResult(
+        name=name,
+        requests=requests,
+        concurrency=concurrency,
+        errors=errors,
+        p50_ms=round(_percentile(ms, 50), 2),
+        p95_ms=round(_percentile(ms, 95), 2),
+        p99_ms=round(_percentile(ms, 99), 2),
+        mean_ms=round(statistics.fmean(ms), 2),
+        throughput_rps=round(requests / elapsed, 2),
+    )
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+class BenchmarkReport:
+    """Collects results for a run and writes them as one JSON document."""
+
+    def __init__(self, path: Path, scale: Dict[str, int]) -> None:
+        self.path = path
+        self.scale = scale
+        self.results: list[LoadResult] = []
+        self.throughput: list[ThroughputResult] = []
+        self.startup: StartupResult | None = None
+
+    def add(self, result: LoadResult) -> None:
+        self.results.append(result)
+        print(
+            f"{result.name}: p50={result.p50_ms}ms p95={result.p95_ms}ms "
+            f"p99={result.p99_ms}ms {result.throughput_rps} req/s"
+        )
+
+    def add_throughput(self, result: ThroughputResult) -> None:
+        self.throughput.append(result)
+        print(
+            f"{result.name}: {result.items_per_second}/s over {result.workers} "
+            f"workers, {result.items_per_second_per_core}/s per core"
+        )
+
+    def add_startup(self, result: StartupResult) -> None:
+        self.startup = result
+        print(
+            f"startup: import={result.import_seconds}s "
+            f"first request={result.first_request_seconds}s"
+        )
+        for package, ms in result.slowest_packages_ms.items():
+            print(f"  {package}: {ms}ms")
+
+    def write(self) -> None:
+        document: Dict[str, Any] = {
+            "commit": _git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "scale": self.scale,
+            "results": [asdict(result) for result in self.results],
+            "throughput": [asdict(result) for result in self.throughput],
+            "startup": asdict(self.startup) if self.startup else None,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(document, indent=2))
+
+
+def report_path() -> Path:
+    return Path(os.getenv("BENCHMARK_OUTPUT", "benchmark-results.json"))
@@ -0,0 +1,174 @@
+import uuid
+from typing import Dict
+
+import httpx
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from project.core.config import settings
+from project.core.db import engine
+from project.models import AcademicTerm
+from project.utils.enum import AcademicTermTypeEnum
+from tests.benchmarks.harness import BenchmarkReport, run_load
+from tests.factories.api_data import NewYearFactory
+
+
+class TestHotEndpoints:
+    async def test_login(
+        self,
+        bench_client: AsyncClient,
+        school: uuid.UUID,
+        report: BenchmarkReport,
+        concurrency: int,
+        requests_per_endpoint: int,
+    ) -> None:
+        login_data = {
+            "username": settings.FIRST_SUPERUSER,
+            "password": settings.FIRST_SUPERUSER_PASSWORD.get_secret_value(),
+        }
+
+        async def send(_: int) -> httpx.Response:
+            return await bench_client.post(
+                f"{settings.API_V1_STR}/auth/login", data=login_data
+            )
+
+        result = await run_load(
+            "login", send, requests=requests_per_endpoint, concurrency=concurrency
+        )
+        report.add(result)
+        assert result.errors == 0
+
+    async def test_me(
+        self,
+        bench_client: AsyncClient,
+        bench_admin_headers: Dict[str, str],
+        school: uuid.UUID,
+        report: BenchmarkReport,
+        concurrency: int,
+        requests_per_endpoint: int,
+    ) -> None:
+        async def send(_: int) -> httpx.Response:
+            return await bench_client.get(
+                f"{settings.API_V1_STR}/me", headers=bench_admin_headers
+            )
+
+        result = await run_load(
+            "me", send, requests=requests_per_endpoint, concurrency=concurrency
+        )
+        report.add(result)
+        assert result.errors == 0
+
+    async def test_students(
+        self,
+        bench_client: AsyncClient,
+        bench_admin_headers: Dict[str, str],
+        school: uuid.UUID,
+        report: BenchmarkReport,
+        concurrency: int,
+        requests_per_endpoint: int,
+    ) -> None:
+        async def send(_: int) -> httpx.Response:
+            return await bench_client.get(
+                f"{settings.API_V1_STR}/students",
+                params={"yearId": str(school)},
+                headers=bench_admin_headers,
+            )
+
+        result = await run_load(
+            "students", send, requests=requests_per_endpoint, concurrency=concurrency
+        )
+        report.add(result)
+        assert result.errors == 0
+
+    async def test_grades_setup(
+        self,
+        bench_client: AsyncClient,
+        bench_admin_headers: Dict[str, str],
+        school: uuid.UUID,
+        report: BenchmarkReport,
+        concurrency: int,
+        requests_per_endpoint: int,
+    ) -> None:
+        async def send(_: int) -> httpx.Response:
+            return await bench_client.get(
+                f"{settings.API_V1_STR}/grades/setup",
+                params={"yearId": str(school)},
+                headers=bench_admin_headers,
+            )
+
+        result = await run_load(
+            "grades_setup",
+            send,
+            requests=requests_per_endpoint,
+            concurrency=concurrency,
+        )
+        report.add(result)
+        assert result.errors == 0
+
+    async def test_teachers(
+        self,
+        bench_client: AsyncClient,
+        bench_admin_headers: Dict[str, str],
+        school: uuid.UUID,
+        report: BenchmarkReport,
+        concurrency: int,
+        requests_per_endpoint: int,
+    ) -> None:
+        async with async_sessionmaker(engine, class_=AsyncSession)() as session:
+            term_id = (
+                (
+                    await session.execute(
+                        select(AcademicTerm.id).where(AcademicTerm.year_id == school)
+                    )
+                )
+                .scalars()
+                .first()
+            )
+
+        async def send(_: int) -> httpx.Response:
+            return await bench_client.get(
+                f"{settings.API_V1_STR}/teachers",
+                params={"yearId": str(school), "academicTermId": str(term_id)},
+                headers=bench_admin_headers,
+            )
+
+        result = await run_load(
+            "teachers", send, requests=requests_per_endpoint, concurrency=concurrency
+        )
+        report.add(result)
+        assert result.errors == 0
+
+    async def test_year_creation(
+        self,
+        bench_client: AsyncClient,
+        bench_admin_headers: Dict[str, str],
+        school: uuid.UUID,
+        report: BenchmarkReport,
+        concurrency: int,
+        requests_per_endpoint: int,
+    ) -> None:
+        run_id = uuid.uuid4().hex[:8]
+
+        async def send(i: int) -> httpx.Response:
+            data = NewYearFactory.create(
+                name=f"bench-{run_id}-{i}",
+                setup_methods="Default Template",
+                calendar_type=AcademicTermTypeEnum.SEMESTER,
+            )
+            return await bench_client.post(
+                f"{settings.API_V1_STR}/years",
+                json=data.model_dump(mode="json", by_alias=True),
+                headers=bench_admin_headers,
+            )
+
+        # Each request queues a whole year template, so run fewer of them
+        result = await run_load(
+            "year_creation",
+            send,
+            requests=max(1, requests_per_endpoint // 10),
+            concurrency=concurrency,
+            expected_status=202,
+        )
+        report.add(result)
+        assert result.errors == 0
@@ -0,0 +1,104 @@
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from project.api.v1.routers.report_cards.schema import ReportCardParams
+from project.api.v1.routers.report_cards.service import (
+    load_report_cards,
+    render_cards,
+)
+from project.core.config import settings
+from project.core.db import engine
+from project.core.executors import get_process_pool
+from project.models import AcademicTerm
+from project.utils.report_card import ReportCard, render_card
+from tests.benchmarks.harness import BenchmarkReport, measure_throughput
+
+
+@pytest.fixture
+def card_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Start every benchmark from an empty card cache."""
+    monkeypatch.setattr(settings, "REPORT_CARD_CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+async def _first_term(school: uuid.UUID) -> uuid.UUID:
+    async with async_sessionmaker(engine, class_=AsyncSession)() as session:
+        term_id = (
+            await session.execute(
+                select(AcademicTerm.id)
+                .where(AcademicTerm.year_id == school)
+                .order_by(AcademicTerm.name)
+            )
+        ).scalar_one_or_none()
+    assert term_id is not None
+    return term_id
+
+
+async def _term_cards(school: uuid.UUID) -> List[ReportCard]:
+    params = ReportCardParams(term_id=await _first_term(school))
+    async with async_sessionmaker(engine, class_=AsyncSession)() as session:
+        return await load_report_cards(session, params)
+
+
+def _workers() -> int:
+    return settings.PROCESS_POOL_WORKERS or os.cpu_count() or 1
+
+
+class TestReportCards:
+    async def test_render_throughput(
+        self,
+        school: uuid.UUID,
+        report: BenchmarkReport,
+        card_cache: Path,
+    ) -> None:
+        """Cards per second per core, cold cache then warm cache."""
+        cards = await _term_cards(school)
+        assert cards
+
+        # Spawning the pool is a one-off cost, keep it out of the numbers
+        get_process_pool().submit(render_card, cards[0], "pdf").result()
+
+        for name in ("report_cards_cold", "report_cards_cached"):
+            started = time.perf_counter()
+            rendered = 0
+            async for _, data in render_cards(cards, "pdf"):
+                rendered += bool(data)
+            elapsed = time.perf_counter() - started
+
+            assert rendered == len(cards)
+            report.add_throughput(
+                measure_throughput(name, len(cards), _workers(), elapsed)
+            )
+
+    async def test_zip_download(
+        self,
+        bench_client: AsyncClient,
+        bench_admin_headers: Dict[str, str],
+        school: uuid.UUID,
+        report: BenchmarkReport,
+        card_cache: Path,
+    ) -> None:
+        """End to end: query, render and stream one term as a zip."""
+        term_id = await _first_term(school)
+
+        started = time.perf_counter()
+        r = await bench_client.get(
+            f"{settings.API_V1_STR}/report-cards",
+            params={"termId": str(term_id)},
+            headers=bench_admin_headers,
+        )
+        elapsed = time.perf_counter() - started
+
+        assert r.status_code == 200
+        cards = int(r.headers["x-report-card-count"])
+        report.add_throughput(
+            measure_throughput("report_cards_zip", cards, _workers(), elapsed)
+        )
@@ -0,0 +1,18 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from tests.benchmarks.harness import BenchmarkReport, measure_startup
+
+
+def test_time_to_first_request(report: BenchmarkReport, tmp_path: Path) -> None:
+    """A new worker, set up as in the image, answers within the target."""
+    schema = tmp_path / "openapi.json"
+    subprocess.run([sys.executable, "-m", "project.openapi", str(schema)], check=True)
+
+    result = measure_startup({"OPENAPI_SCHEMA_FILE": str(schema)})
+    report.add_startup(result)
+
+    target = float(os.getenv("BENCH_STARTUP_TARGET_SECONDS", "1.5"))
+    assert result.first_request_seconds <= target